@@ -0,0 +1 @@
+"""Benchmarks for the st_yled styling hot path."""
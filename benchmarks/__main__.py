@@ -0,0 +1,69 @@
+"""Run the st_yled benchmark suite and write machine-readable JSON results.
+
+Usage:
+    python -m benchmarks [--calls N] [--elements button text ...] [--output FILE]
+"""
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+import streamlit  # noqa: E402
+
+import st_yled  # noqa: E402
+from benchmarks import bench_caller_lookup, bench_import, bench_styling  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run st_yled benchmarks.")
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--elements", nargs="*", default=None)
+    parser.add_argument(
+        "--skip-script-run",
+        action="store_true",
+        help="Skip benchmarks that need a real Streamlit script run (AppTest).",
+    )
+    parser.add_argument(
+        "--skip-import",
+        action="store_true",
+        help="Skip cold-start import benchmarks (run in subprocesses).",
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    report = {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "st_yled": st_yled.__version__,
+            "streamlit": streamlit.__version__,
+            "calls": args.calls,
+        },
+        "results": bench_styling.run(args.calls, args.elements),
+    }
+
+    if not args.skip_script_run:
+        caller_lookup = bench_caller_lookup.run(args.calls)
+        report["results"]["extract_caller_path_hash_script_run"] = {
+            name: round(sec * 1e6, 3) for name, sec in caller_lookup.items()
+        }
+
+    if not args.skip_import:
+        report["results"]["import"] = bench_import.run()
+
+    output = json.dumps(report, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark caller identification in styler.extract_caller_path_hash.
+
+Compares the previous traceback.extract_stack() based lookup with the current
+frame walk. Both run inside a real Streamlit script run (via AppTest), so the
+stack has the same depth as in an app.
+
+Usage:
+    python -m benchmarks.bench_caller_lookup [--calls N]
+"""
+
+import argparse
+import json
+import sys
+import traceback
+import warnings
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+SCRIPT = """
+import time
+
+import streamlit as st
+
+from benchmarks.bench_caller_lookup import legacy_extract_caller_path_hash
+from st_yled import styler
+
+calls = st.session_state["calls"]
+results = {}
+for name, func in [
+    ("traceback", legacy_extract_caller_path_hash),
+    ("frame_walk", styler.extract_caller_path_hash),
+]:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    results[name] = (time.perf_counter() - start) / calls
+
+st.session_state["results"] = results
+"""
+
+
+def legacy_extract_caller_path_hash() -> str:
+    """Caller lookup as implemented before the frame walk (for comparison)."""
+    traceback_stack = traceback.extract_stack()
+
+    exec_line = False
+    caller_path = ""
+    for line in traceback_stack[::-1]:
+        if exec_line:
+            caller_path = line.filename
+            break
+        if isinstance(line.line, str) and line.line.startswith(
+            "exec(code, module.__dict__)"
+        ):
+            exec_line = True
+
+    if caller_path == "":
+        warnings.warn("Could not extract caller path from traceback.")
+
+    return str(hash(caller_path))
+
+
+def run(calls: int = 10000) -> dict[str, float]:
+    """Run the benchmark and return the mean seconds per call of each lookup."""
+    app = AppTest.from_string(SCRIPT, default_timeout=600)
+    app.session_state["calls"] = calls
+    app.run()
+
+    if app.exception:
+        msg = f"Benchmark script failed: {app.exception[0].message}"
+        raise RuntimeError(msg)
+
+    return dict(app.session_state["results"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=10000)
+    args = parser.parse_args()
+
+    results = run(args.calls)
+    results_us = {name: round(sec * 1e6, 3) for name, sec in results.items()}
+    results_us["speedup"] = round(results["traceback"] / results["frame_walk"], 1)
+    print(json.dumps({"extract_caller_path_hash_us_per_call": results_us}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
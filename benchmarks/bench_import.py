@@ -0,0 +1,68 @@
+"""Benchmark cold-start import cost of st_yled.
+
+Each measurement runs the statement in a fresh interpreter and reports its
+wall time in microseconds (median over several processes).
+
+Usage:
+    python -m benchmarks.bench_import [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+STATEMENTS = (
+    "import st_yled",
+    "import st_yled; st_yled.button",
+    "import st_yled.styler; st_yled.styler.load_element_styles()",
+)
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(round((time.perf_counter() - start) * 1e6))
+"""
+
+
+def import_time_us(statement: str) -> int:
+    """Run statement in a fresh interpreter and return its wall time in us."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", TIMER.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return int(proc.stdout.strip().splitlines()[-1])
+
+
+def run(repeat: int = 5) -> dict[str, dict[str, float]]:
+    """Measure every statement and return median and min wall time in us."""
+    results = {}
+    for statement in STATEMENTS:
+        times = [import_time_us(statement) for _ in range(repeat)]
+        results[statement] = {
+            "median_us": statistics.median(times),
+            "min_us": min(times),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Microbenchmarks for the st_yled styling hot path.
+
+Every benchmark is swept across all elements in element_styles.json and runs
+against a mocked Streamlit backend (see benchmarks/mock_streamlit.py).
+"""
+
+import time
+import warnings
+from collections.abc import Callable
+from typing import Any
+
+from st_yled import styler
+from st_yled.batch_validation import validate_property_values
+from st_yled.validation import validate_styling_kwargs
+
+from benchmarks.mock_streamlit import mocked_streamlit
+
+# Valid sample value per styling property
+SAMPLE_VALUES = {
+    "color": "#FF0000",
+    "background_color": "#00FF00",
+    "border_color": "#0000FF",
+    "font_size": "14px",
+    "border_style": "solid",
+    "border_width": "1px",
+}
+
+
+def get_styling_kwargs(element: str) -> dict[str, Any]:
+    """Get kwargs setting every styling property of element to a sample value."""
+    properties = styler.get_element_style(element)["css"]
+    return {prop: SAMPLE_VALUES.get(prop, "inherit") for prop in properties}
+
+
+def measure(func: Callable[[], Any], calls: int, repeat: int = 3) -> dict[str, float]:
+    """
+    Time func and return per-call statistics.
+
+    The fastest of `repeat` rounds of `calls` calls is reported, which is the
+    least disturbed by other processes.
+    """
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        rounds.append((time.perf_counter() - start) / calls)
+
+    best = min(rounds)
+    return {
+        "calls": calls,
+        "mean_us": round(best * 1e6, 3),
+        "ops_per_sec": round(1 / best) if best else 0.0,
+    }
+
+
+def bench_apply_component_css(element: str, calls: int) -> dict[str, float]:
+    kwargs = get_styling_kwargs(element)
+    with mocked_streamlit():
+        return measure(lambda: styler.apply_component_css(element, dict(kwargs)), calls)
+
+
+def bench_apply_component_css_global(element: str, calls: int) -> dict[str, float]:
+    kwargs = get_styling_kwargs(element)
+    with mocked_streamlit():
+        return measure(
+            lambda: styler.apply_component_css_global(element, dict(kwargs)), calls
+        )
+
+
+def bench_validate_styling_kwargs(element: str, calls: int) -> dict[str, float]:
+    kwargs = get_styling_kwargs(element)
+    return measure(lambda: validate_styling_kwargs(element, kwargs), calls)
+
+
+def bench_generate_component_key(calls: int) -> dict[str, float]:
+    with mocked_streamlit():
+        return measure(styler.generate_component_key, calls)
+
+
+def bench_extract_caller_path_hash(calls: int) -> dict[str, float]:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return measure(styler.extract_caller_path_hash, calls)
+
+
+def bench_get_stylable_elements(calls: int) -> dict[str, float]:
+    return measure(lambda: styler.get_stylable_elements(include_variants=False), calls)
+
+
+def bench_get_stylable_elements_by_category(calls: int) -> dict[str, float]:
+    return measure(styler.get_stylable_elements_by_category, calls)
+
+
+def bench_get_element_variants(calls: int) -> dict[str, float]:
+    return measure(lambda: styler.get_element_variants("button"), calls)
+
+
+def bench_validate_property_values(calls: int, size: int = 1000) -> dict[str, float]:
+    """Validate a batch of `size` colors per call."""
+    colors = ["#FF0000", "red", "rgb(0, 128, 255)", "nope"] * (size // 4)
+    result = measure(lambda: validate_property_values("color", colors), calls)
+    return {**result, "values_per_call": len(colors)}
+
+
+# Benchmarks swept across all elements
+ELEMENT_BENCHMARKS = {
+    "apply_component_css": bench_apply_component_css,
+    "apply_component_css_global": bench_apply_component_css_global,
+    "validate_styling_kwargs": bench_validate_styling_kwargs,
+}
+
+# Benchmarks independent of the element type
+GLOBAL_BENCHMARKS = {
+    "generate_component_key": bench_generate_component_key,
+    "extract_caller_path_hash": bench_extract_caller_path_hash,
+    "get_stylable_elements": bench_get_stylable_elements,
+    "get_stylable_elements_by_category": bench_get_stylable_elements_by_category,
+    "get_element_variants": bench_get_element_variants,
+    "validate_property_values": bench_validate_property_values,
+}
+
+
+def run(calls: int = 1000, elements: list[str] | None = None) -> dict[str, Any]:
+    """
+    Run all styling benchmarks.
+
+    Args:
+        calls: Number of calls per measurement round
+        elements: Elements to sweep, defaults to all stylable elements
+
+    Returns:
+        Results per benchmark; element benchmarks contain one entry per element
+        and a summary over all elements.
+    """
+    if elements is None:
+        elements = styler.get_stylable_elements()
+
+    results: dict[str, Any] = {}
+    for name, bench in ELEMENT_BENCHMARKS.items():
+        per_element = {element: bench(element, calls) for element in elements}
+        means = [result["mean_us"] for result in per_element.values()]
+        results[name] = {
+            "elements": per_element,
+            "summary": {
+                "mean_us": round(sum(means) / len(means), 3),
+                "max_us": max(means),
+                "min_us": min(means),
+            },
+        }
+
+    for name, bench in GLOBAL_BENCHMARKS.items():
+        results[name] = bench(calls)
+
+    return results
@@ -0,0 +1,53 @@
+"""Mocked Streamlit backend for running st_yled without a script run."""
+
+import contextlib
+import warnings
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+
+class MockDeltaGenerator:
+    """Stand-in for the DeltaGenerator returned by st.empty() and st.container()."""
+
+    def __init__(self, backend: "MockStreamlit") -> None:
+        self._backend = backend
+
+    def html(self, content: str) -> None:
+        self._backend.html(content)
+
+
+class MockStreamlit:
+    """Minimal Streamlit stand-in recording st.html payloads."""
+
+    def __init__(self) -> None:
+        self.session_state: dict[str, Any] = {}
+        self.html_calls = 0
+        self.html_bytes = 0
+
+    def html(self, content: str) -> None:
+        self.html_calls += 1
+        self.html_bytes += len(content)
+
+    def empty(self) -> MockDeltaGenerator:
+        return MockDeltaGenerator(self)
+
+    def container(self, *args: Any, **kwargs: Any) -> MockDeltaGenerator:
+        return MockDeltaGenerator(self)
+
+
+@contextlib.contextmanager
+def mocked_streamlit() -> Iterator[MockStreamlit]:
+    """Patch st_yled to use a MockStreamlit with an initialized run state."""
+    from st_yled import styler
+
+    mock_st = MockStreamlit()
+    with patch.object(styler, "st", mock_st), warnings.catch_warnings():
+        # Outside of a script run the caller path cannot be resolved
+        warnings.simplefilter("ignore")
+        token = styler.RUN_STATE.set(None)
+        styler.start_run_state(styler.extract_caller_path_hash())
+        try:
+            yield mock_st
+        finally:
+            styler.RUN_STATE.reset(token)
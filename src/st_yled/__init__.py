@@ -1,50 +1,162 @@
-"""st_yled - Advanced styling and custom components for Streamlit applications."""
+"""st_yled - Advanced styling and custom components for Streamlit applications.
 
-from pathlib import Path
-from typing import Optional
+Submodules are loaded lazily (PEP 562): `import st_yled` does not import
+Streamlit or parse the element style table until an attribute is used.
+"""
 
-import streamlit as st
-
-from st_yled import styler  # type: ignore
-from st_yled.elements import *  # type: ignore # noqa: F403
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
 
+# Public functions of st_yled.core, all other attributes come from st_yled.elements
+_CORE_ATTRS = ("init", "set", "theme", "configure", "stats", "flush")
+
+# Element wrappers of st_yled.elements, kept in sync by tests/test_init.py
+_ELEMENT_ATTRS = (
+    "write",
+    "write_stream",
+    "markdown",
+    "title",
+    "header",
+    "subheader",
+    "badge",
+    "caption",
+    "code",
+    "latex",
+    "text",
+    "divider",
+    "html",
+    "dataframe",
+    "data_editor",
+    "table",
+    "metric",
+    "json",
+    "area_chart",
+    "bar_chart",
+    "line_chart",
+    "scatter_chart",
+    "map",
+    "pyplot",
+    "altair_chart",
+    "vega_lite_chart",
+    "plotly_chart",
+    "bokeh_chart",
+    "pydeck_chart",
+    "graphviz_chart",
+    "button",
+    "download_button",
+    "link_button",
+    "page_link",
+    "checkbox",
+    "color_picker",
+    "feedback",
+    "multiselect",
+    "pills",
+    "radio",
+    "segmented_control",
+    "selectbox",
+    "select_slider",
+    "toggle",
+    "number_input",
+    "slider",
+    "date_input",
+    "time_input",
+    "text_area",
+    "text_input",
+    "chat_input",
+    "audio_input",
+    "file_uploader",
+    "camera_input",
+    "image",
+    "logo",
+    "pdf",
+    "audio",
+    "video",
+    "columns",
+    "container",
+    "empty",
+    "expander",
+    "popover",
+    "tabs",
+    "chat_message",
+    "progress",
+    "spinner",
+    "status",
+    "toast",
+    "balloons",
+    "snow",
+    "success",
+    "info",
+    "warning",
+    "error",
+    "exception",
+    "dialog",
+    "form",
+    "form_submit_button",
+    "rerun",
+    "stop",
+    "navigation",
+    "switch_page",
+    "set_page_config",
+    "get_option",
+    "set_option",
+    "help",
+    "echo",
+)
+
+# Names exported by `from st_yled import *`, resolved through __getattr__
+__all__ = [*_CORE_ATTRS, *_ELEMENT_ATTRS]  # noqa: PLE0604
 
-def init(css_path: Optional[str] = None) -> None:
-    """Initialize st_yled with CSS styling."""
+_SUBMODULES = (
+    "batch_validation",
+    "cache",
+    "cli",
+    "compiler",
+    "core",
+    "css",
+    "elements",
+    "style_index",
+    "styler",
+    "validation",
+)
 
-    caller_hash = styler.extract_caller_path_hash()
+if TYPE_CHECKING:
+    from st_yled.core import (  # noqa: F401
+        configure,
+        flush,
+        init,
+        set,  # noqa: A004
+        stats,
+        theme,
+    )
+    from st_yled.elements import *  # noqa: F403
 
-    # Set session_state
-    st.session_state[f"st-yled-comp-{caller_hash}-counter"] = 0
 
-    cwd = Path.cwd()
+def __getattr__(name: str) -> Any:
+    """Load submodules, the core API and element wrappers on first access."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f"st_yled.{name}")
 
-    if css_path:
-        # Check if provided path exists
-        css_file = Path(css_path)
-        if css_file.exists():
-            st.html(str(css_file))
-            return
-        msg = f"CSS file not found at provided path: {css_path}"
-        raise FileNotFoundError(msg)
+    if name.startswith("__"):
+        msg = f"module 'st_yled' has no attribute '{name}'"
+        raise AttributeError(msg)
 
-    # Check if .streamlit/st-styled.css exists
-    css_default_path = cwd / ".streamlit" / "st-styled.css"
-    if css_default_path.exists():
-        st.html(str(css_default_path))
-        return
+    if name in _CORE_ATTRS:
+        module = importlib.import_module("st_yled.core")
+    else:
+        module = importlib.import_module("st_yled.elements")
 
-    # Check if directory in home exists
-    home_dir = Path.home() / ".streamlit" / "st-styled.css"
-    if home_dir.exists():
-        st.html(str(home_dir))
-        return
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        msg = f"module 'st_yled' has no attribute '{name}'"
+        raise AttributeError(msg) from None
 
-    # If no CSS file found, apply no styles
-    # TODO: Potentially raise a warning here
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
 
-def set(element: str, property: str, value: str) -> None:
-    styler.apply_component_css_global(element, {property: value})
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
@@ -0,0 +1,176 @@
+"""Vectorized validation of many styling values at once.
+
+The checks mirror StyleValidator.validate_property, but run as pandas string
+operations over whole arrays or Series, e.g. per-row colors derived from data.
+Missing values (None or NaN) are valid and mean "no style".
+"""
+
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import pandas as pd  # type: ignore
+
+from st_yled.validation import CSSValidator, StyleValidator  # type: ignore
+
+
+class BatchValidationResult(NamedTuple):
+    """Outcome of validating many values."""
+
+    # True where the value is valid, aligned with the input
+    mask: Any
+    # Error message per invalid value, indexed like the input
+    errors: pd.Series
+    # Values converted to CSS strings (e.g. 12 -> '12px'), missing values kept
+    css_values: Any
+
+
+def _strip_pattern(pattern: str) -> str:
+    """Remove the ^ and $ anchors of a pattern."""
+    return pattern.removeprefix("^").removesuffix("$")
+
+
+_COLOR_PATTERN = "|".join(
+    f"(?:{_strip_pattern(pattern.pattern)})"
+    for pattern in CSSValidator.COLOR_PATTERNS.values()
+)
+
+_LENGTH_PART = f"(?:0|{_strip_pattern(CSSValidator.LENGTH_PATTERN.pattern)})"
+_LENGTH_PATTERN = rf"{_LENGTH_PART}(?:\s+{_LENGTH_PART})*"
+
+
+def _colors_valid(values: pd.Series) -> pd.Series:
+    normalized = values.str.strip().str.lower()
+    return normalized.isin(CSSValidator.NAMED_COLORS) | normalized.str.fullmatch(
+        _COLOR_PATTERN
+    )
+
+
+def _lengths_valid(values: pd.Series) -> pd.Series:
+    return values.str.strip().str.fullmatch(_LENGTH_PATTERN)
+
+
+def _border_styles_valid(values: pd.Series) -> pd.Series:
+    return values.str.strip().str.lower().isin(CSSValidator.BORDER_STYLES)
+
+
+# Vectorized counterparts of the scalar validators
+VECTORIZED_VALIDATORS: dict[Callable[[str], bool], Callable[[pd.Series], pd.Series]] = {
+    CSSValidator.is_valid_color: _colors_valid,
+    CSSValidator.is_valid_length: _lengths_valid,
+    CSSValidator.is_valid_border_style: _border_styles_valid,
+}
+
+
+def _to_css_strings(prop_name: str, values: pd.Series) -> pd.Series:
+    """Convert values to strings, adding the default unit to integers."""
+    default_unit = StyleValidator.PROPERTY_DEFAULT_UNITS.get(prop_name)
+
+    # Integers with missing values are stored as floats, e.g. [12, None]
+    if (
+        default_unit is not None
+        and pd.api.types.is_float_dtype(values.dtype)
+        and values.dropna().mod(1).eq(0).all()
+    ):
+        values = values.astype("Int64")
+
+    if default_unit is not None and pd.api.types.is_integer_dtype(values.dtype):
+        return values.astype(str) + default_unit
+
+    if default_unit is not None and values.dtype == object:
+        values = values.map(
+            lambda value: f"{value}{default_unit}" if isinstance(value, int) else value
+        )
+
+    return values.astype(str)
+
+
+def validate_property_values(prop_name: str, values: Any) -> BatchValidationResult:
+    """
+    Validate many values of one styling property in one call.
+
+    Args:
+        prop_name: Styling property, e.g. 'background_color' (aliases such as
+            'bg_color' are resolved)
+        values: Values as a pandas Series, NumPy array or list
+
+    Returns:
+        BatchValidationResult with a boolean mask, error messages of the invalid
+        values and the values converted to CSS strings. mask and values are
+        Series if a Series was passed, otherwise NumPy arrays.
+
+    Example:
+        >>> result = validate_property_values("color", ["red", "#00ff00", "nope"])
+        >>> result.mask
+        array([ True,  True, False])
+    """
+    prop_name = StyleValidator.PROPERTY_ALIASES.get(prop_name, prop_name)
+
+    is_series = isinstance(values, pd.Series)
+    series = values if is_series else pd.Series(values, dtype=object)
+
+    missing = series.isna()
+    css_values = _to_css_strings(prop_name, series).mask(missing, None)
+
+    validator = StyleValidator.PROPERTY_VALIDATORS.get(prop_name)
+    if validator is None:
+        # Unknown properties are passed through without validation
+        mask = pd.Series(True, index=series.index)
+    else:
+        vectorized = VECTORIZED_VALIDATORS.get(validator)
+        present = css_values[~missing]
+        if vectorized is not None:
+            valid = vectorized(present.astype(str))
+        else:
+            valid = present.map(validator)
+        mask = valid.astype(bool).reindex(series.index, fill_value=True)
+
+    invalid = css_values[~mask]
+    errors = pd.Series(
+        [
+            StyleValidator.get_validation_error_message(prop_name, value)
+            for value in invalid
+        ],
+        index=invalid.index,
+        dtype=object,
+    )
+
+    if is_series:
+        return BatchValidationResult(mask, errors, css_values)
+    return BatchValidationResult(mask.to_numpy(), errors, css_values.to_numpy())
+
+
+def validate_style_table(styles: pd.DataFrame) -> BatchValidationResult:
+    """
+    Validate a table with one column per styling property.
+
+    Args:
+        styles: DataFrame whose columns are styling properties, e.g. per-row
+            'color' and 'background_color' values
+
+    Returns:
+        BatchValidationResult with a boolean DataFrame mask, error messages
+        indexed by (row, property) and a DataFrame of CSS string values
+    """
+    results = {
+        column: validate_property_values(column, styles[column])
+        for column in styles.columns
+    }
+
+    mask = pd.DataFrame(
+        {column: result.mask for column, result in results.items()},
+        index=styles.index,
+    )
+    css_values = pd.DataFrame(
+        {column: result.css_values for column, result in results.items()},
+        index=styles.index,
+    )
+    errors = (
+        pd.concat(
+            {column: result.errors for column, result in results.items()},
+            names=["property", "row"],
+        ).swaplevel()
+        if results
+        else pd.Series(dtype=object)
+    )
+
+    return BatchValidationResult(mask, errors, css_values)
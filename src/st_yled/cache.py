@@ -0,0 +1,104 @@
+"""Bounded caches used on the styling hot path.
+
+Caches are module-level and shared by the script threads of all sessions, so
+every operation holds the cache's lock. Values are computed outside of it.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Optional
+
+
+class LRUCache:
+    """Least-recently-used cache with a fixed maximum size and hit/miss counters."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 0:
+            msg = f"Cache size must be >= 0, got {maxsize}."
+            raise ValueError(msg)
+
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key and mark it as recently used."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        with self._lock:
+            if self._maxsize == 0:
+                return
+
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum size, evicting entries if the cache shrinks."""
+        if maxsize < 0:
+            msg = f"Cache size must be >= 0, got {maxsize}."
+            raise ValueError(msg)
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond maxsize, holding the lock."""
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, evictions, current size, maxsize
+            and hit rate (0.0 when the cache has not been queried yet).
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+            info: dict[str, Any] = {
+                "hits": hits,
+                "misses": misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self._maxsize,
+            }
+        lookups = hits + misses
+        info["hit_rate"] = hits / lookups if lookups else 0.0
+        return info
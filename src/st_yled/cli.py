@@ -0,0 +1,202 @@
+"""Command line interface of st_yled.
+
+    st-yled build theme.toml
+
+validates a theme and compiles it into the minified stylesheet that
+st_yled.init() loads from .streamlit/st-styled.css, so apps using it do no
+validation or CSS generation for their global styles at runtime.
+
+A theme maps element names to {property: value}, like st_yled.theme(). It is
+read from a TOML or JSON file, or from a variable of a Python file:
+
+    [button]
+    background_color = "#0d6efd"
+
+    [title]
+    color = "navy"
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+from st_yled.compiler import render_theme_css  # type: ignore
+from st_yled.validation import validate_styling_theme  # type: ignore
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib  # type: ignore
+
+# Stylesheet location st_yled.init() loads by default
+DEFAULT_OUTPUT = Path(".streamlit") / "st-styled.css"
+
+# Variable holding the theme in Python theme files
+DEFAULT_VARIABLE = "theme"
+
+
+def _load_python_theme(path: Path, variable: str) -> Any:
+    """Execute a Python file and get the theme from one of its variables."""
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    if spec is None or spec.loader is None:
+        msg = f"Cannot load Python theme file {path}."
+        raise ValueError(msg)
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    if not hasattr(module, variable):
+        msg = f"Theme file {path} does not define '{variable}'."
+        raise ValueError(msg)
+    return getattr(module, variable)
+
+
+def load_theme(path: Path, variable: str = DEFAULT_VARIABLE) -> dict[str, Any]:
+    """
+    Read a theme definition from a TOML, JSON or Python file.
+
+    Args:
+        path: Theme file, the format is chosen by its suffix
+        variable: Name of the theme dict in Python files
+
+    Returns:
+        Mapping of element name to styling properties
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the format is unsupported or the file is no valid theme
+    """
+    suffix = path.suffix.lower()
+
+    if suffix == ".toml":
+        theme = tomllib.loads(path.read_text(encoding="utf-8"))
+    elif suffix == ".json":
+        theme = json.loads(path.read_text(encoding="utf-8"))
+    elif suffix == ".py":
+        theme = _load_python_theme(path, variable)
+    else:
+        msg = f"Unsupported theme file '{path.name}'. Use a .toml, .json or .py file."
+        raise ValueError(msg)
+
+    if not isinstance(theme, dict) or not all(
+        isinstance(styles, dict) for styles in theme.values()
+    ):
+        msg = f"Theme in {path} must map element names to {{property: value}} tables."
+        raise ValueError(msg)
+
+    return theme
+
+
+def build_stylesheet(theme: dict[str, dict[str, Any]], minify: bool = True) -> str:
+    """
+    Validate a theme and compile it into one stylesheet.
+
+    Validation is always strict, so invalid values fail the build instead of
+    being dropped with a warning.
+
+    Args:
+        theme: Mapping of element name to styling properties
+        minify: Whether to minify the stylesheet
+
+    Returns:
+        The stylesheet
+
+    Raises:
+        ValidationError: If a styling value is invalid
+        ValueError: If elements or properties are unknown
+    """
+    theme = validate_styling_theme(theme, strict=True)
+    css, _ = render_theme_css(theme, minify)
+    return css
+
+
+def build(
+    theme_path: Path,
+    output: Path = DEFAULT_OUTPUT,
+    variable: str = DEFAULT_VARIABLE,
+    minify: bool = True,
+) -> str:
+    """
+    Build the stylesheet of a theme file and write it to output.
+
+    Args:
+        theme_path: TOML, JSON or Python theme file
+        output: Path of the stylesheet, parent directories are created
+        variable: Name of the theme dict in Python files
+        minify: Whether to minify the stylesheet
+
+    Returns:
+        The stylesheet written to output
+    """
+    css = build_stylesheet(load_theme(theme_path, variable), minify)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(css + "\n", encoding="utf-8")
+    return css
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="st-yled", description="Tools for st_yled styled Streamlit apps."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser(
+        "build",
+        help="compile a theme into a static stylesheet",
+        description=(
+            "Validate a theme and compile it into the stylesheet st_yled.init() loads."
+        ),
+    )
+    build_parser.add_argument(
+        "theme", type=Path, help="theme definition (.toml, .json or .py)"
+    )
+    build_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help=f"stylesheet to write (default: {DEFAULT_OUTPUT})",
+    )
+    build_parser.add_argument(
+        "--variable",
+        default=DEFAULT_VARIABLE,
+        help=f"name of the theme dict in .py files (default: {DEFAULT_VARIABLE})",
+    )
+    build_parser.add_argument(
+        "--no-minify",
+        dest="minify",
+        action="store_false",
+        help="write readable instead of minified CSS",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the st-yled command line interface.
+
+    Args:
+        argv: Command line arguments, sys.argv[1:] if None
+
+    Returns:
+        Exit status
+    """
+    args = _create_parser().parse_args(argv)
+
+    try:
+        css = build(args.theme, args.output, args.variable, args.minify)
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"st-yled: error: {e}\n")
+        return 1
+
+    sys.stdout.write(f"Wrote {args.output} ({len(css)} bytes)\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
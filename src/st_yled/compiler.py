@@ -0,0 +1,167 @@
+"""Compilation of styling properties into CSS rules.
+
+Kept free of Streamlit imports, so the st-yled build command compiles themes
+without loading Streamlit.
+"""
+
+import functools
+from collections.abc import Iterable
+from typing import Any
+
+from st_yled.css import merge_rules, minify_css  # type: ignore
+from st_yled.style_index import StyleIndex, load_index  # type: ignore
+
+
+@functools.cache
+def load_style_index() -> StyleIndex:
+    """Get the precompiled style index, loading it on first use."""
+    return load_index()
+
+
+def get_css_properties_from_args(
+    component_type: str, component_kwargs: dict[str, Any]
+) -> dict[str, dict[str, str]]:
+    """Get CSS properties from component arguments."""
+    style_index = load_style_index()
+
+    if component_type not in style_index.elements:
+        msg = f"Component type '{component_type}' not found. Are you sure this component exists?"
+        raise ValueError(msg)
+
+    css_properties: dict[str, dict[str, str]] = {}
+    args_to_remove = []
+
+    # Loop over component arguments and look up their pre-resolved selector templates
+    for comp_arg, comp_val in component_kwargs.items():
+        templates = style_index.properties.get((component_type, comp_arg))
+        if templates is None:
+            continue
+
+        args_to_remove.append(comp_arg)
+
+        # Templates are (selector, ((css_property, css_value or None), ...)) pairs
+        for sel, sel_css in templates:
+            # If css_value is set in the table take it over, else set comp_val
+            sel_properties = css_properties.setdefault(sel, {})
+            for k, v in sel_css:
+                sel_properties[k] = comp_val if v is None else v
+
+    # Remove any args that were used for styling
+    for arg in args_to_remove:
+        del component_kwargs[arg]
+
+    return css_properties
+
+
+# Compiled (selectors, declarations) rules and the bytes optimization saved on them
+CompiledRules = tuple[tuple[tuple[tuple[str, ...], str], ...], int]
+
+
+def render_css_rules(
+    css_rules: tuple[tuple[tuple[str, ...], str], ...], prefix: str, minify: bool
+) -> str:
+    """Join (selectors, declarations) pairs into a stylesheet, prefixing every selector."""
+    if minify:
+        return "".join(
+            ",".join(
+                f"{prefix}{selector}" if selector else prefix.rstrip()
+                for selector in selectors
+            )
+            + f"{{{rules_str}}}"
+            for selectors, rules_str in css_rules
+        )
+
+    return "\n".join(
+        ", ".join(f"{prefix}{selector}" for selector in selectors)
+        + f" {{\n{rules_str}\n}}"
+        for selectors, rules_str in css_rules
+    )
+
+
+def compile_css_rules(
+    css_properties: list[tuple[str, dict[str, str]]], minify: bool
+) -> CompiledRules:
+    """
+    Compile selectors and their CSS properties into optimized rules.
+
+    Rules with the same selector are merged and selectors with identical
+    declarations are grouped, then the rules are minified if requested.
+
+    Args:
+        css_properties: (selector, {css_property: value}) pairs in stylesheet order
+        minify: Whether to minify selectors and declarations
+
+    Returns:
+        Tuple of the compiled rules and the bytes saved compared to one
+        unminified rule per selector
+    """
+
+    def format_declarations(declarations: Iterable[tuple[str, str]]) -> str:
+        return "\n".join(f"    {prop}: {val};" for prop, val in declarations)
+
+    declared = [
+        (
+            selector,
+            tuple((prop, f"{val} !important") for prop, val in properties.items()),
+        )
+        for selector, properties in css_properties
+    ]
+    merged = merge_rules(declared)
+
+    if minify:
+        css_rules = tuple(
+            (
+                tuple(minify_css(selector) for selector in selectors),
+                minify_css(f"{{{format_declarations(declarations)}}}")[1:-1],
+            )
+            for selectors, declarations in merged
+        )
+    else:
+        css_rules = tuple(
+            (selectors, format_declarations(declarations))
+            for selectors, declarations in merged
+        )
+
+    unoptimized = tuple(
+        ((selector,), format_declarations(declarations))
+        for selector, declarations in declared
+    )
+    bytes_saved = len(render_css_rules(unoptimized, "", minify=False)) - len(
+        render_css_rules(css_rules, "", minify)
+    )
+    return css_rules, bytes_saved
+
+
+def render_theme_css(theme: dict[str, dict[str, Any]], minify: bool) -> tuple[str, int]:
+    """
+    Compile an already validated theme into a single stylesheet.
+
+    Args:
+        theme: Mapping of component type to styling properties
+        minify: Whether to minify the stylesheet
+
+    Returns:
+        Tuple of the stylesheet and the bytes minification saved
+
+    Raises:
+        ValueError: If component types or properties are invalid
+    """
+    style_index = load_style_index()
+    css_properties: list[tuple[str, dict[str, str]]] = []
+    for component_type, styles in theme.items():
+        for styled_prop in styles:
+            if (component_type, styled_prop) not in style_index.properties:
+                if component_type not in style_index.elements:
+                    msg = f"Component type '{component_type}' not found. Are you sure this component exists?"
+                else:
+                    msg = f"No st_yled property {styled_prop} found for component type '{component_type}'."
+                raise ValueError(msg)
+
+        css_properties.extend(
+            get_css_properties_from_args(component_type, dict(styles)).items()
+        )
+
+    # Rules are merged and grouped across all elements of the theme
+    css_rules, bytes_saved = compile_css_rules(css_properties, minify)
+
+    return render_css_rules(css_rules, "", minify), bytes_saved
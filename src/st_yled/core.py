@@ -0,0 +1,121 @@
+"""Session-level st_yled API: initialization, global styles and configuration."""
+
+from typing import Any, Optional
+
+from st_yled import styler  # type: ignore
+
+
+def init(css_path: Optional[str] = None) -> None:
+    """
+    Initialize st_yled with CSS styling.
+
+    Call it at the top of every script run, before any styled element.
+
+    With configure(batch_css=True), CSS is collected into a placeholder created
+    here and only shown once flush() is called. Call flush() at the end of the
+    script, and before st.stop() or st.rerun(): CSS batched in a run that ends
+    without a flush is lost, and the next init() warns about it.
+
+    Args:
+        css_path: CSS file applied to the whole app, by default
+            .streamlit/st-styled.css if it exists
+    """
+
+    caller_hash = styler.extract_caller_path_hash()
+
+    # Key counters, call sites and emitted shared styles restart in every run
+    styler.start_run_state(caller_hash)
+
+    # Placeholder at the top of the page receives all batched CSS on flush()
+    if styler.StylerConfig.BATCH_CSS:
+        styler.start_css_batch()
+
+    # Rules reading the custom properties set by elements in CSS variables mode
+    if styler.StylerConfig.CSS_VARIABLES:
+        styler.emit_variables_stylesheet()
+
+    # Path resolution and file contents are cached process-wide
+    css = styler.load_user_css(css_path)
+    if css is None:
+        # If no CSS file found, apply no styles
+        # TODO: Potentially raise a warning here
+        return
+
+    bytes_saved = 0
+    if styler.StylerConfig.MINIFY_CSS:
+        minified = styler.minify_user_css(css)
+        bytes_saved = len(css) - len(minified)
+        css = minified
+
+    # Counted in stats, and batched with all other CSS of the run
+    styler.emit_css(css, bytes_saved)
+
+
+def set(element: str, property: str, value: str) -> None:
+    styler.apply_component_css_global(element, {property: value})
+
+
+def theme(styles: dict[str, dict[str, Any]]) -> None:
+    """
+    Apply global styles for many elements at once.
+
+    The styles are validated in one batch and emitted as a single stylesheet.
+    The compiled stylesheet is memoized on the contents of styles, so reruns
+    with the same theme do not validate or generate CSS again.
+
+    Args:
+        styles: Mapping of element name to {property: value}, e.g.
+            {"button": {"background_color": "#0d6efd"}, "title": {"color": "navy"}}
+
+    Raises:
+        ValidationError: If validation fails in strict mode
+        ValueError: If elements or properties are unknown
+    """
+    styler.apply_theme(styles)
+
+
+def stats() -> dict[str, Any]:
+    """
+    Get statistics about the work st_yled did in this session.
+
+    Returns:
+        Dictionary with the counters of the current run ('run'), cumulative
+        counters of the session ('session'), cache hit rates ('caches') and
+        the memory footprint of the session ('footprint').
+        Counters are the number of styled and global calls, style emissions,
+        CSS bytes emitted, and seconds spent in validation, key generation and
+        CSS generation.
+    """
+    return styler.get_stats_report()
+
+
+def flush() -> None:
+    """
+    Emit all CSS collected since init() as a single stylesheet.
+
+    Only needed with configure(batch_css=True), where it is required: CSS that
+    is not flushed when the run ends, e.g. by st.stop(), st.rerun() or an
+    exception, is never shown. Call it at the end of the script, before st.stop()
+    or st.rerun(), and optionally at checkpoints in between to show styles earlier.
+    """
+    styler.flush_css_batch()
+
+
+def configure(**options: Any) -> None:
+    """
+    Configure how st_yled generates and emits CSS.
+
+    Args:
+        **options: Configuration options, e.g. shared_classes=True to emit one
+            shared CSS rule per distinct style combination, or batch_css=True to
+            collect all CSS of a run and emit it on flush() (which the script
+            must then call before the run ends), or
+            key_strategy="callsite" to derive element keys from their call site,
+            or css_variables=True to style elements by setting CSS custom
+            properties read by one static stylesheet (takes precedence over
+            shared_classes; elements with user keys keep their own rules).
+
+    Raises:
+        ValueError: If an option is unknown
+    """
+    styler.StylerConfig.configure(**options)
@@ -0,0 +1,164 @@
+"""CSS text transformations applied before stylesheets are sent to the browser."""
+
+import re
+from collections.abc import Iterable
+
+# Comments, and tokens whose contents must not be changed: strings and url(...)
+_PROTECTED_PATTERN = re.compile(
+    r'/\*.*?\*/|"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|url\([^)]*\)',
+    re.IGNORECASE | re.DOTALL,
+)
+_PLACEHOLDER_PATTERN = re.compile(r"\x00(\d+)\x00")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+# Whitespace around these characters never changes the meaning of CSS
+_PUNCTUATION_PATTERN = re.compile(r"\s*([{};,>])\s*")
+_AFTER_COLON_PATTERN = re.compile(r":\s+")
+_BEFORE_IMPORTANT_PATTERN = re.compile(r"\s+!")
+_BLOCK_PATTERN = re.compile(r"\{([^{}]*)\}")
+_EMPTY_RULE_PATTERN = re.compile(r"[^{};]+\{\}")
+
+
+def _remove_duplicate_declarations(match: re.Match) -> str:
+    """Drop declarations repeated identically later in the same block."""
+    declarations = [decl for decl in match.group(1).split(";") if decl]
+
+    # The last occurrence wins, so earlier identical ones are redundant
+    seen = set()
+    kept = []
+    for decl in reversed(declarations):
+        if decl not in seen:
+            seen.add(decl)
+            kept.append(decl)
+
+    return "{" + ";".join(reversed(kept)) + "}"
+
+
+def minify_css(css: str) -> str:
+    """
+    Minify a stylesheet.
+
+    Removes comments and insignificant whitespace, the last semicolon of each
+    block, identical declarations repeated within a block and empty rules.
+    Strings and url() values are left untouched.
+
+    Args:
+        css: Stylesheet text
+
+    Returns:
+        Minified stylesheet text
+    """
+    protected: list[str] = []
+
+    def protect(match: re.Match) -> str:
+        token = match.group(0)
+        if token.startswith("/*"):
+            return " "
+        protected.append(token)
+        return f"\x00{len(protected) - 1}\x00"
+
+    css = _PROTECTED_PATTERN.sub(protect, css)
+
+    css = _WHITESPACE_PATTERN.sub(" ", css)
+    css = _PUNCTUATION_PATTERN.sub(r"\1", css)
+    css = _AFTER_COLON_PATTERN.sub(":", css)
+    css = _BEFORE_IMPORTANT_PATTERN.sub("!", css)
+    css = _BLOCK_PATTERN.sub(_remove_duplicate_declarations, css)
+    css = _EMPTY_RULE_PATTERN.sub("", css)
+
+    return _PLACEHOLDER_PATTERN.sub(lambda m: protected[int(m.group(1))], css).strip()
+
+
+# Declarations of a rule as (property, value) pairs
+Declarations = tuple[tuple[str, str], ...]
+
+_VENDOR_PREFIX_PATTERN = re.compile(r"^-[a-z]+-")
+
+
+def _property_family(prop: str) -> str:
+    """Get the property family, e.g. 'border' for 'border-color' or '-webkit-border-radius'."""
+    return _VENDOR_PREFIX_PATTERN.sub("", prop).split("-")[0]
+
+
+def _can_move_past(
+    blocks: Iterable[Iterable[tuple[str, str]]], declarations: Declarations
+) -> bool:
+    """
+    Check that declarations can move past blocks without changing the cascade.
+
+    A block is in the way if it sets a property of the same family to a
+    different value.
+    """
+    families = {_property_family(prop) for prop, _ in declarations}
+    return all(
+        decl in declarations or _property_family(decl[0]) not in families
+        for block in blocks
+        for decl in block
+    )
+
+
+def _selector_group(selector: str) -> str:
+    """Get the class of selectors a selector may be grouped with."""
+    if not selector:
+        return "empty"
+    if ":has(" in selector:
+        return "has"
+    return "plain"
+
+
+def merge_rules(
+    rules: Iterable[tuple[str, Declarations]],
+) -> list[tuple[tuple[str, ...], Declarations]]:
+    """
+    Merge rules with the same selector and group selectors with identical declarations.
+
+    Declarations only move past other rules if those rules set no property of
+    the same family (e.g. 'margin' and 'margin-top') to a different value, so
+    the cascade is kept.
+    Selectors using :has() are not grouped with other selectors, because a
+    browser without :has() support drops the whole selector list. The empty
+    selector (rules of the prefix itself, e.g. a container) is never grouped,
+    as it would leave an empty entry in the selector list.
+
+    Args:
+        rules: (selector, declarations) pairs in stylesheet order
+
+    Returns:
+        (selectors, declarations) pairs in stylesheet order
+    """
+    # Merge declarations per selector
+    blocks: list[tuple[str, dict[str, str]]] = []
+    selector_positions: dict[str, int] = {}
+    for selector, declarations in rules:
+        index = selector_positions.get(selector)
+        if index is not None and _can_move_past(
+            (block.items() for _, block in blocks[index + 1 :]), declarations
+        ):
+            block = blocks[index][1]
+            for prop, value in declarations:
+                # Re-inserted at the end, so a shorthand still overrides earlier longhands
+                block.pop(prop, None)
+                block[prop] = value
+        else:
+            selector_positions[selector] = len(blocks)
+            blocks.append((selector, dict(declarations)))
+
+    # Group selectors sharing an identical declaration block
+    groups: list[tuple[list[str], Declarations]] = []
+    group_positions: dict[tuple[Declarations, str], int] = {}
+    for selector, block in blocks:
+        declarations = tuple(block.items())
+        group_key = (declarations, _selector_group(selector))
+        index = group_positions.get(group_key)
+        if (
+            index is not None
+            and selector not in groups[index][0]
+            and _can_move_past(
+                (decls for _, decls in groups[index + 1 :]), declarations
+            )
+        ):
+            groups[index][0].append(selector)
+        else:
+            group_positions[group_key] = len(groups)
+            groups.append(([selector], declarations))
+
+    return [(tuple(selectors), declarations) for selectors, declarations in groups]
@@ -1,14 +1,31 @@
+import inspect
+
 import streamlit as st
 
 from st_yled import styler  # type: ignore
 from st_yled import validation  # type: ignore
 
+# Streamlit versions before 1.48 do not accept a container width
+CONTAINER_WIDTH = "width" in inspect.signature(st.container).parameters
+
+
+def _keyed_container(key, width):
+    """Create the keyed container holding a styled element."""
+    if CONTAINER_WIDTH:
+        return st.container(key=key, width=width)
+    return st.container(key=key)
+
+
 # ==============================================================================
 # Display and Magic Components
 # ==============================================================================
 
 
 def write(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("write", kwargs):
+        styler.generate_component_key()
+        return st.write(*args, **kwargs)
+
     kwargs = styler.apply_component_css("write", kwargs)
     key = kwargs.pop("key", None)
 
@@ -21,7 +38,7 @@ def write(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.write(*args, **kwargs)
 
 
@@ -35,6 +52,10 @@ def write_stream(*args, **kwargs):
 
 
 def markdown(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("markdown", kwargs):
+        styler.generate_component_key()
+        return st.markdown(*args, **kwargs)
+
     kwargs = styler.apply_component_css("markdown", kwargs)
     key = kwargs.pop("key", None)
 
@@ -47,11 +68,15 @@ def markdown(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.markdown(*args, **kwargs)
 
 
 def title(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("title", kwargs):
+        styler.generate_component_key()
+        return st.title(*args, **kwargs)
+
     kwargs = styler.apply_component_css("title", kwargs)
     key = kwargs.pop("key", None)
 
@@ -64,11 +89,15 @@ def title(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.title(*args, **kwargs)
 
 
 def header(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("header", kwargs):
+        styler.generate_component_key()
+        return st.header(*args, **kwargs)
+
     kwargs = styler.apply_component_css("header", kwargs)
     key = kwargs.pop("key", None)
 
@@ -81,11 +110,15 @@ def header(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.header(*args, **kwargs)
 
 
 def subheader(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("subheader", kwargs):
+        styler.generate_component_key()
+        return st.subheader(*args, **kwargs)
+
     kwargs = styler.apply_component_css("subheader", kwargs)
     key = kwargs.pop("key", None)
 
@@ -98,7 +131,7 @@ def subheader(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.subheader(*args, **kwargs)
 
 
@@ -107,6 +140,10 @@ def badge(*args, **kwargs):
 
 
 def caption(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("caption", kwargs):
+        styler.generate_component_key()
+        return st.caption(*args, **kwargs)
+
     kwargs = styler.apply_component_css("caption", kwargs)
     key = kwargs.pop("key", None)
 
@@ -119,11 +156,15 @@ def caption(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.caption(*args, **kwargs)
 
 
 def code(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("code", kwargs):
+        styler.generate_component_key()
+        return st.code(*args, **kwargs)
+
     kwargs = styler.apply_component_css("code", kwargs)
     key = kwargs.pop("key", None)
 
@@ -136,11 +177,15 @@ def code(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.code(*args, **kwargs)
 
 
 def latex(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("latex", kwargs):
+        styler.generate_component_key()
+        return st.latex(*args, **kwargs)
+
     kwargs = styler.apply_component_css("latex", kwargs)
     key = kwargs.pop("key", None)
 
@@ -153,11 +198,15 @@ def latex(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.latex(*args, **kwargs)
 
 
 def text(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("text", kwargs):
+        styler.generate_component_key()
+        return st.text(*args, **kwargs)
+
     kwargs = styler.apply_component_css("text", kwargs)
     key = kwargs.pop("key", None)
 
@@ -170,7 +219,7 @@ def text(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.text(*args, **kwargs)
 
 
@@ -196,6 +245,10 @@ def data_editor(*args, **kwargs):
 
 
 def table(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("table", kwargs):
+        styler.generate_component_key()
+        return st.table(*args, **kwargs)
+
     kwargs = styler.apply_component_css("table", kwargs)
     key = kwargs.pop("key", None)
     cont = st.container(key=key)
@@ -203,6 +256,10 @@ def table(*args, **kwargs):
 
 
 def metric(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("metric", kwargs):
+        styler.generate_component_key()
+        return st.metric(*args, **kwargs)
+
     kwargs = styler.apply_component_css("metric", kwargs)
     key = kwargs.pop("key", None)
 
@@ -215,11 +272,15 @@ def metric(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.metric(*args, **kwargs)
 
 
 def json(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("json", kwargs):
+        styler.generate_component_key()
+        return st.json(*args, **kwargs)
+
     kwargs = styler.apply_component_css("json", kwargs)
     key = kwargs.pop("key", None)
 
@@ -232,7 +293,7 @@ def json(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.json(*args, **kwargs)
 
 
@@ -300,6 +361,9 @@ def button(*args, **kwargs):
     else:
         btn_selector = "button"
 
+    if not styler.has_style_kwargs(btn_selector, kwargs):
+        return st.button(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css(btn_selector, kwargs)
     return st.button(*args, **kwargs)
 
@@ -310,6 +374,9 @@ def download_button(*args, **kwargs):
     else:
         btn_selector = "download_button"
 
+    if not styler.has_style_kwargs(btn_selector, kwargs):
+        return st.download_button(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css(btn_selector, kwargs)
     return st.download_button(*args, **kwargs)
 
@@ -320,6 +387,10 @@ def link_button(*args, **kwargs):
     else:
         btn_selector = "link_button"
 
+    if "key" not in kwargs and not styler.has_style_kwargs(btn_selector, kwargs):
+        styler.generate_component_key()
+        return st.link_button(*args, **kwargs)
+
     kwargs = styler.apply_component_css(btn_selector, kwargs)
 
     key = kwargs.pop("key", None)
@@ -332,101 +403,161 @@ def page_link(*args, **kwargs):
 
 
 def checkbox(*args, **kwargs):
+    if not styler.has_style_kwargs("checkbox", kwargs):
+        return st.checkbox(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("checkbox", kwargs)
     return st.checkbox(*args, **kwargs)
 
 
 def color_picker(*args, **kwargs):
+    if not styler.has_style_kwargs("color_picker", kwargs):
+        return st.color_picker(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("color_picker", kwargs)
     return st.color_picker(*args, **kwargs)
 
 
 def feedback(*args, **kwargs):
+    if not styler.has_style_kwargs("feedback", kwargs):
+        return st.feedback(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("feedback", kwargs)
     return st.feedback(*args, **kwargs)
 
 
 def multiselect(*args, **kwargs):
+    if not styler.has_style_kwargs("multiselect", kwargs):
+        return st.multiselect(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("multiselect", kwargs)
     return st.multiselect(*args, **kwargs)
 
 
 def pills(*args, **kwargs):
+    if not styler.has_style_kwargs("pills", kwargs):
+        return st.pills(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("pills", kwargs)
     return st.pills(*args, **kwargs)
 
 
 def radio(*args, **kwargs):
+    if not styler.has_style_kwargs("radio", kwargs):
+        return st.radio(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("radio", kwargs)
     return st.radio(*args, **kwargs)
 
 
 def segmented_control(*args, **kwargs):
+    if not styler.has_style_kwargs("segmented_control", kwargs):
+        return st.segmented_control(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("segmented_control", kwargs)
     return st.segmented_control(*args, **kwargs)
 
 
 def selectbox(*args, **kwargs):
+    if not styler.has_style_kwargs("selectbox", kwargs):
+        return st.selectbox(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("selectbox", kwargs)
     return st.selectbox(*args, **kwargs)
 
 
 def select_slider(*args, **kwargs):
+    if not styler.has_style_kwargs("select_slider", kwargs):
+        return st.select_slider(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("select_slider", kwargs)
     return st.select_slider(*args, **kwargs)
 
 
 def toggle(*args, **kwargs):
+    if not styler.has_style_kwargs("toggle", kwargs):
+        return st.toggle(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("toggle", kwargs)
     return st.toggle(*args, **kwargs)
 
 
 def number_input(*args, **kwargs):
+    if not styler.has_style_kwargs("number_input", kwargs):
+        return st.number_input(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("number_input", kwargs)
     return st.number_input(*args, **kwargs)
 
 
 def slider(*args, **kwargs):
+    if not styler.has_style_kwargs("slider", kwargs):
+        return st.slider(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("slider", kwargs)
     return st.slider(*args, **kwargs)
 
 
 def date_input(*args, **kwargs):
+    if not styler.has_style_kwargs("date_input", kwargs):
+        return st.date_input(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("date_input", kwargs)
     return st.date_input(*args, **kwargs)
 
 
 def time_input(*args, **kwargs):
+    if not styler.has_style_kwargs("time_input", kwargs):
+        return st.time_input(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("time_input", kwargs)
     return st.time_input(*args, **kwargs)
 
 
 def text_area(*args, **kwargs):
+    if not styler.has_style_kwargs("text_area", kwargs):
+        return st.text_area(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("text_area", kwargs)
     return st.text_area(*args, **kwargs)
 
 
 def text_input(*args, **kwargs):
+    if not styler.has_style_kwargs("text_input", kwargs):
+        return st.text_input(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("text_input", kwargs)
     return st.text_input(*args, **kwargs)
 
 
 def chat_input(*args, **kwargs):
+    if not styler.has_style_kwargs("chat_input", kwargs):
+        return st.chat_input(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("chat_input", kwargs)
     return st.chat_input(*args, **kwargs)
 
 
 def audio_input(*args, **kwargs):
+    if not styler.has_style_kwargs("audio_input", kwargs):
+        return st.audio_input(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("audio_input", kwargs)
     return st.audio_input(*args, **kwargs)
 
 
 def file_uploader(*args, **kwargs):
+    if not styler.has_style_kwargs("file_uploader", kwargs):
+        return st.file_uploader(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("file_uploader", kwargs)
     return st.file_uploader(*args, **kwargs)
 
 
 def camera_input(*args, **kwargs):
+    if not styler.has_style_kwargs("camera_input", kwargs):
+        return st.camera_input(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("camera_input", kwargs)
     return st.camera_input(*args, **kwargs)
 
@@ -466,6 +597,9 @@ def columns(*args, **kwargs):
 
 
 def container(*args, **kwargs):
+    if not styler.has_style_kwargs("container", kwargs):
+        return st.container(*args, **styler.apply_component_key(kwargs))
+
     kwargs = styler.apply_component_css("container", kwargs)
     return st.container(*args, **kwargs)
 
@@ -475,6 +609,10 @@ def empty(*args, **kwargs):
 
 
 def expander(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("expander", kwargs):
+        styler.generate_component_key()
+        return st.expander(*args, **kwargs)
+
     kwargs = styler.apply_component_css("expander", kwargs)
     key = kwargs.pop("key", None)
 
@@ -487,11 +625,15 @@ def expander(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.expander(*args, **kwargs)
 
 
 def popover(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("popover", kwargs):
+        styler.generate_component_key()
+        return st.popover(*args, **kwargs)
+
     kwargs = styler.apply_component_css("popover", kwargs)
     key = kwargs.pop("key", None)
 
@@ -505,11 +647,15 @@ def popover(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.popover(*args, **kwargs)
 
 
 def tabs(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("tabs", kwargs):
+        styler.generate_component_key()
+        return st.tabs(*args, **kwargs)
+
     kwargs = styler.apply_component_css("tabs", kwargs)
     key = kwargs.pop("key", None)
 
@@ -522,7 +668,7 @@ def tabs(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.tabs(*args, **kwargs)
 
 
@@ -532,6 +678,10 @@ def tabs(*args, **kwargs):
 
 
 def chat_message(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("chat_message", kwargs):
+        styler.generate_component_key()
+        return st.chat_message(*args, **kwargs)
+
     kwargs = styler.apply_component_css("chat_message", kwargs)
     key = kwargs.pop("key", None)
 
@@ -544,7 +694,7 @@ def chat_message(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.chat_message(*args, **kwargs)
 
 
@@ -554,6 +704,10 @@ def chat_message(*args, **kwargs):
 
 
 def progress(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("progress", kwargs):
+        styler.generate_component_key()
+        return st.progress(*args, **kwargs)
+
     kwargs = styler.apply_component_css("progress", kwargs)
     key = kwargs.pop("key", None)
 
@@ -566,7 +720,7 @@ def progress(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.progress(*args, **kwargs)
 
 
@@ -575,6 +729,10 @@ def spinner(*args, **kwargs):
 
 
 def status(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("status", kwargs):
+        styler.generate_component_key()
+        return st.status(*args, **kwargs)
+
     kwargs = styler.apply_component_css("status", kwargs)
     key = kwargs.pop("key", None)
 
@@ -587,7 +745,7 @@ def status(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.status(*args, **kwargs)
 
 
@@ -604,6 +762,10 @@ def snow(*args, **kwargs):
 
 
 def success(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("success", kwargs):
+        styler.generate_component_key()
+        return st.success(*args, **kwargs)
+
     kwargs = styler.apply_component_css("success", kwargs)
     key = kwargs.pop("key", None)
 
@@ -616,11 +778,15 @@ def success(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.success(*args, **kwargs)
 
 
 def info(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("info", kwargs):
+        styler.generate_component_key()
+        return st.info(*args, **kwargs)
+
     kwargs = styler.apply_component_css("info", kwargs)
     key = kwargs.pop("key", None)
 
@@ -633,11 +799,15 @@ def info(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.info(*args, **kwargs)
 
 
 def warning(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("warning", kwargs):
+        styler.generate_component_key()
+        return st.warning(*args, **kwargs)
+
     kwargs = styler.apply_component_css("warning", kwargs)
     key = kwargs.pop("key", None)
 
@@ -650,11 +820,15 @@ def warning(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.warning(*args, **kwargs)
 
 
 def error(*args, **kwargs):
+    if "key" not in kwargs and not styler.has_style_kwargs("error", kwargs):
+        styler.generate_component_key()
+        return st.error(*args, **kwargs)
+
     kwargs = styler.apply_component_css("error", kwargs)
     key = kwargs.pop("key", None)
 
@@ -667,7 +841,7 @@ def error(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.error(*args, **kwargs)
 
 
@@ -694,6 +868,10 @@ def form_submit_button(*args, **kwargs):
     else:
         btn_selector = "form_submit_button"
 
+    if "key" not in kwargs and not styler.has_style_kwargs(btn_selector, kwargs):
+        styler.generate_component_key()
+        return st.form_submit_button(*args, **kwargs)
+
     kwargs = styler.apply_component_css(btn_selector, kwargs)
     key = kwargs.pop("key", None)
 
@@ -706,7 +884,7 @@ def form_submit_button(*args, **kwargs):
     else:
         container_width = "stretch"  # set default
 
-    cont = st.container(key=key, width=container_width)
+    cont = _keyed_container(key, container_width)
     return cont.form_submit_button(*args, **kwargs)
 
 
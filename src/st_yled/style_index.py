@@ -0,0 +1,331 @@
+"""Precompiled index of element_styles.json.
+
+element_styles.json has two sections. "elements" maps each element to either
+its own "css" mapping or a "template" name with "params". "templates" holds the
+shared property mappings; a template may itself refer to another template, and
+its params are formatted with the params of the referring entry, so variants
+only state what differs, e.g. {"template": "button", "params": {"kind": "primary"}}.
+Placeholders like "{kind}" are only substituted in selectors.
+
+The expanded table is compiled into a pickle file shipped next to the JSON. Besides
+the table itself, the index holds a flat mapping from (element, property) to the
+pre-resolved selector templates, so generating CSS needs a single lookup per
+styling argument. The index records the SHA-256 of the JSON it was built from;
+if it is missing or stale, the table is compiled from the JSON at runtime.
+The loaded table is frozen into read-only mappings and tuples, so it can be
+shared by the script threads of all sessions.
+
+Rebuild the index after editing element_styles.json:
+
+    python -m st_yled.style_index
+"""
+
+import hashlib
+import json
+import pickle
+import re
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple, Optional
+
+dirpath = Path(__file__).parent
+
+STYLES_PATH = dirpath / "element_styles.json"
+INDEX_PATH = dirpath / "element_styles.pickle"
+
+# Bump when the layout of the index changes
+INDEX_VERSION = 1
+
+# Element name suffixes marking variants, e.g. button_primary
+VARIANTS = ("primary", "secondary", "tertiary")
+
+_VARIANT_PATTERN = re.compile(rf"^(?P<base>.+?)_(?P<variant>{'|'.join(VARIANTS)})$")
+
+# Declarations of one selector: ((css_property, fixed value or None), ...)
+Declarations = tuple[tuple[str, Optional[str]], ...]
+
+# Selector templates of one styling property: ((selector, declarations), ...)
+PropertyTemplates = tuple[tuple[str, Declarations], ...]
+
+
+class StyleIndex(NamedTuple):
+    """Element style table and the flat property lookup derived from it."""
+
+    source_hash: str
+    elements: Mapping[str, Any]
+    properties: Mapping[tuple[str, str], PropertyTemplates]
+
+
+class ElementIndex(NamedTuple):
+    """Immutable lookups of element names, variants and categories."""
+
+    # All element names including variants, sorted
+    names: tuple[str, ...]
+    # Element names without variants, sorted
+    base_names: tuple[str, ...]
+    # Variants per element in table order, e.g. button -> (primary, secondary, tertiary)
+    variants: Mapping[str, tuple[str, ...]]
+    # Category -> base element -> sorted variants, 'primary' for elements without variants
+    categories: Mapping[str, Mapping[str, tuple[str, ...]]]
+
+
+def get_source_hash(source: bytes) -> str:
+    """Get the SHA-256 hex digest identifying a version of element_styles.json."""
+    return hashlib.sha256(source).hexdigest()
+
+
+def _resolve_css(
+    entry: dict[str, Any],
+    templates: dict[str, Any],
+    params: dict[str, str],
+    name: str,
+) -> dict[str, dict[str, dict[str, Optional[str]]]]:
+    """Resolve the property mapping of an element or template entry."""
+    if "template" not in entry:
+        # Declaration dicts are shared between all entries using the template,
+        # equal selectors share one string like keys parsed by json
+        return {
+            prop: {
+                sys.intern(selector.format_map(params)): sel_css
+                for selector, sel_css in css_for_selectors.items()
+            }
+            for prop, css_for_selectors in entry["css"].items()
+        }
+
+    template_name = entry["template"]
+    if template_name not in templates:
+        msg = f"Unknown style template '{template_name}' referenced by '{name}'."
+        raise ValueError(msg)
+
+    entry_params = {
+        key: value.format_map(params) for key, value in entry.get("params", {}).items()
+    }
+    return _resolve_css(
+        templates[template_name],
+        templates,
+        {**params, **entry_params},
+        template_name,
+    )
+
+
+def expand_styles(schema: dict[str, Any]) -> dict[str, Any]:
+    """
+    Expand the templated element_styles.json schema into the element style table.
+
+    Args:
+        schema: Parsed element_styles.json with "templates" and "elements"
+
+    Returns:
+        Dictionary of element name to {"css": ..., "category": ..., ...}
+
+    Raises:
+        ValueError: If an entry references an unknown template or a selector
+            uses a parameter that is not set
+    """
+    templates = schema.get("templates", {})
+
+    elements: dict[str, Any] = {}
+    for element, entry in schema["elements"].items():
+        try:
+            css = _resolve_css(entry, templates, {}, element)
+        except KeyError as e:
+            msg = f"Style template parameter {e} is not set for '{element}'."
+            raise ValueError(msg) from None
+
+        element_style = {"css": css}
+        element_style.update(
+            (key, value)
+            for key, value in entry.items()
+            if key not in ("css", "template", "params")
+        )
+        elements[element] = element_style
+
+    return elements
+
+
+def compile_index(source: bytes) -> StyleIndex:
+    """
+    Compile the contents of element_styles.json into a StyleIndex.
+
+    Args:
+        source: Raw bytes of element_styles.json
+
+    Returns:
+        StyleIndex with the parsed table and the flat property lookup
+    """
+    elements = expand_styles(json.loads(source))
+
+    # Equal declarations share one tuple
+    declarations: dict[Declarations, Declarations] = {}
+
+    properties: dict[tuple[str, str], PropertyTemplates] = {}
+    for element, element_style in elements.items():
+        for prop, css_for_selectors in element_style["css"].items():
+            templates = []
+            for selector, sel_css in css_for_selectors.items():
+                decls = tuple(sel_css.items())
+                templates.append((selector, declarations.setdefault(decls, decls)))
+            properties[(element, prop)] = tuple(templates)
+
+    return StyleIndex(get_source_hash(source), elements, properties)
+
+
+def freeze(value: Any, frozen: Optional[dict[int, Any]] = None) -> Any:
+    """
+    Convert nested dicts and lists into read-only mappings and tuples.
+
+    Args:
+        value: Value to freeze, other types are returned unchanged
+        frozen: Frozen values keyed on id of the original, so objects shared
+            within value (e.g. declarations of a template) stay shared
+
+    Returns:
+        MappingProxyType for dicts, tuple for lists
+    """
+    if not isinstance(value, (dict, list)):
+        return value
+
+    if frozen is None:
+        frozen = {}
+    result = frozen.get(id(value))
+    if result is None:
+        if isinstance(value, dict):
+            result = MappingProxyType(
+                {key: freeze(item, frozen) for key, item in value.items()}
+            )
+        else:
+            result = tuple(freeze(item, frozen) for item in value)
+        frozen[id(value)] = result
+    return result
+
+
+def freeze_index(index: StyleIndex) -> StyleIndex:
+    """Get a copy of index whose element table and property lookup are read-only."""
+    return StyleIndex(
+        index.source_hash,
+        freeze(index.elements),
+        MappingProxyType(dict(index.properties)),
+    )
+
+
+def build_element_index(elements: Mapping[str, Any]) -> ElementIndex:
+    """
+    Build the element name, variant and category lookups of a style table.
+
+    Args:
+        elements: Expanded element style table
+
+    Returns:
+        ElementIndex with tuples and read-only mappings
+    """
+    variants: dict[str, list[str]] = {element: [] for element in elements}
+    categories: dict[str, dict[str, set[str]]] = {}
+
+    for element, element_style in elements.items():
+        match = _VARIANT_PATTERN.match(element)
+        if match:
+            base_element, variant = match.group("base", "variant")
+            if base_element in variants:
+                variants[base_element].append(variant)
+        else:
+            # Base elements are listed with the default variant
+            base_element, variant = element, "primary"
+
+        category = element_style.get("category", "unknown")
+        categories.setdefault(category, {}).setdefault(base_element, set()).add(variant)
+
+    return ElementIndex(
+        names=tuple(sorted(elements)),
+        base_names=tuple(
+            sorted(
+                element for element in elements if not _VARIANT_PATTERN.match(element)
+            )
+        ),
+        variants=MappingProxyType(
+            {element: tuple(found) for element, found in variants.items()}
+        ),
+        categories=MappingProxyType(
+            {
+                category: MappingProxyType(
+                    {
+                        base_element: tuple(sorted(found))
+                        for base_element, found in sorted(category_elements.items())
+                    }
+                )
+                for category, category_elements in sorted(categories.items())
+            }
+        ),
+    )
+
+
+def build_index(
+    styles_path: Path = STYLES_PATH, index_path: Path = INDEX_PATH
+) -> StyleIndex:
+    """
+    Compile element_styles.json and write the index file.
+
+    Args:
+        styles_path: Path of the JSON style table
+        index_path: Path the pickled index is written to
+
+    Returns:
+        The compiled StyleIndex
+    """
+    index = compile_index(styles_path.read_bytes())
+    payload = {"version": INDEX_VERSION, **index._asdict()}
+    index_path.write_bytes(pickle.dumps(payload, protocol=4))
+    return index
+
+
+def read_index(index_path: Path, source_hash: str) -> Optional[StyleIndex]:
+    """
+    Read a pickled index if it matches the given JSON hash.
+
+    Returns:
+        The StyleIndex, or None if the file is missing, unreadable, of another
+        index version or built from a different element_styles.json.
+    """
+    try:
+        # The index is package data written by build_index, not user input
+        payload = pickle.loads(index_path.read_bytes())  # noqa: S301
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+
+    if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+        return None
+    if payload.get("source_hash") != source_hash:
+        return None
+
+    return StyleIndex(
+        payload["source_hash"], payload["elements"], payload["properties"]
+    )
+
+
+def load_index(
+    styles_path: Path = STYLES_PATH, index_path: Path = INDEX_PATH
+) -> StyleIndex:
+    """
+    Load the style index, compiling it from the JSON if the index is stale.
+
+    Args:
+        styles_path: Path of the JSON style table
+        index_path: Path of the pickled index
+
+    Returns:
+        Frozen StyleIndex matching the current element_styles.json
+    """
+    source = styles_path.read_bytes()
+    index = read_index(index_path, get_source_hash(source))
+    if index is None:
+        index = compile_index(source)
+    return freeze_index(index)
+
+
+if __name__ == "__main__":
+    built = build_index()
+    sys.stdout.write(
+        f"Wrote {INDEX_PATH.name}: {len(built.elements)} elements, "
+        f"{len(built.properties)} properties (sha256 {built.source_hash[:12]})\n"
+    )
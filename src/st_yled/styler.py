@@ -1,44 +1,606 @@
-import json
+import functools
+import hashlib
 from pathlib import Path
 from typing import Any, Optional
-import re
+from collections.abc import Iterable, Mapping
+import inspect
+import os
+import sys
+import time
 import warnings
-import traceback
+from contextvars import ContextVar
+from types import FrameType
 
 import streamlit as st
-
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+try:
+    from streamlit.runtime.scriptrunner_utils.script_run_context import ThreadState
+except ImportError:  # Streamlit versions keeping the fragment id on the context
+    ThreadState = None  # type: ignore
+
+from st_yled.cache import LRUCache  # type: ignore
+from st_yled.compiler import CompiledRules, compile_css_rules  # type: ignore
+from st_yled.compiler import get_css_properties_from_args  # type: ignore
+from st_yled.compiler import load_style_index, render_css_rules  # type: ignore
+from st_yled.compiler import render_theme_css  # type: ignore
+from st_yled.css import minify_css  # type: ignore
+from st_yled.style_index import ElementIndex  # type: ignore
+from st_yled.style_index import build_element_index  # type: ignore
+from st_yled.validation import get_validation_cache_info  # type: ignore
+from st_yled.validation import StyleValidator  # type: ignore
 from st_yled.validation import validate_styling_kwargs  # type: ignore
+from st_yled.validation import validate_styling_theme  # type: ignore
 from st_yled.validation import ValidationConfig  # type: ignore
 from st_yled.validation import ValidationError  # type: ignore
 
 dirpath = Path(__file__).parent
 
-with (dirpath / "element_styles.json").open() as f:
-    ELEMENT_STYLES = json.load(f)
 
+def load_element_styles() -> Mapping[str, Any]:
+    """Get the read-only element style table, loading the style index on first use."""
+    return load_style_index().elements
 
-def extract_caller_path_hash() -> str:
-    traceback_stack = traceback.extract_stack()
-
-    exec_line = False
-    caller_path = ""
-    # Traverse traceback in reverse order
-    for line in traceback_stack[::-1]:
-        if exec_line:
-            caller_path = line.filename
-            break
-        if isinstance(line.line, str) and line.line.startswith(
-            "exec(code, module.__dict__)"
+
+@functools.cache
+def load_element_index() -> ElementIndex:
+    """Get the element name, variant and category lookups, built on first use."""
+    return build_element_index(load_element_styles())
+
+
+def __getattr__(name: str) -> Any:
+    # ELEMENT_STYLES is loaded lazily on first access (PEP 562)
+    if name == "ELEMENT_STYLES":
+        return load_element_styles()
+    msg = f"module '{__name__}' has no attribute '{name}'"
+    raise AttributeError(msg)
+
+
+# Frames executing Streamlit scripts live in these directories
+SCRIPT_RUNNER_DIRS = (str(Path(st.__file__).parent),)
+
+# Memo dicts below are shared by all sessions without a lock: single get and
+# set calls are atomic and racing threads store the same value
+
+# Resolved caller hashes keyed on script path
+_CALLER_PATH_HASHES: dict[str, str] = {}
+
+# Call site ids keyed on (file, line)
+_CALL_SITE_IDS: dict[tuple[str, int], str] = {}
+
+# Compiled rule bodies keyed on (component_type, styling kwargs)
+CSS_RULE_CACHE = LRUCache(maxsize=1024)
+
+# Compiled theme stylesheets keyed on (theme items, validation settings, minify)
+THEME_CACHE = LRUCache(maxsize=32)
+
+# Contents of user CSS files keyed on (path, mtime_ns, size)
+CSS_FILE_CACHE = LRUCache(maxsize=16)
+
+# Resolved user CSS file paths keyed on (css_path, working directory)
+_CSS_FILE_PATHS: dict[tuple[Optional[str], str], Path] = {}
+
+# Supported values of StylerConfig.KEY_STRATEGY
+KEY_STRATEGIES = ("counter", "callsite")
+
+# Key prefix for elements sharing a content-addressed style rule
+SHARED_KEY_PREFIX = "st-yler-s"
+
+# Key prefix for elements styled through CSS custom properties
+VARIABLES_KEY_PREFIX = "st-yler-v-"
+
+# Prefixes of st.session_state entries created by st_yled or its auto-generated keys
+ST_YLED_KEY_PREFIXES = (
+    "st-yled-",
+    "st-yler-comp-",
+    SHARED_KEY_PREFIX,
+    VARIABLES_KEY_PREFIX,
+)
+
+
+class StylerConfig:
+    """Global configuration for CSS generation and emission."""
+
+    # Emit one rule per distinct style combination instead of one rule per key
+    SHARED_CLASSES = False
+
+    # Collect CSS of a script run and emit it as one stylesheet on flush
+    BATCH_CSS = False
+
+    # How auto-generated keys are numbered: "counter" numbers elements in call
+    # order, "callsite" derives keys from file, line and occurrence in the run
+    KEY_STRATEGY = "counter"
+
+    # Minify generated and user CSS before it is sent to the browser
+    MINIFY_CSS = True
+
+    # Style elements with auto-generated keys by setting CSS custom properties
+    # on their container, read by one static stylesheet emitted by init()
+    CSS_VARIABLES = False
+
+    # Runs after which the key counters and auto-generated keys of a script
+    # that did not call init() again are dropped, e.g. pages no longer visited
+    STALE_RUNS = 10
+
+    @classmethod
+    def configure(cls, **options: Any) -> None:
+        """
+        Update configuration options.
+
+        Args:
+            **options: Option names in lower case, e.g. shared_classes=True
+
+        Raises:
+            ValueError: If an option is unknown
+        """
+        for name, value in options.items():
+            attr = name.upper()
+            if not hasattr(cls, attr):
+                msg = f"Unknown st_yled configuration option '{name}'."
+                raise ValueError(msg)
+            if attr == "KEY_STRATEGY" and value not in KEY_STRATEGIES:
+                msg = (
+                    f"Unknown key strategy '{value}'. Expected one of {KEY_STRATEGIES}."
+                )
+                raise ValueError(msg)
+            setattr(cls, attr, value)
+
+
+class CSSBatch:
+    """CSS collected during a script run, emitted as one stylesheet."""
+
+    def __init__(self, placeholder: Any) -> None:
+        self.placeholder = placeholder
+        self.rules: list[str] = []
+        self.flushed_count = 0
+
+    def add(self, css: str) -> None:
+        self.rules.append(css)
+
+    def pending(self) -> int:
+        """Get the number of rules added since the last flush."""
+        return len(self.rules) - self.flushed_count
+
+    def flush(self) -> None:
+        """Write all rules collected so far into the placeholder."""
+        if not self.pending():
+            return
+
+        # The placeholder is replaced, so the page keeps a single style element
+        separator = "" if StylerConfig.MINIFY_CSS else "\n"
+        stylesheet = separator.join(self.rules)
+        self.placeholder.html(f"<style>{stylesheet}</style>")
+        self.flushed_count = len(self.rules)
+
+        stats = get_styling_stats()
+        stats.add("style_emissions")
+        stats.add("css_bytes", len(stylesheet))
+
+
+class StylingStats:
+    """Counters of st_yled work in the current script run and the whole session."""
+
+    COUNTERS = (
+        "styled_calls",
+        "global_calls",
+        "theme_calls",
+        "style_emissions",
+        "css_bytes",
+        "css_bytes_saved",
+        "reused_styles",
+        "validation_seconds",
+        "key_generation_seconds",
+        "css_generation_seconds",
+    )
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.run: dict[str, float] = dict.fromkeys(self.COUNTERS, 0)
+        self.session: dict[str, float] = dict.fromkeys(self.COUNTERS, 0)
+
+    def start_run(self) -> None:
+        """Reset the per-run counters."""
+        self.runs += 1
+        self.run = dict.fromkeys(self.COUNTERS, 0)
+
+    def add(self, counter: str, value: float = 1) -> None:
+        self.run[counter] += value
+        self.session[counter] += value
+
+
+class RunState:
+    """
+    Bookkeeping of st_yled within script runs of one session.
+
+    Created by init() and kept in st.session_state, as every rerun and fragment
+    rerun may get a new ScriptRunContext. The context of a run caches the state,
+    so styled elements count keys and track emitted CSS without going through
+    st.session_state.
+    """
+
+    def __init__(self, stats: StylingStats) -> None:
+        self.stats = stats
+        # Next auto-generated key number per caller hash
+        self.counters: dict[str, int] = {}
+        # Occurrences per call site per caller hash, for KEY_STRATEGY "callsite"
+        self.call_sites: dict[str, dict[str, int]] = {}
+        # Auto-generated keys per caller hash in its current and previous run
+        self.keys: dict[str, set[str]] = {}
+        self.previous_keys: dict[str, set[str]] = {}
+        # Number of started runs, and the run each caller hash was last started in
+        self.runs = 0
+        self.last_runs: dict[str, int] = {}
+        self.pruned_scripts = 0
+        self.pruned_keys = 0
+        # Hashes of shared style rules emitted in this run
+        self.shared_styles: set[str] = set()
+        self.css_batch: Optional[CSSBatch] = None
+        # Caller hash per fragment id, the script frame is not on the stack in
+        # fragment reruns
+        self.fragment_callers: dict[str, str] = {}
+        # Key numbering per fragment scope, restarted whenever the fragment runs
+        self.fragment_counters: dict[str, int] = {}
+        self.fragment_call_sites: dict[str, dict[str, int]] = {}
+        # Fragment scopes rendered in the current full run or fragment rerun
+        self.fragment_scopes: set[str] = set()
+        # fragment_ids_this_run of the current fragment rerun
+        self.fragment_run: Optional[list[str]] = None
+        # CSS emitted outside of fragments in the last full run, kept on the page
+        # by fragment reruns, and CSS emitted in the current fragment rerun
+        self.page_css: set[str] = set()
+        self.fragment_css: set[str] = set()
+
+    def start(self, caller_hash: str) -> set[str]:
+        """
+        Reset the state for a new run of the script identified by caller_hash.
+
+        Returns:
+            Auto-generated keys that are no longer rendered: keys of the
+            script's run before last that were missing in its last run, and all
+            keys of scripts not started within StylerConfig.STALE_RUNS runs.
+        """
+        self.runs += 1
+
+        last_keys = self.keys.get(caller_hash, set())
+        stale_keys = self.previous_keys.get(caller_hash, set()) - last_keys
+        self.previous_keys[caller_hash] = last_keys
+        self.keys[caller_hash] = set()
+
+        stale_callers = [
+            stale_hash
+            for stale_hash, last_run in self.last_runs.items()
+            if stale_hash != caller_hash
+            and self.runs - last_run > StylerConfig.STALE_RUNS
+        ]
+        for stale_hash in stale_callers:
+            stale_keys |= self.keys.pop(stale_hash) | self.previous_keys.pop(stale_hash)
+            del self.counters[stale_hash]
+            del self.call_sites[stale_hash]
+            del self.last_runs[stale_hash]
+            self._forget_fragments(stale_hash)
+
+        self.last_runs[caller_hash] = self.runs
+        self.counters[caller_hash] = 0
+        self.call_sites[caller_hash] = {}
+        self.shared_styles = set()
+        self.css_batch = None
+        self.fragment_scopes = set()
+        self.fragment_run = None
+        self.page_css = set()
+        self.fragment_css = set()
+
+        self.pruned_scripts += len(stale_callers)
+        self.pruned_keys += len(stale_keys)
+        return stale_keys
+
+    def _forget_fragments(self, caller_hash: str) -> None:
+        """Drop the fragment bookkeeping of a pruned script."""
+        for fragment_id, fragment_caller in list(self.fragment_callers.items()):
+            if fragment_caller == caller_hash:
+                del self.fragment_callers[fragment_id]
+
+        scope_prefix = f"{caller_hash}-f"
+        for scope in [s for s in self.fragment_counters if s.startswith(scope_prefix)]:
+            del self.fragment_counters[scope]
+            del self.fragment_call_sites[scope]
+
+    def sync_fragment_run(self, fragment_run: Optional[list[str]]) -> bool:
+        """
+        Check for a fragment rerun, resetting the fragment state when one starts.
+
+        Args:
+            fragment_run: fragment_ids_this_run of the ScriptRunContext, a new
+                list for every fragment rerun and empty or None in full runs
+
+        Returns:
+            True if the current run only reruns fragments
+        """
+        if not fragment_run:
+            return False
+
+        if fragment_run is not self.fragment_run:
+            self.fragment_run = fragment_run
+            self.fragment_scopes = set()
+            self.fragment_css = set()
+        return True
+
+    def enter_fragment(self, caller_hash: str, fragment_id: str) -> str:
+        """
+        Get the key scope of a fragment, restarting its numbering on its first
+        styled element in the current run.
+
+        Args:
+            caller_hash: Hash of the script defining the fragment
+            fragment_id: Id of the running fragment
+
+        Returns:
+            Scope used in the auto-generated keys of the fragment's elements
+        """
+        scope = f"{caller_hash}-f{fragment_id[:12]}"
+        if scope not in self.fragment_scopes:
+            self.fragment_scopes.add(scope)
+            self.fragment_counters[scope] = 0
+            self.fragment_call_sites[scope] = {}
+        return scope
+
+    def footprint(self) -> dict[str, int]:
+        """
+        Get the size of the tracked state.
+
+        Returns:
+            Dictionary with the number of tracked scripts, fragments, call
+            sites and auto-generated keys, the approximate bytes they use, and
+            the totals of pruned scripts and keys.
+        """
+        key_sets = (*self.keys.values(), *self.previous_keys.values())
+        containers = (
+            self.counters,
+            self.call_sites,
+            self.keys,
+            self.previous_keys,
+            self.last_runs,
+            self.shared_styles,
+            self.fragment_callers,
+            self.fragment_counters,
+            self.fragment_call_sites,
+            self.page_css,
+            self.fragment_css,
+            *self.call_sites.values(),
+            *self.fragment_call_sites.values(),
+            *key_sets,
+        )
+        tracked_keys = set().union(*key_sets)
+        return {
+            "scripts": len(self.counters),
+            "fragments": len(self.fragment_counters),
+            "call_sites": sum(len(sites) for sites in self.call_sites.values())
+            + sum(len(sites) for sites in self.fragment_call_sites.values()),
+            "tracked_keys": len(tracked_keys),
+            "bytes": sum(sys.getsizeof(container) for container in containers)
+            + sum(sys.getsizeof(key) for key in tracked_keys),
+            "pruned_scripts": self.pruned_scripts,
+            "pruned_keys": self.pruned_keys,
+        }
+
+
+# Run state outside of a ScriptRunContext, e.g. in bare mode or tests
+RUN_STATE: ContextVar[Optional[RunState]] = ContextVar(
+    "st_yled_run_state", default=None
+)
+
+# Key of the RunState in st.session_state
+RUN_STATE_KEY = "st-yled-run-state"
+
+# Attribute caching the RunState on the ScriptRunContext
+RUN_STATE_ATTR = "_st_yled_run_state"
+
+
+def get_run_state() -> Optional[RunState]:
+    """Get the run state of the current session, or None before init()."""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None:
+        return RUN_STATE.get()
+
+    state = getattr(ctx, RUN_STATE_ATTR, None)
+    if state is None:
+        # First lookup in this context, e.g. in a fragment rerun
+        state = st.session_state.get(RUN_STATE_KEY)
+        if state is not None:
+            setattr(ctx, RUN_STATE_ATTR, state)
+    return state
+
+
+def get_fragment_id() -> Optional[str]:
+    """Get the id of the st.fragment currently running, or None outside fragments."""
+    if ThreadState is None:
+        ctx = get_script_run_ctx(suppress_warning=True)
+        return getattr(ctx, "current_fragment_id", None)
+
+    try:
+        return ThreadState.get().fragment_id
+    except RuntimeError:
+        # No script thread, e.g. in bare mode or tests
+        return None
+
+
+def is_fragment_rerun(state: RunState) -> bool:
+    """Check whether the current run only reruns fragments."""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return state.sync_fragment_run(getattr(ctx, "fragment_ids_this_run", None))
+
+
+def start_run_state(caller_hash: str) -> RunState:
+    """
+    Start a script run: reset key counters and per-run bookkeeping.
+
+    The state is created on the first run and kept in st.session_state, so it
+    outlives the ScriptRunContext of a run. Session state entries of
+    auto-generated keys that are no longer rendered are removed, and a warning
+    is shown if the last run ended with batched CSS that was never flushed.
+
+    Args:
+        caller_hash: Hash of the script calling st_yled.init()
+
+    Returns:
+        The run state
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    state = RUN_STATE.get() if ctx is None else st.session_state.get(RUN_STATE_KEY)
+    if state is None:
+        state = RunState(st.session_state.setdefault("st-yled-stats", StylingStats()))
+        if ctx is None:
+            RUN_STATE.set(state)
+        else:
+            st.session_state[RUN_STATE_KEY] = state
+    if ctx is not None:
+        setattr(ctx, RUN_STATE_ATTR, state)
+
+    # The last run ended before flush(), e.g. by st.stop(), st.rerun() or an error
+    if state.css_batch is not None and state.css_batch.pending():
+        warnings.warn(
+            f"{state.css_batch.pending()} CSS rules batched in the last run were "
+            "never shown. Call st_yled.flush() at the end of the script when "
+            "batch_css is enabled.",
+            stacklevel=3,
+        )
+
+    for key in state.start(caller_hash):
+        if key in st.session_state:
+            del st.session_state[key]
+
+    state.stats.start_run()
+    return state
+
+
+def get_styling_stats() -> StylingStats:
+    """Get the statistics of the current session."""
+    state = get_run_state()
+    if state is not None:
+        return state.stats
+    return st.session_state.setdefault("st-yled-stats", StylingStats())
+
+
+def get_stats_report() -> dict[str, Any]:
+    """
+    Get a report of st_yled statistics.
+
+    Returns:
+        Dictionary with counters of the current run ('run'), cumulative
+        counters of the session ('session', including the number of runs),
+        hit/miss statistics of the process-wide caches ('caches') and the
+        memory footprint of the session ('footprint').
+    """
+    stats = get_styling_stats()
+    return {
+        "run": dict(stats.run),
+        "session": {**stats.session, "runs": stats.runs},
+        "caches": {
+            "css_rules": get_css_cache_info(),
+            "validation": get_validation_cache_info(),
+            "themes": THEME_CACHE.info(),
+            "css_files": CSS_FILE_CACHE.info(),
+        },
+        "footprint": get_footprint_report(),
+    }
+
+
+def get_footprint_report() -> dict[str, int]:
+    """
+    Get the memory footprint of st_yled in the current session.
+
+    Returns:
+        Dictionary with the tracked scripts, call sites and auto-generated keys,
+        their approximate size in bytes, the totals pruned so far, and the
+        number of st.session_state entries created by st_yled or keyed with
+        auto-generated keys ('session_state_entries').
+    """
+    state = get_run_state()
+    report = (
+        state.footprint()
+        if state is not None
+        else {
+            "scripts": 0,
+            "fragments": 0,
+            "call_sites": 0,
+            "tracked_keys": 0,
+            "bytes": 0,
+            "pruned_scripts": 0,
+            "pruned_keys": 0,
+        }
+    )
+    report["session_state_entries"] = sum(
+        1
+        for key in st.session_state
+        if isinstance(key, str) and key.startswith(ST_YLED_KEY_PREFIXES)
+    )
+    return report
+
+
+def _find_script_path(frame: Optional[FrameType]) -> str:
+    """Walk outwards from frame to the module frame of the script run by Streamlit."""
+    while frame is not None:
+        caller = frame.f_back
+        # Streamlit runs scripts (and st.navigation pages) via exec(code, module.__dict__)
+        if (
+            caller is not None
+            and frame.f_code.co_name == "<module>"
+            and caller.f_code.co_filename.startswith(SCRIPT_RUNNER_DIRS)
         ):
-            exec_line = True
+            return frame.f_code.co_filename
+        frame = caller
+    return ""
+
+
+def extract_caller_path_hash() -> str:
+    """
+    Get a hash identifying the Streamlit script st_yled is called from.
+
+    The result for each script path is cached, so a lookup only costs a walk
+    over the frames between the caller and the executed script.
+    """
+    frame = inspect.currentframe()
+    caller_path = _find_script_path(frame.f_back if frame is not None else None)
 
     if caller_path == "":
         warnings.warn("Could not extract caller path from traceback.")
 
-    return str(hash(caller_path))
+    caller_hash = _CALLER_PATH_HASHES.get(caller_path)
+    if caller_hash is None:
+        caller_hash = str(hash(caller_path))
+        _CALLER_PATH_HASHES[caller_path] = caller_hash
+
+    return caller_hash
+
+
+def get_call_site_id() -> str:
+    """
+    Get an id for the line of user code that called into st_yled.
+
+    Returns:
+        Short hex digest of the file and line number of the first frame
+        outside the st_yled package.
+    """
+    package_dir = str(dirpath) + os.sep
+    frame = inspect.currentframe()
+    while frame is not None and frame.f_code.co_filename.startswith(package_dir):
+        frame = frame.f_back
+
+    if frame is None:
+        return "0"
+
+    call_site = (frame.f_code.co_filename, frame.f_lineno)
+    site_id = _CALL_SITE_IDS.get(call_site)
+    if site_id is None:
+        digest = hashlib.sha1(
+            f"{call_site[0]}:{call_site[1]}".encode(), usedforsecurity=False
+        )
+        site_id = digest.hexdigest()[:8]
+        _CALL_SITE_IDS[call_site] = site_id
+
+    return site_id
 
 
-def get_element_style(element_name: str) -> dict:
+def get_element_style(element_name: str) -> Mapping[str, Any]:
     """
     Get the style definition for a given element name.
 
@@ -46,7 +608,7 @@ def get_element_style(element_name: str) -> dict:
         element_name: The name of the element to retrieve the style for.
 
     Returns:
-        A dictionary containing the style definition if found, else None.
+        A read-only mapping containing the style definition.
 
     Example:
         >>> get_element_style("button")
@@ -55,235 +617,611 @@ def get_element_style(element_name: str) -> dict:
                 ".stButton > button": {
                     "background-color": None
     """
+    element_styles = load_element_styles()
 
-    return ELEMENT_STYLES[element_name]
+    return element_styles[element_name]
 
 
-def get_stylable_elements(include_variants: bool = True) -> list[str]:
+def get_stylable_elements(include_variants: bool = True) -> tuple[str, ...]:
     """
-    Get a list of all stylable component names from ELEMENT_STYLES.
+    Get all stylable component names from ELEMENT_STYLES.
 
     Args:
         include_variants: If True, includes variants like 'button_primary', 'button_secondary'.
                          If False, only returns base components like 'button'.
 
     Returns:
-        Sorted list of component names that can be styled.
+        Sorted tuple of component names that can be styled.
 
     Example:
         >>> get_stylable_elements(include_variants=False)
-        ['button', 'caption', 'code', ...]
+        ('button', 'caption', 'code', ...)
         >>> get_stylable_elements(include_variants=True)
-        ['button', 'button_primary', 'button_secondary', 'caption', ...]
+        ('button', 'button_primary', 'button_secondary', 'caption', ...)
     """
-    if include_variants:
-        return sorted(ELEMENT_STYLES.keys())
+    element_index = load_element_index()
 
-    # Filter out variants ending with _primary, _secondary, _tertiary
-    variant_pattern = re.compile(r".*_(primary|secondary|tertiary)$")
-    base_elements = [
-        key for key in ELEMENT_STYLES.keys() if not variant_pattern.match(key)
-    ]
-    return sorted(base_elements)
+    if include_variants:
+        return element_index.names
+    return element_index.base_names
 
 
-def get_stylable_elements_by_category() -> dict[str, dict[str, list[str]]]:
+def get_stylable_elements_by_category() -> Mapping[str, Mapping[str, tuple[str, ...]]]:
     """
     Get stylable components organized by category with variants.
 
-    Args:
-        include_variants: If True, includes variants like 'button_primary', 'button_secondary'.
-                         If False, only returns base components with 'primary' as default variant.
-
     Returns:
-        Nested dictionary structure:
+        Read-only nested mapping:
         {
             'category': {
-                'element': ['variant1', 'variant2', ...]
+                'element': ('variant1', 'variant2', ...)
             }
         }
 
-        If no variants are found for an element, defaults to ['primary'].
+        Base elements count as variant 'primary', so elements without variants
+        map to ('primary',).
 
     Example:
-        >>> get_stylable_elements_by_category(include_variants=True)
+        >>> get_stylable_elements_by_category()
         {
             'input': {
-                'button': ['primary', 'secondary', 'tertiary'],
-                'checkbox': ['primary'],
+                'button': ('primary', 'secondary', 'tertiary'),
+                'checkbox': ('primary',),
                 ...
             },
             'text': {
-                'caption': ['primary'],
-                'code': ['primary'],
+                'caption': ('primary',),
+                'code': ('primary',),
                 ...
             }
         }
     """
-    # Get all elements (always include variants to find them)
-    all_elements = sorted(ELEMENT_STYLES.keys())
+    return load_element_index().categories
 
-    # Group by category and base element
-    categories: dict[str, dict[str, list[str]]] = {}
 
-    # Pattern to extract base element and variant
-    variant_pattern = re.compile(
-        r"^(?P<base>.+?)_(?P<variant>primary|secondary|tertiary)$"
-    )
+def get_element_variants(element_name: str) -> tuple[str, ...]:
+    """
+    Get all variants for a given element name.
 
-    for element in all_elements:
-        if element not in ELEMENT_STYLES:
-            continue
+    Args:
+        element_name: The base name of the element (e.g., 'button').
 
-        category = ELEMENT_STYLES[element].get("category", "unknown")
+    Returns:
+        A tuple of variant names (e.g., ('primary', 'secondary', 'tertiary')).
+    """
+    try:
+        return load_element_index().variants[element_name]
+    except KeyError:
+        value_error_msg = f"Element '{element_name}' not found in stylable elements."
+        raise ValueError(value_error_msg) from None
 
-        # Check if this is a variant or base element
-        match = variant_pattern.match(element)
-        if match:
-            # This is a variant (e.g., button_primary)
-            base_element = match.group("base")
-            variant = match.group("variant")
-        else:
-            # This is a base element (e.g., button)
-            base_element = element
-            variant = "primary"  # Default variant
 
-        # Initialize category if not exists
-        if category not in categories:
-            categories[category] = {}
+def generate_component_key(
+    style_hash: Optional[str] = None, key_prefix: Optional[str] = None
+) -> str:
+    """
+    Generate a unique component key for st_yled components.
 
-        # Initialize base element if not exists
-        if base_element not in categories[category]:
-            categories[category][base_element] = []
+    Args:
+        style_hash: Content hash of the component styling. If set, the key is
+            prefixed so that all elements with this styling match one shared rule.
+        key_prefix: Prefix of the key, e.g. the markers of CSS variables mode.
+            Takes precedence over style_hash.
+
+    Elements inside an st.fragment are numbered per fragment, so their keys
+    are the same in full runs and in reruns of the fragment alone.
+    """
+
+    state = get_run_state()
+    fragment_id = get_fragment_id()
+
+    caller_hash = None
+    if fragment_id is not None and state is not None:
+        caller_hash = state.fragment_callers.get(fragment_id)
+    if caller_hash is None:
+        caller_hash = extract_caller_path_hash()
+
+    if state is None or caller_hash not in state.counters:
+        error_msg = "Run state not initialized for st_yled component key generation.\n\nWas st_yled.init() called?"
+        raise ValidationError(error_msg)
+
+    if fragment_id is None:
+        scope = caller_hash
+        counters, scope_call_sites = state.counters, state.call_sites
+    else:
+        state.fragment_callers[fragment_id] = caller_hash
+        is_fragment_rerun(state)
+        scope = state.enter_fragment(caller_hash, fragment_id)
+        counters, scope_call_sites = state.fragment_counters, state.fragment_call_sites
+
+    if StylerConfig.KEY_STRATEGY == "callsite":
+        # Number repeated calls from the same line (e.g. in loops) per run
+        site_id = get_call_site_id()
+        call_sites = scope_call_sites[scope]
+        occurrence = call_sites.get(site_id, 0)
+        call_sites[site_id] = occurrence + 1
+        key_suffix = f"{site_id}-{occurrence}"
+    else:
+        key_suffix = str(counters[scope])
+        counters[scope] += 1
 
-        # Add variant if not already present
-        if variant not in categories[category][base_element]:
-            categories[category][base_element].append(variant)
+    if key_prefix is not None:
+        comp_key = f"{key_prefix}{scope}-{key_suffix}"
+    elif style_hash is None:
+        comp_key = f"st-yler-comp-{scope}-{key_suffix}"
+    else:
+        comp_key = f"{SHARED_KEY_PREFIX}{style_hash}-{scope}-{key_suffix}"
 
-    # Sort variants within each element and sort elements within each category
-    for category in categories:
-        # Sort elements in category
-        sorted_elements = dict(sorted(categories[category].items()))
-        # Sort variants for each element
-        for element in sorted_elements:
-            sorted_elements[element].sort()
-        categories[category] = sorted_elements
+    # Tracked to remove the state of elements that are no longer rendered
+    state.keys[caller_hash].add(comp_key)
 
-    return dict(sorted(categories.items()))
+    return comp_key
 
 
-def get_element_variants(element_name: str) -> list[str]:
+def get_style_hash(
+    component_type: str, component_kwargs: dict[str, Any]
+) -> Optional[str]:
     """
-    Get all variants for a given element name.
+    Get a content hash of the styling kwargs of a component.
 
     Args:
-        element_name: The base name of the element (e.g., 'button').
+        component_type: Type of component (e.g., 'button', 'text')
+        component_kwargs: Component keyword arguments including styling properties
 
     Returns:
-        A list of variant names (e.g., ['primary', 'secondary', 'tertiary']).
+        Short hex digest identifying the style combination, or None if the
+        kwargs contain no styling properties for this component.
     """
-    variants = []
-    if element_name not in ELEMENT_STYLES:
-        value_error_msg = f"Element '{element_name}' not found in stylable elements."
-        raise ValueError(value_error_msg)
+    element_styles = load_element_styles()
+
+    if component_type not in element_styles:
+        return None
+
+    style_mappings = element_styles[component_type]["css"]
+    styling_items = [
+        (arg, val) for arg, val in component_kwargs.items() if arg in style_mappings
+    ]
+    if not styling_items:
+        return None
+
+    digest = hashlib.sha1(
+        repr((component_type, styling_items)).encode(), usedforsecurity=False
+    )
+    return digest.hexdigest()[:12]
+
+
+def get_variable_name(component_type: str, styled_prop: str) -> str:
+    """Get the CSS custom property holding a styling property of a component type."""
+    return f"--sty-{component_type}-{styled_prop}"
+
+
+def get_variables_key_prefix(
+    component_type: str, component_kwargs: dict[str, Any]
+) -> Optional[str]:
+    """
+    Get the key prefix of an element styled in CSS variables mode.
+
+    The prefix marks the component type and each property the element sets,
+    e.g. 'st-yler-v-button--color--font_size--', which the rules of the
+    static variables stylesheet match on.
+
+    Returns:
+        The key prefix, or None if the kwargs contain no styling properties
+        for this component type.
+    """
+    properties = load_style_index().properties
+    styled_props = sorted(
+        arg for arg in component_kwargs if (component_type, arg) in properties
+    )
+    if not styled_props:
+        return None
+
+    markers = "".join(f"{prop}--" for prop in styled_props)
+    return f"{VARIABLES_KEY_PREFIX}{component_type}--{markers}"
+
+
+@functools.lru_cache(maxsize=2)
+def compile_variables_stylesheet(minify: bool) -> str:
+    """
+    Compile the static stylesheet of CSS variables mode.
+
+    Every selector of the style table reads its value from the custom property
+    named by get_variable_name(). A rule only matches elements whose key marks
+    its component type and property, so unset custom properties never reset
+    the styles of other elements.
+
+    Args:
+        minify: Whether to minify the stylesheet
 
-    for element in ELEMENT_STYLES:
-        if element.startswith(f"{element_name}_"):
-            match = re.match(
-                rf"{re.escape(element_name)}_(primary|secondary|tertiary)$", element
+    Returns:
+        The stylesheet, compiled once per process
+    """
+    css_properties: list[tuple[str, dict[str, str]]] = []
+    for (component_type, prop), templates in load_style_index().properties.items():
+        prefix = (
+            f'[class*="st-key-{VARIABLES_KEY_PREFIX}{component_type}--"]'
+            f'[class*="--{prop}--"]'
+        )
+        value = f"var({get_variable_name(component_type, prop)})"
+        for selector, declarations in templates:
+            css_properties.append(
+                (
+                    f"{prefix} {selector}" if selector else prefix,
+                    {
+                        css_prop: value if fixed_value is None else fixed_value
+                        for css_prop, fixed_value in declarations
+                    },
+                )
             )
-            if match:
-                variants.append(match.group(1))
 
-    return variants
+    css_rules, _ = compile_css_rules(css_properties, minify)
+    return render_css_rules(css_rules, "", minify)
+
 
+def generate_variables_css(
+    component_type: str, component_kwargs: dict[str, Any], component_key: str
+) -> str:
+    """
+    Generate the custom property declarations of an element in CSS variables mode.
 
-def generate_component_key() -> str:
-    """Generate a unique component key for st_yled components."""
+    Styling properties are removed from component_kwargs.
 
-    caller_hash = extract_caller_path_hash()
+    Args:
+        component_type: Type of component (e.g., 'button', 'text')
+        component_kwargs: Component keyword arguments including styling properties
+        component_key: Key of the element, generated with get_variables_key_prefix()
 
-    if f"st-yled-comp-{caller_hash}-counter" not in st.session_state:
-        error_msg = "Session State not initialized for st_yled component key generation.\n\nWas st_yled.init() called?"
-        raise ValidationError(error_msg)
+    Returns:
+        A rule setting the custom properties on the element's container
+    """
+    properties = load_style_index().properties
+    styled_props = [
+        arg for arg in component_kwargs if (component_type, arg) in properties
+    ]
+    declarations = [
+        (get_variable_name(component_type, prop), component_kwargs.pop(prop))
+        for prop in styled_props
+    ]
 
-    comp_counter = st.session_state[f"st-yled-comp-{caller_hash}-counter"]
-    comp_key = f"st-yler-comp-{caller_hash}-{comp_counter}"
+    if StylerConfig.MINIFY_CSS:
+        body = ";".join(f"{name}:{value}" for name, value in declarations)
+        return f".st-key-{component_key}{{{body}}}"
 
-    st.session_state[f"st-yled-comp-{caller_hash}-counter"] += 1
+    body = "\n".join(f"    {name}: {value};" for name, value in declarations)
+    return f".st-key-{component_key} {{\n{body}\n}}"
 
-    return comp_key
 
+def emit_variables_stylesheet() -> None:
+    """Emit the static stylesheet of CSS variables mode for this run."""
+    emit_css(compile_variables_stylesheet(StylerConfig.MINIFY_CSS))
 
-def get_css_properties_from_args(
-    component_type: str, component_kwargs: dict[str, Any]
-) -> dict[str, dict[str, str]]:
-    """Get CSS properties from component arguments."""
-
-    css_properties: dict[str, dict[str, str]] = {}
-
-    if component_type in ELEMENT_STYLES:
-        # Return dict of css properties and selectors for component
-        style_mappings = ELEMENT_STYLES[component_type]["css"]
-
-        args_to_remove = []
-
-        # Loop over component arguments and check if those are in style mappings
-        for comp_arg in component_kwargs:
-            # Comp arg eg.g background_color
-            if comp_arg in style_mappings:
-                args_to_remove.append(comp_arg)
-                # Get css selectors for css property as a dict
-                css_for_selectors = style_mappings[comp_arg]
-
-                # [css_selector] > dict(css_property: css_value or None)
-                for sel, sel_css in css_for_selectors.items():
-                    # Update css values for selector. If css_value is set, then take over, else set comp_val
-                    new_sel_css = {}
-                    for k, v in sel_css.items():
-                        if v is None:
-                            new_sel_css[k] = component_kwargs[comp_arg]
-                        else:
-                            new_sel_css[k] = v
-
-                    if sel in css_properties:
-                        css_properties[sel].update(new_sel_css)
-                    else:
-                        css_properties[sel] = new_sel_css
-    else:
+
+def get_shared_selector_prefix(style_hash: str) -> str:
+    """Get the selector prefix matching every element keyed with style_hash."""
+    return f'[class*="st-key-{SHARED_KEY_PREFIX}{style_hash}-"] '
+
+
+@functools.lru_cache(maxsize=256)
+def get_style_keys(component_type: str) -> Optional[frozenset[str]]:
+    """
+    Get the kwargs that style a component type, including property aliases.
+
+    Returns:
+        Frozen set of styling kwargs, or None if the component type is unknown
+    """
+    element_style = load_style_index().elements.get(component_type)
+    if element_style is None:
+        return None
+
+    properties = element_style["css"].keys()
+    aliases = (
+        alias
+        for alias, prop in StyleValidator.PROPERTY_ALIASES.items()
+        if prop in properties
+    )
+    return frozenset((*properties, *aliases))
+
+
+def has_style_kwargs(component_type: str, kwargs: dict[str, Any]) -> bool:
+    """
+    Check whether a call passes styling kwargs.
+
+    Calls without them skip validation, CSS emission and the wrapping container
+    and go straight to the Streamlit element. They still take an auto-generated
+    key, so keys are numbered as for styled calls. Unknown component types
+    count as styled, so apply_component_css reports them.
+    """
+    style_keys = get_style_keys(component_type)
+    return style_keys is None or not style_keys.isdisjoint(kwargs)
+
+
+def apply_component_key(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """
+    Give a call without styling kwargs an auto-generated key.
+
+    Widgets called repeatedly with the same arguments need distinct keys, and
+    the key identifies their state as it would for a styled call.
+
+    Args:
+        kwargs: Component keyword arguments without styling properties
+
+    Returns:
+        The kwargs, with a key unless the caller passed one
+
+    Raises:
+        ValidationError: If init() did not start the run
+    """
+    if "key" not in kwargs:
+        kwargs["key"] = generate_component_key()
+    return kwargs
+
+
+def get_cache_items(
+    items: Iterable[tuple[str, Any]],
+) -> tuple[tuple[str, type, Any], ...]:
+    """
+    Get styling items for a cache key.
+
+    Values are paired with their type: 1, 1.0 and True are equal and hash the
+    same, but render as different CSS.
+    """
+    return tuple((arg, type(val), val) for arg, val in items)
+
+
+def _compile_css_rules(
+    component_type: str, component_kwargs: dict[str, Any], minify: bool
+) -> CompiledRules:
+    """Compile the rules for the styling kwargs of a component."""
+    css_properties = get_css_properties_from_args(component_type, component_kwargs)
+    return compile_css_rules(list(css_properties.items()), minify)
+
+
+def _generate_component_css(
+    component_type: str,
+    component_kwargs: dict[str, Any],
+    component_key: Optional[str],
+    selector_prefix: Optional[str] = None,
+) -> tuple[str, int]:
+    """Generate CSS for a component, returning it with the bytes minification saved."""
+    style_index = load_style_index()
+
+    if component_type not in style_index.elements:
         msg = f"Component type '{component_type}' not found. Are you sure this component exists?"
         raise ValueError(msg)
 
-    # Remove any args that were used for styling
-    for arg in args_to_remove:
-        del component_kwargs[arg]
+    minify = StylerConfig.MINIFY_CSS
+    styling_items = tuple(
+        (arg, val)
+        for arg, val in component_kwargs.items()
+        if (component_type, arg) in style_index.properties
+    )
+
+    try:
+        cache_key: Optional[tuple] = (
+            component_type,
+            get_cache_items(styling_items),
+            minify,
+        )
+        compiled = CSS_RULE_CACHE.get(cache_key)
+    except TypeError:
+        # Unhashable styling values cannot be cached
+        cache_key = None
+        compiled = None
+
+    if compiled is None:
+        compiled = _compile_css_rules(component_type, component_kwargs, minify)
+        if cache_key is not None:
+            CSS_RULE_CACHE.put(cache_key, compiled)
+    else:
+        for arg, _ in styling_items:
+            del component_kwargs[arg]
+
+    if selector_prefix is not None:
+        prefix = selector_prefix
+    elif component_key is None:
+        prefix = ""
+    else:
+        prefix = f".st-key-{component_key} "
 
-    return css_properties
+    css_rules, bytes_saved = compiled
+    return render_css_rules(css_rules, prefix, minify), bytes_saved
 
 
 def generate_component_css(
-    component_type: str, component_kwargs: dict[str, Any], component_key: Optional[str]
+    component_type: str,
+    component_kwargs: dict[str, Any],
+    component_key: Optional[str],
+    selector_prefix: Optional[str] = None,
 ) -> str:
-    """Generate CSS for a component."""
-    css_properties = get_css_properties_from_args(component_type, component_kwargs)
+    """
+    Generate CSS for a component.
 
-    if css_properties:
-        css_rules = []
-        for selector, properties in css_properties.items():
-            if component_key is None:
-                selector_plus_key = selector
-            else:
-                selector_plus_key = f".st-key-{component_key} {selector}"
+    Compiled rule bodies are cached in CSS_RULE_CACHE, so repeated calls with the
+    same styling only splice the `.st-key-{key}` prefix into the cached rules.
+    Styling properties are removed from component_kwargs. The CSS is minified
+    unless StylerConfig.MINIFY_CSS is disabled.
+
+    If selector_prefix is given, it is used instead of the prefix derived from
+    component_key.
+    """
+    css, _ = _generate_component_css(
+        component_type, component_kwargs, component_key, selector_prefix
+    )
+    return css
 
-            rules = [
-                f"    {prop}: {val} !important;" for prop, val in properties.items()
-            ]
-            rules_str = "\n".join(rules)
-            css_rule = f"{selector_plus_key} {{\n{rules_str}\n}}"
-            css_rules.append(css_rule)
 
-        return "\n".join(css_rules)
-    return ""
+def start_css_batch() -> None:
+    """
+    Create the stylesheet placeholder and an empty CSS batch for this run.
+
+    Raises:
+        ValidationError: If init() did not start the run
+    """
+    state = get_run_state()
+    if state is None:
+        msg = "Run state not initialized for st_yled CSS batching.\n\nWas st_yled.init() called?"
+        raise ValidationError(msg)
+    state.css_batch = CSSBatch(st.empty())
+
+
+def flush_css_batch() -> None:
+    """Emit all CSS batched in the current run into the stylesheet placeholder."""
+    state = get_run_state()
+    if state is not None and state.css_batch is not None:
+        state.css_batch.flush()
+
+
+def emit_css(css: str, bytes_saved: int = 0) -> None:
+    """
+    Emit CSS to the page.
+
+    If batching is enabled and init() created a batch for this run, the CSS is
+    buffered until flush_css_batch() is called.
+
+    In fragment reruns, CSS the last full run emitted outside of fragments is
+    still on the page and is not sent again. Other CSS is emitted inside the
+    fragment, as its previous output is replaced.
+
+    Args:
+        css: Stylesheet without style tags
+        bytes_saved: Bytes minification removed from css, reported in stats
+    """
+    stats = get_styling_stats()
+    if bytes_saved:
+        stats.add("css_bytes_saved", bytes_saved)
+
+    state = get_run_state()
+    if state is not None:
+        if is_fragment_rerun(state):
+            if css in state.page_css or css in state.fragment_css:
+                stats.add("reused_styles")
+                return
+            state.fragment_css.add(css)
+        elif StylerConfig.BATCH_CSS and state.css_batch is not None:
+            # The placeholder of the batch is created by init() outside of fragments
+            state.page_css.add(css)
+            state.css_batch.add(css)
+            return
+        elif get_fragment_id() is None:
+            state.page_css.add(css)
+
+    st.html(f"<style>{css}</style>")
+
+    stats.add("style_emissions")
+    stats.add("css_bytes", len(css))
+
+
+def get_css_cache_info() -> dict[str, Any]:
+    """
+    Get hit/miss statistics of the compiled CSS rule cache.
+
+    Returns:
+        Dictionary with hits, misses, evictions, size, maxsize and hit_rate.
+    """
+    return CSS_RULE_CACHE.info()
+
+
+def set_css_cache_size(maxsize: int) -> None:
+    """
+    Set the maximum number of compiled style combinations kept in the cache.
+
+    Args:
+        maxsize: Maximum number of entries. 0 disables caching.
+    """
+    CSS_RULE_CACHE.resize(maxsize)
+
+
+def clear_css_cache() -> None:
+    """Remove all compiled CSS rules from the cache and reset its counters."""
+    CSS_RULE_CACHE.clear()
+
+
+def read_css_file(path: Path) -> str:
+    """
+    Read a CSS file, reusing the cached contents while it is unchanged.
+
+    The file is only read again when its modification time or size changes.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    file_stat = path.stat()
+    cache_key = (str(path), file_stat.st_mtime_ns, file_stat.st_size)
+
+    content = CSS_FILE_CACHE.get(cache_key)
+    if content is None:
+        content = path.read_text(encoding="utf-8")
+        CSS_FILE_CACHE.put(cache_key, content)
+
+    return content
+
+
+def _resolve_css_file(css_path: Optional[str]) -> Optional[Path]:
+    """Find the user CSS file: css_path, then ./.streamlit and ~/.streamlit."""
+    if css_path:
+        css_file = Path(css_path)
+        if css_file.is_file():
+            return css_file
+        msg = f"CSS file not found at provided path: {css_path}"
+        raise FileNotFoundError(msg)
+
+    for css_file in (
+        Path.cwd() / ".streamlit" / "st-styled.css",
+        Path.home() / ".streamlit" / "st-styled.css",
+    ):
+        if css_file.is_file():
+            return css_file
+
+    return None
+
+
+def load_user_css(css_path: Optional[str] = None) -> Optional[str]:
+    """
+    Load the user CSS file applied by st_yled.init().
+
+    The resolved path is cached per working directory and the contents are
+    cached on (path, mtime, size), so reruns only stat the file.
+
+    Args:
+        css_path: Explicit path of the CSS file. If None, .streamlit/st-styled.css
+            in the working directory and then in the home directory are used.
+
+    Returns:
+        The CSS file contents, or None if no default CSS file exists.
+
+    Raises:
+        FileNotFoundError: If css_path is given but does not exist
+    """
+    path_key = (css_path, str(Path.cwd()))
+
+    css_file = _CSS_FILE_PATHS.get(path_key)
+    if css_file is not None:
+        try:
+            return read_css_file(css_file)
+        except FileNotFoundError:
+            # Resolve again, e.g. the home file is used if the local one was removed.
+            # Other sessions may drop the same stale path concurrently
+            _CSS_FILE_PATHS.pop(path_key, None)
+
+    css_file = _resolve_css_file(css_path)
+    if css_file is None:
+        return None
+
+    _CSS_FILE_PATHS[path_key] = css_file
+    return read_css_file(css_file)
+
+
+@functools.lru_cache(maxsize=16)
+def minify_user_css(css: str) -> str:
+    """Minify user CSS, memoized on the (cached) file contents."""
+    return minify_css(css)
+
+
+def clear_css_file_cache() -> None:
+    """Forget resolved user CSS file paths and cached contents."""
+    _CSS_FILE_PATHS.clear()
+    CSS_FILE_CACHE.clear()
+    minify_user_css.cache_clear()
 
 
 def apply_component_css(component_type: str, kwargs: dict[str, Any]) -> dict[str, Any]:
@@ -301,30 +1239,65 @@ def apply_component_css(component_type: str, kwargs: dict[str, Any]) -> dict[str
         ValidationError: If validation is in strict mode and validation fails
     """
 
+    stats = get_styling_stats()
+    stats.add("styled_calls")
+
     # Check if validation should be bypassed
-    bypass_validation = ValidationConfig.is_validation_bypassed()
-    strict_mode = ValidationConfig.get_strict_mode()
+    settings = ValidationConfig.get_settings()
 
     # Validate styling parameters if not bypassed
-    if not bypass_validation:
-        # TODO: Cache validation results
+    if not settings.bypass:
+        start = time.perf_counter()
         kwargs = validate_styling_kwargs(
             component_type=component_type,
             kwargs=kwargs,
-            strict=strict_mode,
+            strict=settings.strict,
             bypass_validation=False,
         )
+        stats.add("validation_seconds", time.perf_counter() - start)
 
     # Generate unique key if not provided
+    style_hash = None
+    key_prefix = None
     if "key" not in kwargs:
-        kwargs["key"] = generate_component_key()
+        start = time.perf_counter()
+        if StylerConfig.CSS_VARIABLES:
+            key_prefix = get_variables_key_prefix(component_type, kwargs)
+        elif StylerConfig.SHARED_CLASSES:
+            style_hash = get_style_hash(component_type, kwargs)
+        kwargs["key"] = generate_component_key(style_hash, key_prefix)
+        stats.add("key_generation_seconds", time.perf_counter() - start)
 
     # Generate and apply CSS
     # component kwargs are removed of styling properties
-    css = generate_component_css(component_type, kwargs, kwargs["key"])
+    start = time.perf_counter()
+    if key_prefix is not None:
+        # The static variables stylesheet holds the rules
+        css = generate_variables_css(component_type, kwargs, kwargs["key"])
+        bytes_saved = 0
+    elif style_hash is None:
+        css, bytes_saved = _generate_component_css(
+            component_type, kwargs, kwargs["key"]
+        )
+    else:
+        css, bytes_saved = _generate_component_css(
+            component_type,
+            kwargs,
+            None,
+            selector_prefix=get_shared_selector_prefix(style_hash),
+        )
+        # Emit the shared rule only for the first element using it in this run,
+        # emit_css dedupes the rules of fragment reruns itself
+        state = get_run_state()
+        if state is not None and not is_fragment_rerun(state):
+            if style_hash in state.shared_styles:
+                css = ""
+            else:
+                state.shared_styles.add(style_hash)
+    stats.add("css_generation_seconds", time.perf_counter() - start)
 
     if css:
-        st.html(f"<style>{css}</style>")
+        emit_css(css, bytes_saved)
 
     return kwargs
 
@@ -343,28 +1316,36 @@ def apply_component_css_global(
         ValidationError: If validation fails in strict mode
         ValueError: If component type or properties are invalid
     """
+    stats = get_styling_stats()
+    stats.add("global_calls")
+
     # Check if validation should be bypassed
-    bypass_validation = ValidationConfig.is_validation_bypassed()
-    strict_mode = ValidationConfig.get_strict_mode()
+    settings = ValidationConfig.get_settings()
 
     # Validate styling parameters if not bypassed
-    if not bypass_validation:
+    if not settings.bypass:
+        start = time.perf_counter()
         validated_kwargs = validate_styling_kwargs(
             component_type=component_type,
             kwargs=component_kwargs,
-            strict=strict_mode,
+            strict=settings.strict,
             bypass_validation=False,
         )
+        stats.add("validation_seconds", time.perf_counter() - start)
     else:
         validated_kwargs = component_kwargs
 
     for styled_prop, value in validated_kwargs.items():
         single_prop_kwargs = {styled_prop: value}
-        css = generate_component_css(component_type, single_prop_kwargs, None)
+        start = time.perf_counter()
+        css, bytes_saved = _generate_component_css(
+            component_type, single_prop_kwargs, None
+        )
+        stats.add("css_generation_seconds", time.perf_counter() - start)
         if css:
             # Apply CSS globally without key
             # This will affect all components of this type
-            st.html(f"<style>{css}</style>")
+            emit_css(css, bytes_saved)
         else:
             if "-" in styled_prop:
                 did_you_mean_ext = styled_prop.replace("-", "_")
@@ -374,3 +1355,76 @@ def apply_component_css_global(
 
             msg = f"No st_yled property {styled_prop} found for component type '{component_type}'. {did_you_mean_ext}"
             raise ValueError(msg)
+
+
+def compile_theme(
+    theme: dict[str, dict[str, Any]], stats: StylingStats
+) -> tuple[str, int]:
+    """
+    Validate a theme in one batch and compile it into a single stylesheet.
+
+    Args:
+        theme: Mapping of component type to styling properties
+        stats: Statistics receiving validation and CSS generation time
+
+    Returns:
+        Tuple of the stylesheet and the bytes minification saved
+
+    Raises:
+        ValidationError: If validation fails in strict mode
+        ValueError: If component types or properties are invalid
+    """
+    settings = ValidationConfig.get_settings()
+
+    if not settings.bypass:
+        start = time.perf_counter()
+        theme = validate_styling_theme(theme, strict=settings.strict)
+        stats.add("validation_seconds", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    compiled = render_theme_css(theme, StylerConfig.MINIFY_CSS)
+    stats.add("css_generation_seconds", time.perf_counter() - start)
+
+    return compiled
+
+
+def apply_theme(theme: dict[str, dict[str, Any]]) -> None:
+    """
+    Apply global styles for many component types as one stylesheet.
+
+    Compiled stylesheets are memoized on the theme contents, so applying the
+    same theme again in later reruns only costs a cache lookup.
+
+    Args:
+        theme: Mapping of component type to styling properties
+
+    Raises:
+        ValidationError: If validation fails in strict mode
+        ValueError: If component types or properties are invalid
+    """
+    stats = get_styling_stats()
+    stats.add("theme_calls")
+
+    try:
+        cache_key: Optional[tuple] = (
+            tuple(
+                (element, get_cache_items(styles.items()))
+                for element, styles in theme.items()
+            ),
+            ValidationConfig.get_settings(),
+            StylerConfig.MINIFY_CSS,
+        )
+        compiled = THEME_CACHE.get(cache_key)
+    except TypeError:
+        # Unhashable styling values cannot be cached
+        cache_key = None
+        compiled = None
+
+    if compiled is None:
+        compiled = compile_theme(theme, stats)
+        if cache_key is not None:
+            THEME_CACHE.put(cache_key, compiled)
+
+    css, bytes_saved = compiled
+    if css:
+        emit_css(css, bytes_saved)
@@ -1,10 +1,14 @@
 """Parameter validation for styling properties."""
 
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 import warnings
 import os
 
+from st_yled.cache import LRUCache  # type: ignore
+
 
 class ValidationError(ValueError):
     """Raised when validation fails for styling parameters."""
@@ -18,238 +22,255 @@ class CSSValidator:
     """Comprehensive CSS property value validator."""
 
     # Common CSS color formats (improved patterns)
-    COLOR_PATTERNS = {
-        "hex_short": re.compile(r"^#[0-9a-fA-F]{3}$"),
-        "hex_long": re.compile(r"^#[0-9a-fA-F]{6}$"),
-        "hex_long_alpha": re.compile(r"^#[0-9a-fA-F]{8}$"),
-        "rgb": re.compile(
-            r"^rgb\(\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*,\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*,\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*\)$"
-        ),
-        "rgba": re.compile(
-            r"^rgba\(\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*,\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*,\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*,\s*(0(\.\d+)?|1(\.0)?)\s*\)$"
-        ),
-        "hsl": re.compile(r"^hsl\(\s*\d+\s*,\s*\d+%\s*,\s*\d+%\s*\)$"),
-        "hsla": re.compile(
-            r"^hsla\(\s*\d+\s*,\s*\d+%\s*,\s*\d+%\s*,\s*(0(\.\d+)?|1(\.0)?)\s*\)$"
-        ),
-    }
+    COLOR_PATTERNS = MappingProxyType(
+        {
+            "hex_short": re.compile(r"^#[0-9a-fA-F]{3}$"),
+            "hex_long": re.compile(r"^#[0-9a-fA-F]{6}$"),
+            "hex_long_alpha": re.compile(r"^#[0-9a-fA-F]{8}$"),
+            "rgb": re.compile(
+                r"^rgb\(\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*,\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*,\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*\)$"
+            ),
+            "rgba": re.compile(
+                r"^rgba\(\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*,\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*,\s*(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\s*,\s*(0(\.\d+)?|1(\.0)?)\s*\)$"
+            ),
+            "hsl": re.compile(r"^hsl\(\s*\d+\s*,\s*\d+%\s*,\s*\d+%\s*\)$"),
+            "hsla": re.compile(
+                r"^hsla\(\s*\d+\s*,\s*\d+%\s*,\s*\d+%\s*,\s*(0(\.\d+)?|1(\.0)?)\s*\)$"
+            ),
+        }
+    )
 
     # CSS named colors (expanded set including CSS keywords) CSS4 colors
-    NAMED_COLORS = {
-        "aliceblue",
-        "antiquewhite",
-        "aqua",
-        "aquamarine",
-        "azure",
-        "beige",
-        "bisque",
-        "black",
-        "blanchedalmond",
-        "blue",
-        "blueviolet",
-        "brown",
-        "burlywood",
-        "cadetblue",
-        "chartreuse",
-        "chocolate",
-        "coral",
-        "cornflowerblue",
-        "cornsilk",
-        "crimson",
-        "cyan",
-        "darkblue",
-        "darkcyan",
-        "darkgoldenrod",
-        "darkgray",
-        "darkgreen",
-        "darkgrey",
-        "darkkhaki",
-        "darkmagenta",
-        "darkolivegreen",
-        "darkorange",
-        "darkorchid",
-        "darkred",
-        "darksalmon",
-        "darkseagreen",
-        "darkslateblue",
-        "darkslategray",
-        "darkslategrey",
-        "darkturquoise",
-        "darkviolet",
-        "deeppink",
-        "deepskyblue",
-        "dimgray",
-        "dimgrey",
-        "dodgerblue",
-        "firebrick",
-        "floralwhite",
-        "forestgreen",
-        "fuchsia",
-        "gainsboro",
-        "ghostwhite",
-        "gold",
-        "goldenrod",
-        "gray",
-        "green",
-        "greenyellow",
-        "grey",
-        "honeydew",
-        "hotpink",
-        "indianred",
-        "indigo",
-        "ivory",
-        "khaki",
-        "lavender",
-        "lavenderblush",
-        "lawngreen",
-        "lemonchiffon",
-        "lightblue",
-        "lightcoral",
-        "lightcyan",
-        "lightgoldenrodyellow",
-        "lightgray",
-        "lightgreen",
-        "lightgrey",
-        "lightpink",
-        "lightsalmon",
-        "lightseagreen",
-        "lightskyblue",
-        "lightslategray",
-        "lightslategrey",
-        "lightsteelblue",
-        "lightyellow",
-        "lime",
-        "limegreen",
-        "linen",
-        "magenta",
-        "maroon",
-        "mediumaquamarine",
-        "mediumblue",
-        "mediumorchid",
-        "mediumpurple",
-        "mediumseagreen",
-        "mediumslateblue",
-        "mediumspringgreen",
-        "mediumturquoise",
-        "mediumvioletred",
-        "midnightblue",
-        "mintcream",
-        "mistyrose",
-        "moccasin",
-        "navajowhite",
-        "navy",
-        "oldlace",
-        "olive",
-        "olivedrab",
-        "orange",
-        "orangered",
-        "orchid",
-        "palegoldenrod",
-        "palegreen",
-        "paleturquoise",
-        "palevioletred",
-        "papayawhip",
-        "peachpuff",
-        "peru",
-        "pink",
-        "plum",
-        "powderblue",
-        "purple",
-        "red",
-        "rosybrown",
-        "royalblue",
-        "saddlebrown",
-        "salmon",
-        "sandybrown",
-        "seagreen",
-        "seashell",
-        "sienna",
-        "silver",
-        "skyblue",
-        "slateblue",
-        "slategray",
-        "slategrey",
-        "snow",
-        "springgreen",
-        "steelblue",
-        "tan",
-        "teal",
-        "thistle",
-        "tomato",
-        "turquoise",
-        "violet",
-        "wheat",
-        "white",
-        "whitesmoke",
-        "yellow",
-        "yellowgreen",
-        "transparent",
-    }
+    NAMED_COLORS = frozenset(
+        {
+            "aliceblue",
+            "antiquewhite",
+            "aqua",
+            "aquamarine",
+            "azure",
+            "beige",
+            "bisque",
+            "black",
+            "blanchedalmond",
+            "blue",
+            "blueviolet",
+            "brown",
+            "burlywood",
+            "cadetblue",
+            "chartreuse",
+            "chocolate",
+            "coral",
+            "cornflowerblue",
+            "cornsilk",
+            "crimson",
+            "cyan",
+            "darkblue",
+            "darkcyan",
+            "darkgoldenrod",
+            "darkgray",
+            "darkgreen",
+            "darkgrey",
+            "darkkhaki",
+            "darkmagenta",
+            "darkolivegreen",
+            "darkorange",
+            "darkorchid",
+            "darkred",
+            "darksalmon",
+            "darkseagreen",
+            "darkslateblue",
+            "darkslategray",
+            "darkslategrey",
+            "darkturquoise",
+            "darkviolet",
+            "deeppink",
+            "deepskyblue",
+            "dimgray",
+            "dimgrey",
+            "dodgerblue",
+            "firebrick",
+            "floralwhite",
+            "forestgreen",
+            "fuchsia",
+            "gainsboro",
+            "ghostwhite",
+            "gold",
+            "goldenrod",
+            "gray",
+            "green",
+            "greenyellow",
+            "grey",
+            "honeydew",
+            "hotpink",
+            "indianred",
+            "indigo",
+            "ivory",
+            "khaki",
+            "lavender",
+            "lavenderblush",
+            "lawngreen",
+            "lemonchiffon",
+            "lightblue",
+            "lightcoral",
+            "lightcyan",
+            "lightgoldenrodyellow",
+            "lightgray",
+            "lightgreen",
+            "lightgrey",
+            "lightpink",
+            "lightsalmon",
+            "lightseagreen",
+            "lightskyblue",
+            "lightslategray",
+            "lightslategrey",
+            "lightsteelblue",
+            "lightyellow",
+            "lime",
+            "limegreen",
+            "linen",
+            "magenta",
+            "maroon",
+            "mediumaquamarine",
+            "mediumblue",
+            "mediumorchid",
+            "mediumpurple",
+            "mediumseagreen",
+            "mediumslateblue",
+            "mediumspringgreen",
+            "mediumturquoise",
+            "mediumvioletred",
+            "midnightblue",
+            "mintcream",
+            "mistyrose",
+            "moccasin",
+            "navajowhite",
+            "navy",
+            "oldlace",
+            "olive",
+            "olivedrab",
+            "orange",
+            "orangered",
+            "orchid",
+            "palegoldenrod",
+            "palegreen",
+            "paleturquoise",
+            "palevioletred",
+            "papayawhip",
+            "peachpuff",
+            "peru",
+            "pink",
+            "plum",
+            "powderblue",
+            "purple",
+            "red",
+            "rosybrown",
+            "royalblue",
+            "saddlebrown",
+            "salmon",
+            "sandybrown",
+            "seagreen",
+            "seashell",
+            "sienna",
+            "silver",
+            "skyblue",
+            "slateblue",
+            "slategray",
+            "slategrey",
+            "snow",
+            "springgreen",
+            "steelblue",
+            "tan",
+            "teal",
+            "thistle",
+            "tomato",
+            "turquoise",
+            "violet",
+            "wheat",
+            "white",
+            "whitesmoke",
+            "yellow",
+            "yellowgreen",
+            "transparent",
+        }
+    )
 
     # CSS units
-    LENGTH_UNITS = {
-        "px",
-        "em",
-        "rem",
-        "%",
-        "vh",
-        "vw",
-        "pt",
-        "cm",
-        "mm",
-        "in",
-        "pc",
-        "ex",
-        "ch",
-    }
+    LENGTH_UNITS = frozenset(
+        {
+            "px",
+            "em",
+            "rem",
+            "%",
+            "vh",
+            "vw",
+            "pt",
+            "cm",
+            "mm",
+            "in",
+            "pc",
+            "ex",
+            "ch",
+        }
+    )
+
+    # Number with unit, e.g. "14px" or "-0.5em"
+    LENGTH_PATTERN = re.compile(r"^-?\d*\.?\d+(" + "|".join(LENGTH_UNITS) + ")$")
 
     # CSS border styles
-    BORDER_STYLES = {
-        "none",
-        "solid",
-        "dashed",
-        "dotted",
-        "double",
-        "groove",
-        "ridge",
-        "inset",
-        "outset",
-    }
+    BORDER_STYLES = frozenset(
+        {
+            "none",
+            "solid",
+            "dashed",
+            "dotted",
+            "double",
+            "groove",
+            "ridge",
+            "inset",
+            "outset",
+        }
+    )
 
     # CSS font weights
-    FONT_WEIGHTS = {
-        "normal",
-        "bold",
-        "bolder",
-        "lighter",
-        "100",
-        "200",
-        "300",
-        "400",
-        "500",
-        "600",
-        "700",
-        "800",
-        "900",
-    }
+    FONT_WEIGHTS = frozenset(
+        {
+            "normal",
+            "bold",
+            "bolder",
+            "lighter",
+            "100",
+            "200",
+            "300",
+            "400",
+            "500",
+            "600",
+            "700",
+            "800",
+            "900",
+        }
+    )
 
     # CSS text align values
-    TEXT_ALIGN_VALUES = {"left", "center", "right", "justify", "start", "end"}
+    TEXT_ALIGN_VALUES = frozenset(
+        {"left", "center", "right", "justify", "start", "end"}
+    )
 
     # CSS display values
-    DISPLAY_VALUES = {
-        "block",
-        "inline",
-        "inline-block",
-        "flex",
-        "inline-flex",
-        "grid",
-        "inline-grid",
-        "none",
-    }
+    DISPLAY_VALUES = frozenset(
+        {
+            "block",
+            "inline",
+            "inline-block",
+            "flex",
+            "inline-flex",
+            "grid",
+            "inline-grid",
+            "none",
+        }
+    )
 
     # CSS position values
-    POSITION_VALUES = {"static", "relative", "absolute", "fixed", "sticky"}
+    POSITION_VALUES = frozenset({"static", "relative", "absolute", "fixed", "sticky"})
 
     @staticmethod
     def is_valid_color(value: str) -> bool:
@@ -289,10 +310,7 @@ class CSSValidator:
             return True
 
         # Check for number with unit
-        length_pattern = re.compile(
-            r"^-?\d*\.?\d+(" + "|".join(CSSValidator.LENGTH_UNITS) + ")$"
-        )
-        return bool(length_pattern.match(value))
+        return bool(CSSValidator.LENGTH_PATTERN.match(value))
 
     @staticmethod
     def is_valid_border_style(value: str) -> bool:
@@ -337,30 +355,39 @@ class StyleValidator:
     """Main styling parameter validator."""
 
     # Property validation mapping
-    PROPERTY_VALIDATORS = {
-        # Color properties
-        "color": CSSValidator.is_valid_color,
-        "background_color": CSSValidator.is_valid_color,
-        "border_color": CSSValidator.is_valid_color,
-        # Size/length properties (can handle space-separated values)
-        "font_size": CSSValidator.is_valid_length,
-        "border_width": CSSValidator.is_valid_length,
-        "border_style": CSSValidator.is_valid_border_style,
-    }
+    PROPERTY_VALIDATORS = MappingProxyType(
+        {
+            # Color properties
+            "color": CSSValidator.is_valid_color,
+            "background_color": CSSValidator.is_valid_color,
+            "border_color": CSSValidator.is_valid_color,
+            # Size/length properties (can handle space-separated values)
+            "font_size": CSSValidator.is_valid_length,
+            "border_width": CSSValidator.is_valid_length,
+            "border_style": CSSValidator.is_valid_border_style,
+        }
+    )
 
     # Common property aliases/variations
-    PROPERTY_ALIASES = {
-        "bg_color": "background_color",
-        "text_color": "color",
-        "font_color": "color",
-        "size": "font_size",
-    }
+    PROPERTY_ALIASES = MappingProxyType(
+        {
+            "bg_color": "background_color",
+            "text_color": "color",
+            "font_color": "color",
+            "size": "font_size",
+        }
+    )
 
     # Properties with default unit handling
-    PROPERTY_DEFAULT_UNITS = {
-        "font_size": "px",
-        "border_width": "px",
-    }
+    PROPERTY_DEFAULT_UNITS = MappingProxyType(
+        {
+            "font_size": "px",
+            "border_width": "px",
+        }
+    )
+
+    # Validation results keyed on (property, value, strict)
+    VALIDATION_CACHE = LRUCache(maxsize=4096)
 
     @classmethod
     def set_default_int_unit(cls, prop_name: str, prop_value: Any) -> Any:
@@ -392,6 +419,19 @@ class StyleValidator:
         if not isinstance(prop_value, str):
             prop_value = str(prop_value)
 
+        cache_key = (prop_name, prop_value, strict)
+        result = cls.VALIDATION_CACHE.get(cache_key)
+        if result is None:
+            result = cls._validate_property_uncached(prop_name, prop_value, strict)
+            cls.VALIDATION_CACHE.put(cache_key, result)
+
+        return result
+
+    @classmethod
+    def _validate_property_uncached(
+        cls, prop_name: str, prop_value: str, strict: bool
+    ) -> Tuple[bool, Optional[str]]:
+        """Validate a single styling property whose value was converted to str."""
         # Get validator function
         validator = cls.PROPERTY_VALIDATORS.get(prop_name)
 
@@ -404,7 +444,7 @@ class StyleValidator:
         try:
             is_valid = validator(prop_value)
             if not is_valid:
-                error_msg = cls._get_validation_error_message(prop_name, prop_value)
+                error_msg = cls.get_validation_error_message(prop_name, prop_value)
                 return False, error_msg
             return True, None
         except Exception as e:
@@ -412,7 +452,7 @@ class StyleValidator:
             return False, error_msg
 
     @classmethod
-    def _get_validation_error_message(cls, prop_name: str, prop_value: str) -> str:
+    def get_validation_error_message(cls, prop_name: str, prop_value: str) -> str:
         """Generate helpful error message for validation failure."""
         if "color" in prop_name:
             return (
@@ -479,9 +519,65 @@ class StyleValidator:
         if bypass_validation:
             return kwargs
 
+        errors: List[str] = []
+        warnings_list: List[str] = []
+        validated_kwargs = cls._collect_kwargs_issues(
+            component_type, kwargs, strict, errors, warnings_list
+        )
+        cls._report_issues(errors, warnings_list)
+
+        return validated_kwargs
+
+    @classmethod
+    def validate_theme(
+        cls,
+        theme: Dict[str, Dict[str, Any]],
+        strict: bool = False,
+        bypass_validation: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate the styling properties of many components in one batch.
+
+        All problems are collected first and reported in a single
+        ValidationError or warning.
+
+        Args:
+            theme: Mapping of component name to styling properties
+            strict: If True, raise ValidationError on invalid properties
+            bypass_validation: If True, skip all validation
+
+        Returns:
+            Validated theme (may be modified)
+
+        Raises:
+            ValidationError: If strict=True and validation fails
+        """
+        if bypass_validation:
+            return theme
+
+        errors: List[str] = []
+        warnings_list: List[str] = []
+        validated_theme = {
+            component_type: cls._collect_kwargs_issues(
+                component_type, kwargs, strict, errors, warnings_list
+            )
+            for component_type, kwargs in theme.items()
+        }
+        cls._report_issues(errors, warnings_list)
+
+        return validated_theme
+
+    @classmethod
+    def _collect_kwargs_issues(
+        cls,
+        component_type: str,
+        kwargs: Dict[str, Any],
+        strict: bool,
+        errors: List[str],
+        warnings_list: List[str],
+    ) -> Dict[str, Any]:
+        """Validate kwargs of one component, appending problems to errors and warnings_list."""
         validated_kwargs = kwargs.copy()
-        errors = []
-        warnings_list = []
 
         # Check each kwarg for styling properties
         for prop_name, prop_value in kwargs.items():
@@ -520,7 +616,11 @@ class StyleValidator:
                     # Warning message for unknown property
                     warnings_list.append(f"Component '{component_type}': {message}")
 
-        # Handle errors and warnings
+        return validated_kwargs
+
+    @staticmethod
+    def _report_issues(errors: List[str], warnings_list: List[str]) -> None:
+        """Raise collected errors, or warn about collected warnings."""
         if errors:
             error_msg = "Styling validation failed:\n" + "\n".join(errors)
             raise ValidationError(error_msg)
@@ -529,8 +629,6 @@ class StyleValidator:
             warning_msg = "Styling validation warnings:\n" + "\n".join(warnings_list)
             warnings.warn(warning_msg, ValidationWarning)
 
-        return validated_kwargs
-
     @classmethod
     def suggest_corrections(cls, prop_name: str) -> List[str]:
         """Suggest corrections for invalid property values."""
@@ -565,6 +663,31 @@ class StyleValidator:
         return suggestions
 
 
+def get_validation_cache_info() -> Dict[str, Any]:
+    """
+    Get hit/miss statistics of the property validation cache.
+
+    Returns:
+        Dictionary with hits, misses, evictions, size, maxsize and hit_rate.
+    """
+    return StyleValidator.VALIDATION_CACHE.info()
+
+
+def set_validation_cache_size(maxsize: int) -> None:
+    """
+    Set the maximum number of (property, value) results kept in the cache.
+
+    Args:
+        maxsize: Maximum number of entries. 0 disables caching.
+    """
+    StyleValidator.VALIDATION_CACHE.resize(maxsize)
+
+
+def clear_validation_cache() -> None:
+    """Remove all cached validation results and reset the cache counters."""
+    StyleValidator.VALIDATION_CACHE.clear()
+
+
 def validate_styling_kwargs(
     component_type: str,
     kwargs: Dict[str, Any],
@@ -599,9 +722,56 @@ def validate_styling_kwargs(
     )
 
 
+def validate_styling_theme(
+    theme: Dict[str, Dict[str, Any]],
+    strict: bool = False,
+    bypass_validation: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Validate a theme mapping component names to styling properties in one batch.
+
+    Args:
+        theme: Mapping of component name to styling properties
+        strict: If True, raise ValidationError on invalid properties;
+                if False, warn and remove invalid properties
+        bypass_validation: If True, skip all validation
+
+    Returns:
+        Validated and potentially cleaned theme
+
+    Raises:
+        ValidationError: If strict=True and validation fails
+    """
+    return StyleValidator.validate_theme(theme, strict, bypass_validation)
+
+
+class ValidationSettings(NamedTuple):
+    """Resolved validation settings."""
+
+    bypass: bool
+    strict: bool
+
+
+def _get_session_state() -> Optional[MutableMapping[Any, Any]]:
+    """Get st.session_state of the Streamlit session running the current thread, if any."""
+    # Imported here, the st-yled build command validates without Streamlit
+    import streamlit as st  # noqa: PLC0415
+    from streamlit.runtime.scriptrunner import get_script_run_ctx  # noqa: PLC0415
+
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    return st.session_state
+
+
 # Configuration for validation behavior
 class ValidationConfig:
-    """Global configuration for styling validation."""
+    """
+    Global configuration for styling validation.
+
+    Settings are resolved from the environment once into an immutable snapshot.
+    Use reload() after changing environment variables, configure() to set them
+    programmatically, optionally for the current session only.
+    """
 
     # Default validation mode
     DEFAULT_STRICT_MODE = False
@@ -612,20 +782,122 @@ class ValidationConfig:
     # Environment variable to bypass validation
     BYPASS_ENV_VAR = "ST_STYLED_BYPASS_VALIDATION"
 
+    # Environment variable to enable or disable strict mode
+    STRICT_ENV_VAR = "ST_STYLED_STRICT_VALIDATION"
+
+    _settings: Optional[ValidationSettings] = None
+
+    # Key of the per-session override in st.session_state, dropped with the session
+    SESSION_SETTINGS_KEY = "st-yled-validation-settings"
+
+    # Whether any session set an override, sessions are not looked up otherwise
+    _session_overrides = False
+
+    @classmethod
+    def _settings_from_env(cls) -> ValidationSettings:
+        bypass = os.getenv(cls.BYPASS_ENV_VAR, "").lower() in ("true", "1", "yes")
+
+        strict_env = os.getenv(cls.STRICT_ENV_VAR, "").lower()
+        if strict_env in ("true", "1", "yes"):
+            strict = True
+        elif strict_env in ("false", "0", "no"):
+            strict = False
+        else:
+            strict = cls.DEFAULT_STRICT_MODE
+
+        return ValidationSettings(bypass=bypass, strict=strict)
+
+    @classmethod
+    def reload(cls) -> ValidationSettings:
+        """
+        Resolve the global settings from the environment again.
+
+        Programmatic settings from configure() are replaced; per-session
+        overrides are kept.
+
+        Returns:
+            The new global settings
+        """
+        cls._settings = cls._settings_from_env()
+        return cls._settings
+
+    @classmethod
+    def configure(
+        cls,
+        strict: Optional[bool] = None,
+        bypass: Optional[bool] = None,
+        session: bool = False,
+    ) -> ValidationSettings:
+        """
+        Set validation settings programmatically.
+
+        Args:
+            strict: If given, enable or disable strict mode
+            bypass: If given, enable or disable bypassing validation
+            session: If True, apply the settings to the current Streamlit
+                session only
+
+        Returns:
+            The new settings
+
+        Raises:
+            RuntimeError: If session=True outside of a Streamlit session
+        """
+        updates = {}
+        if strict is not None:
+            updates["strict"] = strict
+        if bypass is not None:
+            updates["bypass"] = bypass
+
+        if not session:
+            cls._settings = cls.get_global_settings()._replace(**updates)
+            return cls._settings
+
+        session_state = _get_session_state()
+        if session_state is None:
+            msg = "Per-session validation settings require a running Streamlit session."
+            raise RuntimeError(msg)
+
+        settings = cls.get_settings()._replace(**updates)
+        session_state[cls.SESSION_SETTINGS_KEY] = settings
+        cls._session_overrides = True
+        return settings
+
+    @classmethod
+    def reset_session(cls) -> None:
+        """Remove the settings override of the current Streamlit session."""
+        session_state = _get_session_state()
+        if session_state is not None:
+            session_state.pop(cls.SESSION_SETTINGS_KEY, None)
+
+    @classmethod
+    def get_global_settings(cls) -> ValidationSettings:
+        """Get the global settings, resolving them from the environment once."""
+        settings = cls._settings
+        if settings is None:
+            settings = cls.reload()
+        return settings
+
+    @classmethod
+    def get_settings(cls) -> ValidationSettings:
+        """Get the settings for the current session."""
+        if cls._session_overrides:
+            session_state = _get_session_state()
+            if session_state is not None:
+                settings = session_state.get(cls.SESSION_SETTINGS_KEY)
+                if settings is not None:
+                    return settings
+        return cls.get_global_settings()
+
     @classmethod
     def is_validation_bypassed(cls) -> bool:
-        """Check if validation should be bypassed based on environment."""
-        return os.getenv(cls.BYPASS_ENV_VAR, "").lower() in ("true", "1", "yes")
+        """Check if validation should be bypassed."""
+        return cls.get_settings().bypass
 
     @classmethod
     def get_strict_mode(cls) -> bool:
         """Get current strict mode setting."""
-        strict_env = os.getenv("ST_STYLED_STRICT_VALIDATION", "").lower()
-        if strict_env in ("true", "1", "yes"):
-            return True
-        elif strict_env in ("false", "0", "no"):
-            return False
-        return cls.DEFAULT_STRICT_MODE
+        return cls.get_settings().strict
 
 
 def validate_container_width(width_value: Any) -> bool:
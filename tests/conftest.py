@@ -1,9 +1,22 @@
 """Test configuration and fixtures."""
 import os
+import sys
 import tempfile
 
 import pytest
 
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from st_yled import styler
+
+
+@pytest.fixture(autouse=True)
+def fresh_run_state():
+    """Start every test without st_yled run state, as if init() was not called."""
+    token = styler.RUN_STATE.set(None)
+    yield
+    styler.RUN_STATE.reset(token)
+
 
 @pytest.fixture()
 def temp_css_file():
@@ -23,6 +36,9 @@ def temp_css_file():
 def mock_streamlit_app(monkeypatch):
     """Mock streamlit for testing without actual streamlit app context."""
     class MockStreamlit:
+        def __init__(self):
+            self.session_state = {}
+
         def html(self, content):
             return content
 
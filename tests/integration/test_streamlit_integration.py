@@ -17,3 +17,303 @@ def test_elements_integration(mock_streamlit_app):
         button("Test Button", key="test")
     except Exception as e:
         pytest.fail(f"styled_button failed with mocked Streamlit: {e}")
+
+
+@pytest.mark.integration()
+def test_caller_path_resolves_to_running_script():
+    """Test that the caller lookup finds the script executed by Streamlit."""
+    from streamlit.testing.v1 import AppTest
+
+    script = """
+import streamlit as st
+from st_yled import styler
+
+st.session_state["caller_hash"] = styler.extract_caller_path_hash()
+st.session_state["script_hash"] = str(hash(__file__))
+"""
+    app = AppTest.from_string(script).run()
+
+    assert not app.exception
+    assert app.session_state["caller_hash"] == app.session_state["script_hash"]
+
+
+@pytest.mark.integration()
+def test_styled_elements_in_script_run():
+    """Test init() and styled elements inside a real Streamlit script run."""
+    from streamlit.testing.v1 import AppTest
+
+    script = """
+import st_yled
+
+st_yled.init()
+st_yled.button("Styled", color="#ff0000")
+st_yled.text("Styled text", font_size="12px")
+"""
+    app = AppTest.from_string(script).run()
+
+    assert not app.exception
+    assert app.button[0].label == "Styled"
+
+
+@pytest.mark.integration()
+def test_run_state_survives_reruns():
+    """Test that the st_yled state of a session is kept across script reruns."""
+    from streamlit.testing.v1 import AppTest
+
+    script = """
+import streamlit as st
+import st_yled
+from st_yled import styler
+
+st_yled.init()
+st_yled.button("Styled", color="#ff0000")
+st.session_state.setdefault("run_states", []).append(id(styler.get_run_state()))
+st.session_state["runs"] = st_yled.stats()["session"]["runs"]
+"""
+    app = AppTest.from_string(script).run()
+    first_key = app.button[0].key
+    app.run()
+    app.run()
+
+    assert not app.exception
+    assert app.button[0].key == first_key
+    assert app.session_state["runs"] == 3
+    assert len(set(app.session_state["run_states"])) == 1
+
+
+@pytest.mark.integration()
+def test_state_of_elements_no_longer_rendered_is_pruned():
+    """Test that reruns drop the widget state of elements that disappeared."""
+    from streamlit.testing.v1 import AppTest
+
+    script = """
+import streamlit as st
+import st_yled
+
+st_yled.init()
+st_yled.checkbox("Always", color="#ff0000")
+if st.session_state.get("show", True):
+    st_yled.checkbox("Sometimes", color="#0000ff")
+st.session_state["footprint"] = st_yled.stats()["footprint"]
+"""
+    app = AppTest.from_string(script).run()
+    hidden_key = app.checkbox[1].key
+    app.checkbox[1].check().run()
+    assert app.session_state[hidden_key] is True
+    assert app.session_state["footprint"]["tracked_keys"] == 2
+
+    app.session_state["show"] = False
+    app.run()
+    app.run()
+
+    assert not app.exception
+    assert hidden_key not in app.session_state
+    assert app.session_state["footprint"]["tracked_keys"] == 1
+    assert app.session_state["footprint"]["pruned_keys"] == 1
+
+
+@pytest.mark.integration()
+def test_pages_not_visited_again_are_pruned():
+    """Test that the state of pages left for STALE_RUNS runs is dropped."""
+    from streamlit.testing.v1 import AppTest
+    import st_yled
+
+    # Pages are told apart by the caller hash init() passes to start_run_state
+    script = """
+import streamlit as st
+import st_yled
+from st_yled import styler
+
+styler.start_run_state(st.session_state.get("page", "home"))
+st.session_state["footprint"] = st_yled.stats()["footprint"]
+"""
+    st_yled.configure(stale_runs=1)
+    try:
+        app = AppTest.from_string(script).run()
+        app.session_state["page"] = "other"
+        app.run()
+        assert app.session_state["footprint"]["scripts"] == 2
+
+        app.run()
+    finally:
+        st_yled.configure(stale_runs=10)
+
+    assert not app.exception
+    assert app.session_state["footprint"]["scripts"] == 1
+    assert app.session_state["footprint"]["pruned_scripts"] == 1
+
+
+FRAGMENT_SCRIPT = """
+import streamlit as st
+import st_yled
+
+st_yled.configure(batch_css=st.session_state.get("batch_css", False))
+st_yled.init()
+st_yled.text("Outside", color="#ff0000")
+
+@st.fragment
+def tile():
+    st_yled.button("Red", color="#ff0000")
+    st_yled.button("Blue", color="#0000ff")
+    if st.session_state.get("green"):
+        st_yled.button("Green", color="#00ff00")
+    st.session_state["stats"] = st_yled.stats()["session"]
+
+tile()
+st_yled.flush()
+"""
+
+
+def supports_fragment_reruns():
+    """Check for the AppTest internals rerun_fragments() relies on."""
+    import dataclasses
+    import inspect
+    from streamlit.runtime.scriptrunner_utils.script_requests import RerunData
+    from streamlit.testing.v1 import AppTest, local_script_runner
+
+    fields = {field.name for field in dataclasses.fields(RerunData)}
+    return (
+        {"fragment_id_queue", "is_fragment_scoped_rerun"} <= fields
+        and "_fragment_storage" in inspect.getsource(AppTest.__init__)
+        and getattr(local_script_runner, "RerunData", None) is RerunData
+        # Older runners drop fragment_ids_this_run, so every rerun is a full run
+        and "fragment_ids_this_run" in inspect.getsource(local_script_runner)
+    )
+
+
+def rerun_fragments(app):
+    """Rerun only the fragments of the app, as a widget inside them would."""
+    import functools
+    from unittest.mock import patch
+    from streamlit.runtime.scriptrunner_utils.script_requests import RerunData
+
+    # AppTest has no public way to rerun fragments alone
+    fragment_ids = list(app._fragment_storage._fragments)
+    rerun_data = functools.partial(
+        RerunData, fragment_id_queue=fragment_ids, is_fragment_scoped_rerun=True
+    )
+    with patch("streamlit.testing.v1.local_script_runner.RerunData", rerun_data):
+        return app.run()
+
+
+@pytest.fixture()
+def fragment_app():
+    """AppTest of a script with styled elements inside an st.fragment."""
+    from streamlit.testing.v1 import AppTest
+    import st_yled
+
+    if not supports_fragment_reruns():
+        pytest.skip("AppTest of this Streamlit version cannot rerun fragments alone")
+
+    yield AppTest.from_string(FRAGMENT_SCRIPT)
+    st_yled.configure(batch_css=False)
+
+
+@pytest.mark.integration()
+def test_fragment_keys_are_stable_across_fragment_reruns(fragment_app):
+    """Test that fragment reruns find the session state and keep element keys."""
+    fragment_app.run()
+    full_run_keys = [button.key for button in fragment_app.button]
+
+    rerun_fragments(fragment_app)
+    emissions = fragment_app.session_state["stats"]["style_emissions"]
+    rerun_fragments(fragment_app)
+
+    assert not fragment_app.exception
+    assert [button.key for button in fragment_app.button] == full_run_keys
+    assert fragment_app.session_state["stats"]["runs"] == 1
+    # Streamlit replaces the previous output of the fragment, so its CSS is
+    # emitted again
+    assert fragment_app.session_state["stats"]["style_emissions"] == emissions + 2
+
+
+@pytest.mark.integration()
+def test_fragment_rerun_reuses_batched_css(fragment_app):
+    """Test that fragment reruns do not resend CSS of the batched stylesheet."""
+    fragment_app.session_state["batch_css"] = True
+    fragment_app.run()
+    rerun_fragments(fragment_app)
+    stats = fragment_app.session_state["stats"]
+
+    assert not fragment_app.exception
+    assert stats["reused_styles"] == 2
+
+    # New styles are emitted inside the fragment, the batch placeholder is
+    # outside of it
+    fragment_app.session_state["green"] = True
+    rerun_fragments(fragment_app)
+
+    assert not fragment_app.exception
+    assert fragment_app.button[2].label == "Green"
+    assert fragment_app.session_state["stats"]["reused_styles"] == 4
+    assert (
+        fragment_app.session_state["stats"]["style_emissions"]
+        == stats["style_emissions"] + 1
+    )
+
+
+@pytest.mark.integration()
+def test_session_validation_settings_stay_in_their_session():
+    """Test that per-session validation settings do not leak into other sessions."""
+    from streamlit.testing.v1 import AppTest
+
+    script = """
+import streamlit as st
+from st_yled.validation import ValidationConfig
+
+if st.session_state.get("strict"):
+    ValidationConfig.configure(strict=True, session=True)
+st.session_state["settings"] = ValidationConfig.get_settings()
+"""
+    strict_app = AppTest.from_string(script)
+    strict_app.session_state["strict"] = True
+    strict_app.run()
+    other_app = AppTest.from_string(script).run()
+
+    assert strict_app.session_state["settings"].strict
+    assert not other_app.session_state["settings"].strict
+
+
+@pytest.mark.integration()
+def test_batched_css_lost_by_st_stop_is_reported():
+    """Test that a run stopped before flush() is reported by the next init()."""
+    from streamlit.testing.v1 import AppTest
+    import st_yled
+
+    script = """
+import streamlit as st
+import st_yled
+
+st_yled.configure(batch_css=True)
+st_yled.init()
+st_yled.button("Styled", color="#ff0000")
+st.stop()
+st_yled.flush()
+"""
+    app = AppTest.from_string(script).run()
+    try:
+        with pytest.warns(UserWarning, match="never shown"):
+            app.run()
+    finally:
+        st_yled.configure(batch_css=False)
+
+    assert not app.exception
+
+
+@pytest.mark.integration()
+def test_repeated_unstyled_widgets_render():
+    """Test that unstyled widgets with equal arguments get distinct keys."""
+    from streamlit.testing.v1 import AppTest
+
+    script = """
+import st_yled
+
+st_yled.init()
+for _ in range(2):
+    st_yled.button("Delete")
+"""
+    app = AppTest.from_string(script).run()
+
+    assert not app.exception
+    assert len(app.button) == 2
+    assert app.button[0].key != app.button[1].key
@@ -0,0 +1,104 @@
+"""Tests for vectorized batch validation."""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "st_yled"))
+
+from st_yled.batch_validation import validate_property_values, validate_style_table
+from st_yled.validation import StyleValidator
+
+
+SAMPLES = [
+    "red", "RED", " #fff ", "#ffff", "#12345678", "rgb(1, 2, 3)", "rgb(256,0,0)",
+    "rgba(1,2,3,0.5)", "hsl(1,2%,3%)", "hsla(1,2%,3%,1.0)", "nope", "", "10px",
+    "0", "1.5em", "10px 20px", "10", "-1px", "solid", "Dashed", "transparent",
+    12, 0, 5.5,
+]
+
+
+class TestValidatePropertyValues:
+    """Test validating many values of one property."""
+
+    def test_matches_scalar_validation(self):
+        for prop_name in ["color", "background_color", "font_size", "border_width", "border_style"]:
+            result = validate_property_values(prop_name, SAMPLES)
+
+            expected = [
+                StyleValidator.validate_property(
+                    prop_name, StyleValidator.set_default_int_unit(prop_name, value)
+                )[0]
+                for value in SAMPLES
+            ]
+            assert result.mask.tolist() == expected, prop_name
+
+    def test_list_input_returns_arrays(self):
+        result = validate_property_values("color", ["red", "#00ff00", "nope"])
+
+        assert isinstance(result.mask, np.ndarray)
+        assert result.mask.tolist() == [True, True, False]
+        assert result.errors.index.tolist() == [2]
+        assert "Invalid color value 'nope'" in result.errors[2]
+
+    def test_series_input_keeps_index(self):
+        values = pd.Series(["red", "nope"], index=["ok", "bad"])
+
+        result = validate_property_values("color", values)
+
+        assert result.mask.to_dict() == {"ok": True, "bad": False}
+        assert result.errors.index.tolist() == ["bad"]
+
+    def test_integers_get_default_unit(self):
+        result = validate_property_values("font_size", np.array([12, 14]))
+
+        assert result.mask.tolist() == [True, True]
+        assert result.css_values.tolist() == ["12px", "14px"]
+
+    def test_integers_with_missing_values_get_default_unit(self):
+        values = pd.Series([12, None, 14])
+        assert values.dtype == np.float64
+
+        result = validate_property_values("font_size", values)
+
+        assert result.mask.tolist() == [True, True, True]
+        assert result.css_values[[0, 2]].tolist() == ["12px", "14px"]
+        assert result.css_values.isna().tolist() == [False, True, False]
+        assert result.errors.empty
+
+    def test_fractional_floats_keep_scalar_result(self):
+        values = pd.Series([12.5, None, np.inf])
+
+        result = validate_property_values("font_size", values)
+
+        assert result.mask.tolist() == [
+            StyleValidator.validate_property("font_size", 12.5)[0],
+            True,
+            StyleValidator.validate_property("font_size", np.inf)[0],
+        ]
+
+    def test_missing_values_are_valid(self):
+        result = validate_property_values("color", pd.Series(["red", None, np.nan]))
+
+        assert result.mask.tolist() == [True, True, True]
+        assert result.css_values.isna().tolist() == [False, True, True]
+
+    def test_aliases_and_unknown_properties(self):
+        assert validate_property_values("bg_color", ["nope"]).mask.tolist() == [False]
+        assert validate_property_values("width", ["anything"]).mask.tolist() == [True]
+
+
+class TestValidateStyleTable:
+    """Test validating a table with one column per property."""
+
+    def test_mask_and_errors_per_cell(self):
+        styles = pd.DataFrame({"color": ["red", "nope"], "font_size": [12, "bad"]})
+
+        result = validate_style_table(styles)
+
+        assert result.mask.to_dict("list") == {"color": [True, False], "font_size": [True, False]}
+        assert sorted(result.errors.index.tolist()) == [(1, "color"), (1, "font_size")]
+        assert result.css_values["font_size"].tolist() == ["12px", "bad"]
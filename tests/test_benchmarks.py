@@ -0,0 +1,40 @@
+"""Smoke tests for the benchmark suite."""
+
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from benchmarks import bench_styling
+
+
+def test_styling_benchmarks_produce_json_results():
+    """Test that the styling benchmarks run and produce serializable results."""
+    results = bench_styling.run(calls=1, elements=["button", "text"])
+
+    assert set(results) == {
+        "apply_component_css",
+        "apply_component_css_global",
+        "validate_styling_kwargs",
+        "generate_component_key",
+        "extract_caller_path_hash",
+        "get_stylable_elements",
+        "get_stylable_elements_by_category",
+        "get_element_variants",
+        "validate_property_values",
+    }
+    assert set(results["apply_component_css"]["elements"]) == {"button", "text"}
+    assert results["generate_component_key"]["calls"] == 1
+    json.dumps(results)
+
+
+def test_styling_kwargs_cover_all_properties():
+    """Test that every styling property has a valid sample value."""
+    from st_yled import styler
+    from st_yled.validation import StyleValidator
+
+    for element in styler.get_stylable_elements():
+        for prop, value in bench_styling.get_styling_kwargs(element).items():
+            assert StyleValidator.validate_property(prop, value) == (True, None)
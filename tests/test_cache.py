@@ -0,0 +1,112 @@
+"""Tests for bounded caches."""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "st_yled"))
+
+from st_yled.cache import LRUCache
+
+
+class TestLRUCache:
+    """Test LRU eviction and counters."""
+
+    def test_get_and_put(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.evictions == 1
+
+    def test_resize_evicts(self):
+        cache = LRUCache(maxsize=3)
+        for key in "abc":
+            cache.put(key, key)
+
+        cache.resize(1)
+
+        assert len(cache) == 1
+        assert "c" in cache
+        assert cache.info()["maxsize"] == 1
+
+    def test_zero_size_disables_cache(self):
+        cache = LRUCache(maxsize=0)
+        cache.put("a", 1)
+
+        assert len(cache) == 0
+
+    def test_negative_size_rejected(self):
+        with pytest.raises(ValueError, match="Cache size must be >= 0"):
+            LRUCache(maxsize=-1)
+
+    def test_info_and_clear(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        info = cache.info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+        assert info["hit_rate"] == 0.5
+
+        cache.clear()
+        assert cache.info()["hits"] == 0
+        assert len(cache) == 0
+
+
+class TestLRUCacheThreads:
+    """Test concurrent use of one cache, as by the script threads of many sessions."""
+
+    def test_concurrent_get_and_put_keep_cache_consistent(self):
+        cache = LRUCache(maxsize=64)
+        thread_count, lookups = 32, 2000
+        errors = []
+        barrier = threading.Barrier(thread_count)
+
+        def work(seed):
+            barrier.wait()
+            try:
+                for i in range(lookups):
+                    key = (seed * 7 + i) % 256
+                    value = cache.get(key)
+                    if value is None:
+                        cache.put(key, str(key))
+                    elif value != str(key):
+                        errors.append((key, value))
+                    if i % 500 == 0:
+                        cache.info()
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert errors == []
+        info = cache.info()
+        assert info["hits"] + info["misses"] == thread_count * lookups
+        assert len(cache) == info["size"] <= 64
+        # Threads missing the same key both put it, the second put evicts nothing
+        assert 0 < info["evictions"] <= info["misses"] - len(cache)
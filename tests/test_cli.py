@@ -0,0 +1,137 @@
+"""Tests for the st-yled command line interface."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+sys.path.append(SRC)
+
+from st_yled import cli
+from st_yled.styler import StylerConfig, StylingStats, compile_theme
+from st_yled.validation import ValidationError
+
+THEME = {
+    "button": {"background_color": "#0d6efd", "font_size": 16},
+    "title": {"color": "navy"},
+}
+
+
+class TestLoadTheme:
+    """Test reading theme definitions."""
+
+    def test_toml_json_and_python_themes_are_equal(self, tmp_path):
+        toml_path = tmp_path / "theme.toml"
+        toml_path.write_text(
+            "[button]\n"
+            'background_color = "#0d6efd"\n'
+            "font_size = 16\n\n"
+            "[title]\n"
+            'color = "navy"\n'
+        )
+        json_path = tmp_path / "theme.json"
+        json_path.write_text(json.dumps(THEME))
+        py_path = tmp_path / "theme.py"
+        py_path.write_text(f"my_theme = {THEME!r}\n")
+
+        assert cli.load_theme(toml_path) == THEME
+        assert cli.load_theme(json_path) == THEME
+        assert cli.load_theme(py_path, variable="my_theme") == THEME
+
+    def test_python_theme_without_variable_raises(self, tmp_path):
+        py_path = tmp_path / "theme.py"
+        py_path.write_text("styles = {}\n")
+
+        with pytest.raises(ValueError, match="does not define 'theme'"):
+            cli.load_theme(py_path)
+
+    def test_unsupported_suffix_raises(self, tmp_path):
+        path = tmp_path / "theme.yaml"
+        path.write_text("button: {}\n")
+
+        with pytest.raises(ValueError, match="Unsupported theme file"):
+            cli.load_theme(path)
+
+    def test_non_table_styles_raise(self, tmp_path):
+        path = tmp_path / "theme.json"
+        path.write_text(json.dumps({"button": "red"}))
+
+        with pytest.raises(ValueError, match="must map element names"):
+            cli.load_theme(path)
+
+
+class TestBuild:
+    """Test compiling themes into stylesheets."""
+
+    def test_stylesheet_matches_runtime_theme(self):
+        css = cli.build_stylesheet(THEME)
+
+        assert StylerConfig.MINIFY_CSS
+        assert css == compile_theme(THEME, StylingStats())[0]
+        assert "font-size:16px!important" in css
+        assert "h1{color:navy!important}" in css
+
+    def test_invalid_value_fails_build(self):
+        with pytest.raises(ValidationError, match="Invalid color value 'nope'"):
+            cli.build_stylesheet({"button": {"color": "nope"}})
+
+    def test_unknown_element_fails_build(self):
+        with pytest.raises(ValueError, match="Component type 'buttonx' not found"):
+            cli.build_stylesheet({"buttonx": {"color": "red"}})
+
+    def test_main_writes_default_stylesheet(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "theme.json").write_text(json.dumps(THEME))
+
+        assert cli.main(["build", "theme.json"]) == 0
+
+        written = (tmp_path / ".streamlit" / "st-styled.css").read_text()
+        assert written == cli.build_stylesheet(THEME) + "\n"
+        assert "Wrote .streamlit/st-styled.css" in capsys.readouterr().out
+
+    def test_main_no_minify(self, tmp_path):
+        (tmp_path / "theme.json").write_text(json.dumps(THEME))
+        output = tmp_path / "out" / "theme.css"
+
+        assert (
+            cli.main(
+                [
+                    "build",
+                    str(tmp_path / "theme.json"),
+                    "-o",
+                    str(output),
+                    "--no-minify",
+                ]
+            )
+            == 0
+        )
+
+        assert "h1 {\n    color: navy !important;\n}" in output.read_text()
+
+    def test_main_reports_errors(self, tmp_path, capsys):
+        (tmp_path / "theme.json").write_text(json.dumps({"button": {"color": "nope"}}))
+
+        assert cli.main(["build", str(tmp_path / "theme.json")]) == 1
+        assert capsys.readouterr().err.startswith("st-yled: error: ")
+
+    def test_build_does_not_load_streamlit(self, tmp_path):
+        (tmp_path / "theme.json").write_text(json.dumps(THEME))
+        code = (
+            "import sys; from st_yled import cli; "
+            f"cli.main(['build', {str(tmp_path / 'theme.json')!r}, "
+            f"'-o', {str(tmp_path / 'theme.css')!r}]); "
+            "print('streamlit' in sys.modules)"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": SRC},
+            check=True,
+        )
+
+        assert proc.stdout.split()[-1] == "False"
+        assert (tmp_path / "theme.css").read_text() == cli.build_stylesheet(THEME) + "\n"
@@ -13,6 +13,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "st_yled"))
 
 from st_yled import elements
 
+# Keyword arguments of the container around styled elements, by Streamlit version
+CONTAINER_KWARGS = {"width": "stretch"} if elements.CONTAINER_WIDTH else {}
+
 
 class TestComponentImports:
     """Test that all component functions can be imported and are callable."""
@@ -565,7 +568,7 @@ class TestComponentFunctionality:
         result = elements.markdown("# Test", color="red")
 
         # Should call container with the key from styler
-        mock_st.container.assert_called_once_with(key="test_key_123", width="stretch")
+        mock_st.container.assert_called_once_with(key="test_key_123", **CONTAINER_KWARGS)
 
         # Should call markdown without the key (key is handled by container)
         mock_container.markdown.assert_called_once_with("# Test")
@@ -631,3 +634,89 @@ class TestComponentEdgeCases:
 
             mock_styler.apply_component_css.assert_called_with("json", {"background_color": "white"})
             mock_container.json.assert_called_once_with(complex_data)
+
+
+class TestUnstyledFastPath:
+    """Test that calls without styling kwargs go straight to Streamlit."""
+
+    @pytest.fixture
+    def mock_st(self):
+        from st_yled import styler
+
+        with patch('st_yled.elements.st') as mock_st, \
+             patch('st_yled.styler.st') as mock_styler_st, \
+             patch('st_yled.styler.apply_component_css') as mock_apply:
+            mock_styler_st.session_state = {}
+            styler.start_run_state(styler.extract_caller_path_hash())
+            mock_apply.side_effect = lambda component_type, kwargs: kwargs
+            yield mock_st, mock_apply
+
+    def test_unstyled_wrapper_skips_container(self, mock_st):
+        mock_st, mock_apply = mock_st
+
+        result = elements.markdown("# Hello", help="tooltip")
+
+        mock_apply.assert_not_called()
+        mock_st.container.assert_not_called()
+        mock_st.markdown.assert_called_once_with("# Hello", help="tooltip")
+        assert result is mock_st.markdown.return_value
+
+    def test_unstyled_widget_keeps_native_key(self, mock_st):
+        mock_st, mock_apply = mock_st
+
+        elements.button("Go", type="primary", key="go")
+
+        mock_apply.assert_not_called()
+        mock_st.button.assert_called_once_with("Go", type="primary", key="go")
+
+    def test_unstyled_widgets_get_distinct_keys(self, mock_st):
+        mock_st, mock_apply = mock_st
+
+        for _ in range(2):
+            elements.button("Delete")
+
+        mock_apply.assert_not_called()
+        keys = [c.kwargs["key"] for c in mock_st.button.call_args_list]
+        assert [key.rsplit("-", 1)[1] for key in keys] == ["0", "1"]
+
+    def test_unstyled_elements_keep_key_numbering(self, mock_st):
+        mock_st, _ = mock_st
+
+        elements.markdown("# Hello")
+        elements.checkbox("Agree")
+
+        # The markdown call takes number 0, as it does when styled
+        assert mock_st.checkbox.call_args.kwargs["key"].endswith("-1")
+
+    def test_styled_and_aliased_calls_use_styled_path(self, mock_st):
+        mock_st, mock_apply = mock_st
+
+        elements.markdown("# Hello", color="red")
+        elements.button("Go", bg_color="red")
+
+        assert [c.args[0] for c in mock_apply.call_args_list] == ["markdown", "button"]
+        mock_st.container.assert_called_once()
+
+    def test_wrapper_with_key_uses_keyed_container(self, mock_st):
+        mock_st, mock_apply = mock_st
+
+        elements.caption("Note", key="note")
+
+        assert mock_apply.call_args.args[0] == "caption"
+        mock_st.container.assert_called_once_with(key="note", **CONTAINER_KWARGS)
+
+
+class TestContainerWidth:
+    """Test the width of the container around styled elements."""
+
+    def test_width_is_omitted_where_streamlit_lacks_it(self):
+        with patch('st_yled.elements.st') as mock_st, \
+             patch('st_yled.elements.CONTAINER_WIDTH', False), \
+             patch('st_yled.styler.apply_component_css') as mock_apply:
+            mock_apply.side_effect = lambda component_type, kwargs: kwargs
+            elements.markdown("# Hello", key="hello", width=200)
+
+        mock_st.container.assert_called_once_with(key="hello")
+        mock_st.container.return_value.markdown.assert_called_once_with(
+            "# Hello", width=200
+        )
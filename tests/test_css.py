@@ -0,0 +1,126 @@
+"""Tests for CSS minification."""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "st_yled"))
+
+from st_yled.css import merge_rules, minify_css
+
+
+class TestMinifyCSS:
+    """Test whitespace, comment and redundant declaration removal."""
+
+    def test_removes_whitespace_and_last_semicolon(self):
+        css = ".a  >  p ,\n.b {\n    color: red !important;\n    margin: 0 auto;\n}\n"
+
+        assert minify_css(css) == ".a>p,.b{color:red!important;margin:0 auto}"
+
+    def test_removes_comments(self):
+        css = "/* header */ h1 { color: red; /* don't */ }"
+
+        assert minify_css(css) == "h1{color:red}"
+
+    def test_keeps_descendant_pseudo_class_space(self):
+        assert minify_css(".a :hover { color: red; }") == ".a :hover{color:red}"
+
+    def test_keeps_strings_and_urls(self):
+        css = (
+            'p::before { content: "a;  /* b */  c"; }\n'
+            ".x { background: url(data:image/png;base64,AA==) ; }"
+        )
+
+        assert minify_css(css) == (
+            'p::before{content:"a;  /* b */  c"}'
+            ".x{background:url(data:image/png;base64,AA==)}"
+        )
+
+    def test_keeps_spaces_in_calc(self):
+        assert minify_css("p { width: calc(1px + 2px); }") == "p{width:calc(1px + 2px)}"
+
+    def test_removes_identical_earlier_declarations(self):
+        css = "p { margin: 0; margin-top: 1px; margin: 0; }"
+
+        assert minify_css(css) == "p{margin-top:1px;margin:0}"
+
+    def test_keeps_fallback_declarations(self):
+        css = "p { display: -webkit-box; display: flex; }"
+
+        assert minify_css(css) == "p{display:-webkit-box;display:flex}"
+
+    def test_removes_empty_rules_in_media_queries(self):
+        css = "@media (min-width: 600px) { .x { } .y { color: red; } }"
+
+        assert minify_css(css) == "@media (min-width:600px){.y{color:red}}"
+
+
+class TestMergeRules:
+    """Test merging rules per selector and grouping identical declaration blocks."""
+
+    def test_merges_declarations_of_same_selector(self):
+        rules = [("a", (("color", "red"),)), ("a", (("font-size", "1px"),))]
+
+        assert merge_rules(rules) == [(("a",), (("color", "red"), ("font-size", "1px")))]
+
+    def test_later_declaration_wins_and_moves_last(self):
+        rules = [
+            ("a", (("margin", "0"), ("margin-top", "1px"))),
+            ("a", (("margin", "2px"),)),
+        ]
+
+        assert merge_rules(rules) == [(("a",), (("margin-top", "1px"), ("margin", "2px")))]
+
+    def test_groups_identical_declarations(self):
+        rules = [("a", (("color", "red"),)), ("b", (("color", "red"),))]
+
+        assert merge_rules(rules) == [(("a", "b"), (("color", "red"),))]
+
+    def test_does_not_move_past_conflicting_rules(self):
+        rules = [
+            ("a", (("color", "red"),)),
+            ("b", (("color", "blue"),)),
+            ("a", (("color", "green"),)),
+            ("c", (("border-width", "1px"),)),
+            ("d", (("border-color", "red"),)),
+            ("e", (("border-width", "1px"),)),
+        ]
+
+        assert merge_rules(rules) == [
+            (("a",), (("color", "red"),)),
+            (("b",), (("color", "blue"),)),
+            (("a",), (("color", "green"),)),
+            (("c",), (("border-width", "1px"),)),
+            (("d",), (("border-color", "red"),)),
+            (("e",), (("border-width", "1px"),)),
+        ]
+
+    def test_moves_past_unrelated_rules(self):
+        rules = [
+            ("a", (("color", "red"),)),
+            ("b", (("font-size", "1px"),)),
+            ("c", (("color", "red"),)),
+            ("a", (("border-style", "solid"),)),
+        ]
+
+        assert merge_rules(rules) == [
+            (("a",), (("color", "red"), ("border-style", "solid"))),
+            (("b",), (("font-size", "1px"),)),
+            (("c",), (("color", "red"),)),
+        ]
+
+    def test_has_selectors_are_not_grouped_with_others(self):
+        rules = [("a:has(b)", (("color", "red"),)), ("c", (("color", "red"),))]
+
+        assert merge_rules(rules) == [
+            (("a:has(b)",), (("color", "red"),)),
+            (("c",), (("color", "red"),)),
+        ]
+
+    def test_empty_selector_is_not_grouped(self):
+        rules = [("", (("color", "red"),)), ("c", (("color", "red"),))]
+
+        assert merge_rules(rules) == [
+            (("",), (("color", "red"),)),
+            (("c",), (("color", "red"),)),
+        ]
@@ -0,0 +1,84 @@
+"""Tests for the st_yled package namespace."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+sys.path.append(SRC)
+
+import st_yled
+
+
+class TestLazyLoading:
+    """Test PEP 562 lazy loading of the package attributes."""
+
+    def test_import_does_not_load_streamlit(self):
+        code = (
+            "import sys, st_yled; "
+            "print('streamlit' in sys.modules, 'st_yled.styler' in sys.modules)"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": SRC},
+            check=True,
+        )
+
+        assert proc.stdout.split() == ["False", "False"]
+
+    def test_element_wrappers_are_resolved(self):
+        from st_yled import elements
+
+        assert st_yled.button is elements.button
+        assert st_yled.markdown is elements.markdown
+
+    def test_core_functions_are_resolved(self):
+        from st_yled import core
+
+        assert st_yled.init is core.init
+        assert st_yled.set is core.set
+
+    def test_submodules_are_resolved(self):
+        from st_yled import styler
+
+        assert st_yled.styler is styler
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError, match="has no attribute 'not_an_element'"):
+            st_yled.not_an_element
+
+    def test_dir_lists_elements(self):
+        assert "button" in dir(st_yled)
+        assert "init" in dir(st_yled)
+
+    def test_star_import_exports_public_api(self):
+        namespace = {}
+        exec("from st_yled import *", namespace)
+
+        assert namespace["button"] is st_yled.button
+        assert namespace["init"] is st_yled.init
+        assert namespace["theme"] is st_yled.theme
+
+    def test_all_lists_every_element_wrapper(self):
+        import inspect
+        from st_yled import elements
+
+        wrappers = {
+            name
+            for name, value in vars(elements).items()
+            if inspect.isfunction(value)
+            and value.__module__ == elements.__name__
+            and not name.startswith("_")
+        }
+
+        assert set(st_yled.__all__) == wrappers | set(st_yled._CORE_ATTRS)
+
+    def test_element_styles_loaded_on_demand(self):
+        from st_yled import styler
+
+        assert styler.ELEMENT_STYLES is styler.load_element_styles()
+        assert "button" in styler.ELEMENT_STYLES
@@ -0,0 +1,174 @@
+"""Tests for the precompiled element style index."""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "st_yled"))
+
+from st_yled import style_index
+
+
+class TestStyleIndex:
+    """Test building, validating and loading the style index."""
+
+    def test_shipped_index_is_current(self):
+        """Fails if element_styles.json changed without `python -m st_yled.style_index`."""
+        source_hash = style_index.get_source_hash(style_index.STYLES_PATH.read_bytes())
+
+        index = style_index.read_index(style_index.INDEX_PATH, source_hash)
+
+        assert index is not None
+        assert index == style_index.compile_index(style_index.STYLES_PATH.read_bytes())
+
+    def test_properties_match_table(self):
+        index = style_index.load_index()
+
+        templates = index.properties[("button", "color")]
+        table_entry = index.elements["button"]["css"]["color"]
+
+        assert templates == tuple(
+            (selector, tuple(sel_css.items())) for selector, sel_css in table_entry.items()
+        )
+        assert len(index.properties) == sum(
+            len(element["css"]) for element in index.elements.values()
+        )
+
+    def test_loaded_table_is_read_only(self):
+        index = style_index.load_index()
+        button = index.elements["button"]
+
+        with pytest.raises(TypeError):
+            button["category"] = "changed"
+        with pytest.raises(TypeError):
+            button["css"]["color"]["div"] = {}
+        with pytest.raises(TypeError):
+            index.properties[("button", "color")] = ()
+
+    def test_freeze_keeps_shared_objects_shared(self):
+        declarations = {"color": None}
+        frozen = style_index.freeze({"a": declarations, "b": declarations, "c": [1]})
+
+        assert frozen["a"] is frozen["b"]
+        assert frozen["c"] == (1,)
+
+    def test_build_and_read_roundtrip(self, tmp_path):
+        styles_path = tmp_path / "styles.json"
+        index_path = tmp_path / "styles.pickle"
+        styles_path.write_text(
+            json.dumps(
+                {"elements": {"box": {"css": {"color": {".box": {"color": None}}}}}}
+            )
+        )
+
+        built = style_index.build_index(styles_path, index_path)
+        loaded = style_index.load_index(styles_path, index_path)
+
+        assert loaded == built
+        assert loaded.properties == {("box", "color"): ((".box", (("color", None),)),)}
+
+    def test_stale_index_falls_back_to_json(self, tmp_path):
+        styles_path = tmp_path / "styles.json"
+        index_path = tmp_path / "styles.pickle"
+        styles_path.write_text(json.dumps({"elements": {"box": {"css": {}}}}))
+        style_index.build_index(styles_path, index_path)
+
+        styles_path.write_text(json.dumps({"elements": {"panel": {"css": {}}}}))
+        source_hash = style_index.get_source_hash(styles_path.read_bytes())
+
+        assert style_index.read_index(index_path, source_hash) is None
+        assert list(style_index.load_index(styles_path, index_path).elements) == ["panel"]
+
+    def test_missing_or_corrupt_index_falls_back_to_json(self, tmp_path):
+        styles_path = tmp_path / "styles.json"
+        index_path = tmp_path / "styles.pickle"
+        styles_path.write_text(json.dumps({"elements": {"box": {"css": {}}}}))
+
+        assert list(style_index.load_index(styles_path, index_path).elements) == ["box"]
+
+        index_path.write_bytes(b"not a pickle")
+
+        assert list(style_index.load_index(styles_path, index_path).elements) == ["box"]
+
+
+class TestStyleTemplates:
+    """Test expansion of shared style templates."""
+
+    SCHEMA = {
+        "templates": {
+            "control": {
+                "css": {
+                    "color": {"{control}": {"color": None}},
+                    "font_size": {"{control} p": {"font-size": None}},
+                }
+            },
+            "button": {
+                "template": "control",
+                "params": {"control": '.stButton > button[kind="{kind}"]'},
+            },
+        },
+        "elements": {
+            "button_primary": {
+                "template": "button",
+                "params": {"kind": "primary"},
+                "category": "input",
+            },
+            "title": {"css": {"color": {"h1": {"color": None}}}},
+        },
+    }
+
+    def test_template_params_are_substituted(self):
+        elements = style_index.expand_styles(self.SCHEMA)
+
+        assert elements["button_primary"] == {
+            "css": {
+                "color": {'.stButton > button[kind="primary"]': {"color": None}},
+                "font_size": {
+                    '.stButton > button[kind="primary"] p': {"font-size": None}
+                },
+            },
+            "category": "input",
+        }
+        assert elements["title"] == {"css": {"color": {"h1": {"color": None}}}}
+
+    def test_declarations_are_shared_between_variants(self):
+        schema = {
+            **self.SCHEMA,
+            "elements": {
+                "button_primary": {"template": "button", "params": {"kind": "primary"}},
+                "button_tertiary": {"template": "button", "params": {"kind": "tertiary"}},
+            },
+        }
+
+        elements = style_index.expand_styles(schema)
+
+        primary = next(iter(elements["button_primary"]["css"]["color"].values()))
+        tertiary = next(iter(elements["button_tertiary"]["css"]["color"].values()))
+        assert primary is tertiary
+
+    def test_unknown_template_raises(self):
+        schema = {"elements": {"box": {"template": "missing"}}}
+
+        with pytest.raises(ValueError, match="Unknown style template 'missing'"):
+            style_index.expand_styles(schema)
+
+    def test_missing_param_raises(self):
+        schema = {**self.SCHEMA, "elements": {"box": {"template": "button"}}}
+
+        with pytest.raises(ValueError, match="'kind' is not set for 'box'"):
+            style_index.expand_styles(schema)
+
+    def test_shipped_variants_expand(self):
+        elements = style_index.load_index().elements
+
+        assert elements["download_button_tertiary"]["css"]["font_size"] == {
+            '.stDownloadButton:has(button[kind="tertiary"]) > button p': {
+                "font-size": None
+            }
+        }
+        assert elements["form_submit_button"]["css"]["color"] == {
+            '.stFormSubmitButton > button[kind="secondaryFormSubmit"]': {"color": None}
+        }
@@ -3,6 +3,7 @@
 import pytest
 import sys
 import os
+from unittest.mock import patch
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "st_yled"))
@@ -14,3 +15,392 @@ def test_styler_module_exists():
         assert styler is not None
     except ImportError:
         pytest.fail("Failed to import styler module")
+
+
+class TestCSSRuleCache:
+    """Test memoization of compiled component CSS."""
+
+    def setup_method(self):
+        from st_yled import styler
+
+        styler.clear_css_cache()
+
+    def test_cached_css_matches_uncached(self):
+        from st_yled import styler
+
+        first = styler.generate_component_css("button", {"color": "red"}, "a")
+        second = styler.generate_component_css("button", {"color": "red"}, "b")
+
+        assert first.startswith(".st-key-a ")
+        assert second == first.replace(".st-key-a ", ".st-key-b ")
+        assert styler.get_css_cache_info()["hits"] == 1
+        assert styler.get_css_cache_info()["misses"] == 1
+
+    def test_cache_hit_removes_styling_kwargs(self):
+        from st_yled import styler
+
+        styler.generate_component_css("button", {"color": "red"}, None)
+        kwargs = {"color": "red", "label": "Go"}
+        css = styler.generate_component_css("button", kwargs, None)
+
+        assert "color:red!important" in css
+        assert kwargs == {"label": "Go"}
+
+    def test_equal_values_of_different_types_are_cached_separately(self):
+        from st_yled import styler
+
+        css = [
+            styler.generate_component_css("button", {"border_width": value}, "k")
+            for value in (1.0, 1, True)
+        ]
+
+        assert "border-width:1.0" in css[0]
+        assert "border-width:1!" in css[1]
+        assert "border-width:True" in css[2]
+        assert styler.get_css_cache_info()["misses"] == 3
+
+    def test_cache_size_is_configurable(self):
+        from st_yled import styler
+
+        styler.set_css_cache_size(1)
+        try:
+            styler.generate_component_css("button", {"color": "red"}, None)
+            styler.generate_component_css("button", {"color": "blue"}, None)
+
+            info = styler.get_css_cache_info()
+            assert info["size"] == 1
+            assert info["evictions"] == 1
+        finally:
+            styler.set_css_cache_size(1024)
+
+    def test_css_is_minified_by_default(self):
+        from st_yled import styler
+
+        css = styler.generate_component_css("button", {"color": "red", "font_size": "12px"}, "a")
+
+        assert css == (
+            '.st-key-a .stButton:has(button[kind="secondary"])>button{color:red!important}'
+            '.st-key-a .stButton:has(button[kind="secondary"])>button p{font-size:12px!important}'
+        )
+
+    def test_minification_can_be_disabled(self):
+        from st_yled import styler
+
+        styler.StylerConfig.configure(minify_css=False)
+        try:
+            css = styler.generate_component_css("button", {"color": "red"}, "a")
+        finally:
+            styler.StylerConfig.configure(minify_css=True)
+
+        assert css == (
+            '.st-key-a .stButton:has(button[kind="secondary"]) > button {\n'
+            "    color: red !important;\n"
+            "}"
+        )
+
+    def test_selectors_with_identical_declarations_are_grouped(self):
+        from st_yled import styler
+
+        css = styler.generate_component_css("slider", {"color": "red"}, "k")
+
+        assert css.count("{") == 1
+        assert css.startswith(".st-key-k .stSlider label,.st-key-k .stSlider div[role=\"slider\"],")
+
+    def test_unhashable_values_bypass_cache(self):
+        from st_yled import styler
+
+        css = styler.generate_component_css("button", {"color": ["red"]}, None)
+
+        assert css
+        assert styler.get_css_cache_info()["size"] == 0
+
+
+class TestElementIndex:
+    """Test the precomputed element, variant and category lookups."""
+
+    def test_stylable_elements(self):
+        from st_yled import styler
+
+        elements = styler.get_stylable_elements()
+        base_elements = styler.get_stylable_elements(include_variants=False)
+
+        assert elements == tuple(sorted(elements))
+        assert "button_primary" in elements
+        assert "button_primary" not in base_elements
+        assert "button" in base_elements
+        assert styler.get_stylable_elements() is elements
+
+    def test_element_variants(self):
+        from st_yled import styler
+
+        assert styler.get_element_variants("button") == ("primary", "secondary", "tertiary")
+        assert styler.get_element_variants("text") == ()
+
+        with pytest.raises(ValueError, match="Element 'nope' not found"):
+            styler.get_element_variants("nope")
+
+    def test_elements_by_category(self):
+        from st_yled import styler
+
+        categories = styler.get_stylable_elements_by_category()
+
+        assert categories["input"]["button"] == ("primary", "secondary", "tertiary")
+        assert categories["text"]["caption"] == ("primary",)
+        assert list(categories) == sorted(categories)
+
+    def test_indexes_are_immutable(self):
+        from st_yled import styler
+
+        with pytest.raises(TypeError):
+            styler.get_stylable_elements_by_category()["input"] = {}
+        with pytest.raises(TypeError):
+            styler.get_stylable_elements_by_category()["input"]["button"] = ()
+        with pytest.raises(TypeError):
+            styler.load_element_index().variants["button"] = ()
+
+
+class TestUserCSSFile:
+    """Test cached resolution and loading of the st_yled.init() CSS file."""
+
+    def setup_method(self):
+        from st_yled import styler
+
+        styler.clear_css_file_cache()
+
+    def test_contents_are_cached_until_file_changes(self, tmp_path):
+        from st_yled import styler
+
+        css_file = tmp_path / "custom.css"
+        css_file.write_text("h1 { color: red; }")
+
+        assert styler.load_user_css(str(css_file)) == "h1 { color: red; }"
+        assert styler.load_user_css(str(css_file)) == "h1 { color: red; }"
+        assert styler.CSS_FILE_CACHE.info()["hits"] == 1
+        assert styler.CSS_FILE_CACHE.info()["misses"] == 1
+
+        css_file.write_text("h1 { color: blue; }")
+
+        assert styler.load_user_css(str(css_file)) == "h1 { color: blue; }"
+        assert styler.CSS_FILE_CACHE.info()["misses"] == 2
+
+    def test_unchanged_file_is_not_read_again(self, tmp_path):
+        from st_yled import styler
+
+        css_file = tmp_path / "custom.css"
+        css_file.write_text("h1 { color: red; }")
+        styler.load_user_css(str(css_file))
+
+        with patch("pathlib.Path.read_text") as mock_read_text:
+            assert styler.load_user_css(str(css_file)) == "h1 { color: red; }"
+            mock_read_text.assert_not_called()
+
+    def test_missing_explicit_path_raises(self, tmp_path):
+        from st_yled import styler
+
+        with pytest.raises(FileNotFoundError, match="CSS file not found"):
+            styler.load_user_css(str(tmp_path / "missing.css"))
+
+    def test_default_path_in_working_directory(self, tmp_path, monkeypatch):
+        from st_yled import styler
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path / "home")
+
+        assert styler.load_user_css() is None
+
+        (tmp_path / ".streamlit").mkdir()
+        (tmp_path / ".streamlit" / "st-styled.css").write_text("p { margin: 0; }")
+
+        assert styler.load_user_css() == "p { margin: 0; }"
+
+    def test_removed_file_is_resolved_again(self, tmp_path, monkeypatch):
+        from st_yled import styler
+
+        home_css = tmp_path / "home" / ".streamlit" / "st-styled.css"
+        home_css.parent.mkdir(parents=True)
+        home_css.write_text("p { color: gray; }")
+        local_css = tmp_path / "app" / ".streamlit" / "st-styled.css"
+        local_css.parent.mkdir(parents=True)
+        local_css.write_text("p { color: black; }")
+        monkeypatch.chdir(tmp_path / "app")
+        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path / "home")
+
+        assert styler.load_user_css() == "p { color: black; }"
+
+        local_css.unlink()
+
+        assert styler.load_user_css() == "p { color: gray; }"
+
+    def test_concurrent_sessions_resolve_removed_file_again(self, tmp_path, monkeypatch):
+        import threading
+        from st_yled import styler
+
+        home_css = tmp_path / "home" / ".streamlit" / "st-styled.css"
+        home_css.parent.mkdir(parents=True)
+        home_css.write_text("p { color: gray; }")
+        local_css = tmp_path / "app" / ".streamlit" / "st-styled.css"
+        local_css.parent.mkdir(parents=True)
+        local_css.write_text("p { color: black; }")
+        monkeypatch.chdir(tmp_path / "app")
+        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path / "home")
+        assert styler.load_user_css() == "p { color: black; }"
+        local_css.unlink()
+
+        # All sessions find the stale cached path before any of them drops it,
+        # and drop it before any of them caches the resolved one
+        thread_count = 8
+        read_barrier = threading.Barrier(thread_count)
+        resolve_barrier = threading.Barrier(thread_count)
+        read_css_file = styler.read_css_file
+        resolve_css_file = styler._resolve_css_file
+
+        def read_after_barrier(path):
+            if path == local_css:
+                read_barrier.wait(timeout=5)
+            return read_css_file(path)
+
+        def resolve_after_barrier(css_path):
+            resolve_barrier.wait(timeout=5)
+            return resolve_css_file(css_path)
+
+        results = []
+        errors = []
+
+        def work():
+            try:
+                results.append(styler.load_user_css())
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        threads = [threading.Thread(target=work) for _ in range(thread_count)]
+        with patch("st_yled.styler.read_css_file", side_effect=read_after_barrier), \
+             patch("st_yled.styler._resolve_css_file", side_effect=resolve_after_barrier):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=30)
+
+        assert errors == []
+        assert results == ["p { color: gray; }"] * thread_count
+
+    def test_init_emits_cached_css(self, tmp_path):
+        import st_yled
+        from st_yled import styler
+
+        css_file = tmp_path / "custom.css"
+        css_file.write_text("h1 { color: red; }")
+
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+            st_yled.init(str(css_file))
+            st_yled.init(str(css_file))
+            stats = styler.get_styling_stats()
+
+        assert mock_st.html.call_count == 2
+        mock_st.html.assert_called_with("<style>h1{color:red}</style>")
+        assert styler.CSS_FILE_CACHE.info()["hits"] == 1
+        assert stats.session["style_emissions"] == 2
+        assert stats.session["css_bytes"] == 2 * len("h1{color:red}")
+
+    def test_init_batches_user_css(self, tmp_path):
+        import st_yled
+        from st_yled import styler
+
+        css_file = tmp_path / "custom.css"
+        css_file.write_text("h1 { color: red; }")
+
+        styler.StylerConfig.configure(batch_css=True)
+        try:
+            with patch("st_yled.styler.st") as mock_st:
+                mock_st.session_state = {}
+                st_yled.init(str(css_file))
+                styler.apply_component_css("button", {"color": "#ff0000"})
+                st_yled.flush()
+        finally:
+            styler.StylerConfig.configure(batch_css=False)
+
+        mock_st.html.assert_not_called()
+        stylesheet = mock_st.empty.return_value.html.call_args.args[0]
+        assert stylesheet.startswith("<style>h1{color:red}")
+        assert "#ff0000" in stylesheet
+
+
+class TestStyleKeys:
+    """Test detection of calls that pass styling kwargs."""
+
+    def test_style_keys_include_aliases(self):
+        from st_yled import styler
+
+        keys = styler.get_style_keys("button")
+
+        assert {"color", "background_color", "bg_color", "text_color", "size"} <= keys
+        assert "label" not in keys
+        assert styler.get_style_keys("markdown") == {
+            "color",
+            "font_size",
+            "text_color",
+            "font_color",
+            "size",
+        }
+
+    def test_has_style_kwargs(self):
+        from st_yled import styler
+
+        assert not styler.has_style_kwargs("markdown", {"help": "tip", "key": "k"})
+        assert styler.has_style_kwargs("markdown", {"color": "red"})
+        assert styler.has_style_kwargs("button", {"bg_color": "red"})
+        # Properties of other elements do not count
+        assert not styler.has_style_kwargs("markdown", {"border_style": "solid"})
+
+    def test_unknown_component_counts_as_styled(self):
+        from st_yled import styler
+
+        assert styler.get_style_keys("button_unknown") is None
+        assert styler.has_style_kwargs("button_unknown", {})
+
+
+class TestConcurrentSessions:
+    """Test shared tables and caches under many concurrent script threads."""
+
+    def test_threads_generate_same_css_as_serial_run(self):
+        import threading
+        from st_yled import styler
+
+        styles = [
+            ("button", {"color": f"#{i:06x}", "font_size": 10 + i % 8})
+            for i in range(48)
+        ] + [("text", {"background_color": "red", "border_width": i}) for i in range(16)]
+
+        def render(component_type, kwargs):
+            return styler.generate_component_css(component_type, dict(kwargs), "k")
+
+        styler.clear_css_cache()
+        expected = [render(*style) for style in styles]
+
+        # Small cache, so threads keep evicting each other's entries
+        styler.set_css_cache_size(16)
+        styler.clear_css_cache()
+        results = {}
+        errors = []
+        barrier = threading.Barrier(24)
+
+        def work(n):
+            barrier.wait()
+            try:
+                results[n] = [render(*style) for style in styles * 5]
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(24)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=60)
+        finally:
+            styler.set_css_cache_size(1024)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert errors == []
+        assert all(result == expected * 5 for result in results.values())
+        assert len(results) == 24
@@ -8,7 +8,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "st_yled"))
 
 from unittest.mock import patch, MagicMock
 from st_yled.styler import apply_component_css, apply_component_css_global, get_css_properties_from_args
-from st_yled.styler import extract_caller_path_hash
+from st_yled.styler import extract_caller_path_hash, start_run_state
 from st_yled.validation import ValidationConfig, ValidationError
 import st_yled
 
@@ -30,7 +30,8 @@ class TestStylerValidationIntegration:
 
             # Generate a hash using the caller's file path
             caller_hash = extract_caller_path_hash()
-            mock_st.session_state = {f'st-yled-comp-{caller_hash}-counter': 0}
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
 
             result_kwargs = apply_component_css("text", kwargs)
 
@@ -63,7 +64,8 @@ class TestStylerValidationIntegration:
         with patch("st_yled.styler.st") as mock_st:
             # Mock session_state as a dictionary
             caller_hash = extract_caller_path_hash()
-            mock_st.session_state = {f'st-yled-comp-{caller_hash}-counter': 0}
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
             result_kwargs = apply_component_css("button", kwargs)
 
             # Verify CSS was generated
@@ -87,7 +89,8 @@ class TestStylerValidationIntegration:
         with patch("st_yled.styler.st") as mock_st:
             # Mock session_state as a dictionary
             caller_hash = extract_caller_path_hash()
-            mock_st.session_state = {f'st-yled-comp-{caller_hash}-counter': 0}
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
             result_kwargs = apply_component_css("text", kwargs)
 
             # Original key should be preserved
@@ -97,6 +100,7 @@ class TestStylerValidationIntegration:
         """Test that invalid styling properties raise error in strict mode."""
         # Set environment variable for strict mode
         os.environ["ST_STYLED_STRICT_VALIDATION"] = "true"
+        ValidationConfig.reload()
 
         try:
             kwargs = {
@@ -113,6 +117,7 @@ class TestStylerValidationIntegration:
         finally:
             # Clean up environment variable
             os.environ.pop("ST_STYLED_STRICT_VALIDATION", None)
+            ValidationConfig.reload()
 
     def test_apply_component_css_with_invalid_styling_permissive_mode(self):
         """Test that invalid styling is removed in permissive mode."""
@@ -127,7 +132,8 @@ class TestStylerValidationIntegration:
         with patch("st_yled.styler.st") as mock_st:
             # Mock session_state as a dictionary
             caller_hash = extract_caller_path_hash()
-            mock_st.session_state = {f'st-yled-comp-{caller_hash}-counter': 0}
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
             # Should not raise error in permissive mode - invalid properties are removed by validation
             result_kwargs = apply_component_css("text", kwargs)
 
@@ -139,6 +145,7 @@ class TestStylerValidationIntegration:
         """Test that validation can be bypassed via environment variable."""
         # Set bypass environment variable
         os.environ["ST_STYLED_BYPASS_VALIDATION"] = "true"
+        ValidationConfig.reload()
 
         try:
             kwargs = {
@@ -149,7 +156,8 @@ class TestStylerValidationIntegration:
             with patch("st_yled.styler.st") as mock_st:
                 # Mock session_state as a dictionary
                 caller_hash = extract_caller_path_hash()
-                mock_st.session_state = {f'st-yled-comp-{caller_hash}-counter': 0}
+                mock_st.session_state = {}
+                start_run_state(caller_hash)
                 result_kwargs = apply_component_css("text", kwargs)
 
                 # When bypassed, validation is skipped, but CSS processing still happens
@@ -160,6 +168,7 @@ class TestStylerValidationIntegration:
         finally:
             # Clean up environment variable
             os.environ.pop("ST_STYLED_BYPASS_VALIDATION", None)
+            ValidationConfig.reload()
 
     def test_apply_component_css_no_styling_properties(self):
         """Test component with no styling properties."""
@@ -171,7 +180,8 @@ class TestStylerValidationIntegration:
         with patch("st_yled.styler.st") as mock_st:
             # Mock session_state as a dictionary
             caller_hash = extract_caller_path_hash()
-            mock_st.session_state = {f'st-yled-comp-{caller_hash}-counter': 0}
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
             result_kwargs = apply_component_css("text", kwargs)
 
             # No CSS should be generated for no styling properties
@@ -195,7 +205,8 @@ class TestStylerValidationIntegration:
         with patch("st_yled.styler.st") as mock_st:
             # Mock session_state as a dictionary
             caller_hash = extract_caller_path_hash()
-            mock_st.session_state = {f'st-yled-comp-{caller_hash}-counter': 0}
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
             result_kwargs = apply_component_css("text", kwargs)
 
             # Unsupported properties should not be processed/removed
@@ -239,21 +250,26 @@ class TestStylerValidationIntegration:
         """Test ValidationConfig class methods."""
         # Test is_validation_bypassed
         os.environ.pop("ST_STYLED_BYPASS_VALIDATION", None)
+        ValidationConfig.reload()
         assert ValidationConfig.is_validation_bypassed() is False
 
         os.environ["ST_STYLED_BYPASS_VALIDATION"] = "true"
+        ValidationConfig.reload()
         assert ValidationConfig.is_validation_bypassed() is True
 
         # Test get_strict_mode
         os.environ.pop("ST_STYLED_STRICT_VALIDATION", None)
+        ValidationConfig.reload()
         assert ValidationConfig.get_strict_mode() is False  # Default
 
         os.environ["ST_STYLED_STRICT_VALIDATION"] = "true"
+        ValidationConfig.reload()
         assert ValidationConfig.get_strict_mode() is True
 
         # Clean up
         os.environ.pop("ST_STYLED_BYPASS_VALIDATION", None)
         os.environ.pop("ST_STYLED_STRICT_VALIDATION", None)
+        ValidationConfig.reload()
 
     def test_css_generation_with_component_key(self):
         """Test that CSS generation includes component key selector."""
@@ -284,7 +300,8 @@ class TestStylerValidationIntegration:
         with patch("st_yled.styler.st") as mock_st:
             # Mock session_state as a dictionary
             caller_hash = extract_caller_path_hash()
-            mock_st.session_state = {f'st-yled-comp-{caller_hash}-counter': 0}
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
             result_kwargs = apply_component_css("text", kwargs)
 
             # Supported styling properties should be removed
@@ -309,7 +326,8 @@ class TestStylerValidationIntegration:
         with patch("st_yled.styler.st") as mock_st:
             # Mock session_state as a dictionary
             caller_hash = extract_caller_path_hash()
-            mock_st.session_state = {f'st-yled-comp-{caller_hash}-counter': 0}
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
             # Should not raise error
             apply_component_css_global("text", kwargs)
 
@@ -326,10 +344,594 @@ class TestStylerValidationIntegration:
         with patch("st_yled.styler.st") as mock_st:
             # Mock session_state as a dictionary
             caller_hash = extract_caller_path_hash()
-            mock_st.session_state = {f'st-yled-comp-{caller_hash}-counter': 0}
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
             # Should complete but issue warnings
             result_kwargs = apply_component_css("text", kwargs)
             # Supported styling should be processed
             assert "color" not in result_kwargs
             # Non-CSS properties should remain
             assert "value" in result_kwargs
+
+
+class TestSharedStyleClasses:
+    """Test content-addressed shared style rules."""
+
+    def setup_method(self):
+        from st_yled.styler import StylerConfig
+
+        StylerConfig.configure(shared_classes=True)
+
+    def teardown_method(self):
+        from st_yled.styler import StylerConfig
+
+        StylerConfig.configure(shared_classes=False)
+
+    def test_identical_styles_emit_one_rule(self):
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
+
+            first = apply_component_css("button", {"label": "A", "color": "#ff0000"})
+            second = apply_component_css("button", {"label": "B", "color": "#ff0000"})
+
+            # Keys stay unique but share the style hash prefix
+            assert first["key"] != second["key"]
+            assert first["key"].rsplit("-", 1)[0] == second["key"].rsplit("-", 1)[0]
+
+            mock_st.html.assert_called_once()
+            css_call = mock_st.html.call_args[0][0]
+            assert '[class*="st-key-st-yler-s' in css_call
+
+    def test_different_styles_emit_separate_rules(self):
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
+
+            apply_component_css("button", {"color": "#ff0000"})
+            apply_component_css("button", {"color": "#00ff00"})
+
+            assert mock_st.html.call_count == 2
+
+    def test_user_key_keeps_scoped_rule(self):
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+
+            apply_component_css("button", {"color": "#ff0000", "key": "mine"})
+
+            css_call = mock_st.html.call_args[0][0]
+            assert ".st-key-mine " in css_call
+
+    def test_unknown_option_rejected(self):
+        from st_yled.styler import StylerConfig
+
+        with pytest.raises(ValueError, match="Unknown st_yled configuration option"):
+            StylerConfig.configure(not_an_option=True)
+
+
+class TestBatchedStylesheet:
+    """Test collecting CSS of a run into one stylesheet."""
+
+    def setup_method(self):
+        from st_yled.styler import StylerConfig
+
+        StylerConfig.configure(batch_css=True)
+
+    def teardown_method(self):
+        from st_yled.styler import StylerConfig
+
+        StylerConfig.configure(batch_css=False)
+
+    def test_css_is_emitted_once_on_flush(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
+            styler.start_css_batch()
+            placeholder = mock_st.empty.return_value
+
+            apply_component_css("button", {"color": "#ff0000"})
+            apply_component_css("text", {"color": "#00ff00"})
+            apply_component_css_global("text", {"font_size": "12px"})
+
+            mock_st.html.assert_not_called()
+            placeholder.html.assert_not_called()
+
+            styler.flush_css_batch()
+
+            placeholder.html.assert_called_once()
+            stylesheet = placeholder.html.call_args[0][0]
+            assert stylesheet.count("<style>") == 1
+            assert "#ff0000" in stylesheet
+            assert "#00ff00" in stylesheet
+            assert "12px" in stylesheet
+
+    def test_checkpoint_flush_replaces_stylesheet(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
+            styler.start_css_batch()
+            placeholder = mock_st.empty.return_value
+
+            apply_component_css("button", {"color": "#ff0000"})
+            styler.flush_css_batch()
+            # Nothing new to emit
+            styler.flush_css_batch()
+            apply_component_css("button", {"color": "#0000ff"})
+            styler.flush_css_batch()
+
+            assert placeholder.html.call_count == 2
+            stylesheet = placeholder.html.call_args[0][0]
+            assert "#ff0000" in stylesheet
+            assert "#0000ff" in stylesheet
+
+    def test_run_ending_without_flush_warns(self):
+        import warnings
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
+            styler.start_css_batch()
+            apply_component_css("button", {"color": "#ff0000"})
+            styler.flush_css_batch()
+
+            # Flushed runs do not warn
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                start_run_state(caller_hash)
+
+            styler.start_css_batch()
+            apply_component_css("button", {"color": "#ff0000"})
+
+            with pytest.warns(UserWarning, match="1 CSS rules batched in the last run"):
+                start_run_state(caller_hash)
+
+    def test_without_batch_css_is_emitted_directly(self):
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
+
+            apply_component_css("button", {"color": "#ff0000"})
+
+            mock_st.html.assert_called_once()
+
+
+class TestCallSiteKeys:
+    """Test component keys derived from the call site."""
+
+    def setup_method(self):
+        from st_yled.styler import StylerConfig
+
+        StylerConfig.configure(key_strategy="callsite")
+
+    def teardown_method(self):
+        from st_yled.styler import StylerConfig
+
+        StylerConfig.configure(key_strategy="counter")
+
+    @staticmethod
+    def _render(mock_st, show_extra):
+        caller_hash = extract_caller_path_hash()
+        mock_st.session_state = {}
+        start_run_state(caller_hash)
+        keys = []
+        if show_extra:
+            keys.append(apply_component_css("text", {"color": "#000000"})["key"])
+        for _ in range(2):
+            keys.append(apply_component_css("button", {"color": "#ff0000"})["key"])
+        keys.append(apply_component_css("text", {"color": "#0000ff"})["key"])
+        return keys
+
+    def test_keys_stable_when_earlier_element_is_conditional(self):
+        with patch("st_yled.styler.st") as mock_st:
+            without_extra = self._render(mock_st, show_extra=False)
+            with_extra = self._render(mock_st, show_extra=True)
+
+        assert with_extra[1:] == without_extra
+
+    def test_repeated_call_site_gets_occurrence_index(self):
+        with patch("st_yled.styler.st") as mock_st:
+            keys = self._render(mock_st, show_extra=False)
+
+        assert len(set(keys)) == 3
+        assert keys[0].endswith("-0")
+        assert keys[1].endswith("-1")
+        assert keys[0][:-2] == keys[1][:-2]
+
+    def test_unknown_key_strategy_rejected(self):
+        from st_yled.styler import StylerConfig
+
+        with pytest.raises(ValueError, match="Unknown key strategy"):
+            StylerConfig.configure(key_strategy="random")
+
+
+class TestStylingStats:
+    """Test per-run and per-session styling statistics."""
+
+    def test_counters_per_run_and_session(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
+            stats = styler.get_styling_stats()
+
+            apply_component_css("button", {"color": "#ff0000"})
+            apply_component_css("text", {"color": "#00ff00", "key": "k"})
+            apply_component_css_global("text", {"font_size": "12px"})
+
+            report = styler.get_stats_report()
+            assert report["run"]["styled_calls"] == 2
+            assert report["run"]["global_calls"] == 1
+            assert report["run"]["style_emissions"] == 3
+            emitted = sum(len(call[0][0]) - len("<style></style>") for call in mock_st.html.call_args_list)
+            assert report["run"]["css_bytes"] == emitted
+            assert report["run"]["validation_seconds"] > 0
+            assert report["run"]["css_generation_seconds"] > 0
+
+            # A new run resets run counters but keeps the session totals
+            start_run_state(caller_hash)
+            apply_component_css("button", {"color": "#ff0000"})
+
+            report = styler.get_stats_report()
+            assert report["run"]["styled_calls"] == 1
+            assert report["session"]["styled_calls"] == 3
+            assert report["session"]["runs"] == 2
+
+    def test_report_contains_cache_hit_rates(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+            report = styler.get_stats_report()
+
+        assert "hit_rate" in report["caches"]["css_rules"]
+        assert "hit_rate" in report["caches"]["validation"]
+
+    def test_minification_savings_are_reported(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
+
+            apply_component_css("button", {"color": "#ff0000", "key": "k"})
+            minified = styler.get_stats_report()["run"]
+
+            styler.StylerConfig.configure(minify_css=False)
+            try:
+                apply_component_css("button", {"color": "#ff0000", "key": "k"})
+            finally:
+                styler.StylerConfig.configure(minify_css=True)
+            total = styler.get_stats_report()["run"]
+
+        pretty_bytes = total["css_bytes"] - minified["css_bytes"]
+        assert minified["css_bytes_saved"] > 0
+        assert minified["css_bytes"] + minified["css_bytes_saved"] == pretty_bytes
+        assert total["css_bytes_saved"] == minified["css_bytes_saved"]
+
+
+class TestTheme:
+    """Test applying many global styles as one stylesheet."""
+
+    THEME = {
+        "button": {"background_color": "#0d6efd", "color": "white"},
+        "title": {"color": "navy", "font_size": "40px"},
+    }
+
+    def setup_method(self):
+        from st_yled import styler
+
+        styler.THEME_CACHE.clear()
+
+    def test_theme_emits_single_stylesheet(self):
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+            st_yled.theme(self.THEME)
+
+        mock_st.html.assert_called_once()
+        css_call = mock_st.html.call_args[0][0]
+        assert "background-color:#0d6efd!important" in css_call
+        assert "h1{color:navy!important;font-size:40px!important}" in css_call
+
+    def test_theme_matches_element_css(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+            st_yled.theme(self.THEME)
+
+        expected = "".join(
+            styler.generate_component_css(element, dict(styles), None)
+            for element, styles in self.THEME.items()
+        )
+        assert mock_st.html.call_args[0][0] == f"<style>{expected}</style>"
+
+    def test_equal_values_of_different_types_are_cached_separately(self):
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+            st_yled.theme({"button": {"border_width": 1}})
+            with pytest.warns(UserWarning, match="Invalid value 'Truepx'"):
+                st_yled.theme({"button": {"border_width": True}})
+
+        assert "border-width:1px" in mock_st.html.call_args_list[0][0][0]
+        # The invalid value is dropped instead of reusing the stylesheet of 1
+        assert mock_st.html.call_count == 1
+
+    def test_container_rule_is_not_grouped_with_other_selectors(self):
+        from st_yled import styler
+
+        css, _ = styler.render_theme_css(
+            {
+                "container": {"background_color": "red"},
+                "code": {"background_color": "red"},
+            },
+            True,
+        )
+
+        assert ",.stCode" not in css
+        assert ".stCode pre{background-color:red!important}" in css
+
+    def test_theme_merges_rules_across_elements(self):
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+            st_yled.theme({"slider": {"color": "red"}, "select_slider": {"color": "red"}})
+
+        css_call = mock_st.html.call_args[0][0]
+        assert css_call.count("{") == 1
+        assert css_call.count(".stSlider label") == 1
+
+    def test_repeated_theme_is_memoized(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st, patch(
+            "st_yled.styler.validate_styling_theme", wraps=styler.validate_styling_theme
+        ) as mock_validate:
+            mock_st.session_state = {}
+            st_yled.theme(self.THEME)
+            st_yled.theme({element: dict(styles) for element, styles in self.THEME.items()})
+
+        assert mock_validate.call_count == 1
+        assert mock_st.html.call_count == 2
+        assert mock_st.html.call_args_list[0] == mock_st.html.call_args_list[1]
+        assert styler.THEME_CACHE.info()["hits"] == 1
+
+    def test_unknown_property_raises(self):
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+            with pytest.raises(ValueError, match="No st_yled property width"):
+                st_yled.theme({"button": {"width": "10px"}})
+
+    def test_unknown_element_raises(self):
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+            with pytest.raises(ValueError, match="Component type 'nope' not found"):
+                st_yled.theme({"nope": {"color": "red"}})
+
+
+class TestRunState:
+    """Test the per-run state replacing session_state key counters."""
+
+    def test_key_generation_without_init_raises(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+
+            with pytest.raises(ValidationError, match="Was st_yled.init\\(\\) called?"):
+                styler.generate_component_key()
+
+    def test_keys_do_not_touch_session_state(self):
+        from st_yled import styler
+
+        class NoSessionState(dict):
+            def __getitem__(self, key):
+                raise AssertionError("session_state accessed")
+
+            __contains__ = __setitem__ = setdefault = get = __getitem__
+
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
+            mock_st.session_state = NoSessionState()
+
+            keys = [styler.generate_component_key() for _ in range(3)]
+            apply_component_css("button", {"color": "#ff0000"})
+
+        assert keys == [f"st-yler-comp-{caller_hash}-{i}" for i in range(3)]
+
+    def test_new_run_restarts_counter_and_keeps_stats(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            first = start_run_state(caller_hash)
+            styler.generate_component_key()
+
+            second = start_run_state(caller_hash)
+
+            assert second is first
+            assert styler.generate_component_key().endswith("-0")
+            assert mock_st.session_state["st-yled-stats"] is second.stats
+            assert second.stats.runs == 2
+
+    def test_state_is_kept_in_session_state(self):
+        from st_yled import styler
+
+        ctx_a, ctx_b = MagicMock(spec=[]), MagicMock(spec=[])
+        with patch("st_yled.styler.st") as mock_st, \
+             patch("st_yled.styler.get_script_run_ctx") as mock_get_ctx:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            mock_get_ctx.return_value = ctx_a
+            state = start_run_state(caller_hash)
+
+            assert mock_st.session_state[styler.RUN_STATE_KEY] is state
+            assert getattr(ctx_a, styler.RUN_STATE_ATTR) is state
+            assert styler.RUN_STATE.get() is None
+
+            # A rerun of the session gets a new context
+            mock_get_ctx.return_value = ctx_b
+            assert styler.get_run_state() is state
+            assert styler.generate_component_key().endswith("-0")
+
+            # Another session has not called init()
+            mock_st.session_state = {}
+            mock_get_ctx.return_value = MagicMock(spec=[])
+            assert styler.get_run_state() is None
+            with pytest.raises(ValidationError):
+                styler.generate_component_key()
+
+
+class TestRunStateGarbageCollection:
+    """Test pruning of auto-generated keys and scripts that are no longer rendered."""
+
+    def teardown_method(self):
+        from st_yled.styler import StylerConfig
+
+        StylerConfig.configure(stale_runs=10)
+
+    def test_state_of_keys_no_longer_rendered_is_removed(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+
+            start_run_state(caller_hash)
+            keys = [styler.generate_component_key() for _ in range(3)]
+            mock_st.session_state.update(dict.fromkeys(keys, "widget value"))
+            mock_st.session_state["user-key"] = 1
+
+            # The next run only renders the first element
+            start_run_state(caller_hash)
+            styler.generate_component_key()
+            assert set(keys) <= set(mock_st.session_state)
+
+            start_run_state(caller_hash)
+
+            assert keys[0] in mock_st.session_state
+            assert keys[1] not in mock_st.session_state
+            assert keys[2] not in mock_st.session_state
+            assert "user-key" in mock_st.session_state
+            assert styler.get_run_state().pruned_keys == 2
+
+    def test_scripts_not_started_again_are_pruned(self):
+        from st_yled import styler
+
+        styler.StylerConfig.configure(stale_runs=1)
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+
+            state = start_run_state("page-a")
+            start_run_state("page-b")
+            assert set(state.counters) == {"page-a", "page-b"}
+
+            start_run_state("page-b")
+
+            assert set(state.counters) == {"page-b"}
+            assert set(state.keys) == {"page-b"}
+            assert state.pruned_scripts == 1
+
+    def test_footprint_report(self):
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+
+            assert styler.get_footprint_report()["tracked_keys"] == 0
+
+            start_run_state(caller_hash)
+            key = apply_component_css("button", {"color": "#ff0000"})["key"]
+            mock_st.session_state[key] = False
+
+            footprint = styler.get_stats_report()["footprint"]
+
+        assert footprint["scripts"] == 1
+        assert footprint["tracked_keys"] == 1
+        assert footprint["bytes"] > 0
+        # The stats object and the widget state of the auto-generated key
+        assert footprint["session_state_entries"] == 2
+
+
+class TestCSSVariables:
+    """Test styling elements through CSS custom properties."""
+
+    def setup_method(self):
+        from st_yled.styler import StylerConfig
+
+        StylerConfig.configure(css_variables=True)
+
+    def teardown_method(self):
+        from st_yled.styler import StylerConfig
+
+        StylerConfig.configure(css_variables=False)
+
+    def test_element_only_sets_custom_properties(self):
+        with patch("st_yled.styler.st") as mock_st:
+            caller_hash = extract_caller_path_hash()
+            mock_st.session_state = {}
+            start_run_state(caller_hash)
+
+            kwargs = apply_component_css(
+                "button", {"label": "Go", "font_size": 14, "color": "#ff0000"}
+            )
+
+            key = kwargs["key"]
+            assert key == f"st-yler-v-button--color--font_size--{caller_hash}-0"
+            assert kwargs == {"label": "Go", "key": key}
+            mock_st.html.assert_called_once_with(
+                f"<style>.st-key-{key}{{--sty-button-font_size:14px;--sty-button-color:#ff0000}}</style>"
+            )
+
+    def test_user_key_keeps_own_rule(self):
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+
+            apply_component_css("button", {"color": "#ff0000", "key": "mine"})
+
+            css_call = mock_st.html.call_args[0][0]
+            assert ".st-key-mine " in css_call
+            assert "--sty-" not in css_call
+
+    def test_static_stylesheet_reads_every_property(self):
+        from st_yled import styler
+
+        stylesheet = styler.compile_variables_stylesheet(True)
+        properties = styler.load_style_index().properties
+
+        for component_type, prop in properties:
+            assert f"var(--sty-{component_type}-{prop})" in stylesheet
+        assert (
+            '[class*="st-key-st-yler-v-button--"][class*="--color--"] '
+            '.stButton:has(button[kind="secondary"])>button'
+            "{color:var(--sty-button-color)!important}"
+        ) in stylesheet
+
+    def test_init_emits_static_stylesheet(self):
+        import st_yled
+        from st_yled import styler
+
+        with patch("st_yled.styler.st") as mock_st:
+            mock_st.session_state = {}
+            with patch("st_yled.styler.load_user_css", return_value=None):
+                st_yled.init()
+
+        mock_st.html.assert_called_once_with(
+            f"<style>{styler.compile_variables_stylesheet(True)}</style>"
+        )
@@ -11,7 +11,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "st_yled"))
 
 from st_yled.validation import (
     CSSValidator, StyleValidator, ValidationError, ValidationWarning,
-    validate_styling_kwargs, ValidationConfig
+    validate_styling_kwargs, ValidationConfig, clear_validation_cache,
+    get_validation_cache_info, set_validation_cache_size, validate_styling_theme
 )
 
 
@@ -206,6 +207,85 @@ class TestStyleValidator:
         assert validated == kwargs
 
 
+class TestThemeValidation:
+    """Test batch validation of themes."""
+
+    def test_valid_theme_passes(self):
+        theme = {"button": {"color": "red"}, "title": {"font_size": 24}}
+
+        validated = validate_styling_theme(theme, strict=True)
+
+        assert validated == {"button": {"color": "red"}, "title": {"font_size": "24px"}}
+
+    def test_strict_reports_all_errors_at_once(self):
+        theme = {"button": {"color": "nope"}, "title": {"background_color": "#ggg"}}
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_styling_theme(theme, strict=True)
+
+        assert "Component 'button'" in str(exc_info.value)
+        assert "Component 'title'" in str(exc_info.value)
+
+    def test_non_strict_warns_once_and_removes_invalid(self):
+        theme = {"button": {"color": "nope"}, "title": {"color": "#ggg", "font_size": "12px"}}
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            validated = validate_styling_theme(theme, strict=False)
+
+        assert len(caught) == 1
+        assert validated == {"button": {}, "title": {"font_size": "12px"}}
+
+
+class TestValidationCache:
+    """Test caching of property validation results."""
+
+    def setup_method(self):
+        clear_validation_cache()
+
+    def test_repeated_validation_hits_cache(self):
+        first = StyleValidator.validate_property("color", "#FF0000")
+        second = StyleValidator.validate_property("color", "#FF0000")
+
+        assert first == second == (True, None)
+        info = get_validation_cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+
+    def test_invalid_results_are_cached(self):
+        first = StyleValidator.validate_property("font_size", "big")
+        second = StyleValidator.validate_property("font_size", "big")
+
+        assert first == second
+        assert first[0] is False
+        assert get_validation_cache_info()["hits"] == 1
+
+    def test_strict_mode_cached_separately(self):
+        lenient = StyleValidator.validate_property("unknown_prop", "x", strict=False)
+        strict = StyleValidator.validate_property("unknown_prop", "x", strict=True)
+
+        assert lenient == (True, None)
+        assert strict[1] is not None
+
+    def test_non_string_values_share_entry_with_string(self):
+        StyleValidator.validate_property("font_size", 14)
+        StyleValidator.validate_property("font_size", "14")
+
+        assert get_validation_cache_info()["hits"] == 1
+
+    def test_cache_size_is_bounded(self):
+        set_validation_cache_size(2)
+        try:
+            for size in ["1px", "2px", "3px"]:
+                StyleValidator.validate_property("font_size", size)
+
+            info = get_validation_cache_info()
+            assert info["size"] == 2
+            assert info["evictions"] == 1
+        finally:
+            set_validation_cache_size(4096)
+
+
 class TestValidationIntegration:
     """Test integration with main validation functions."""
 
@@ -254,32 +334,99 @@ class TestValidationConfig:
         """Test bypass detection from environment variables."""
         # Test bypass enabled
         with patch.dict(os.environ, {"ST_STYLED_BYPASS_VALIDATION": "true"}):
+            ValidationConfig.reload()
             assert ValidationConfig.is_validation_bypassed()
 
         with patch.dict(os.environ, {"ST_STYLED_BYPASS_VALIDATION": "1"}):
+            ValidationConfig.reload()
             assert ValidationConfig.is_validation_bypassed()
 
         # Test bypass disabled
         with patch.dict(os.environ, {"ST_STYLED_BYPASS_VALIDATION": "false"}):
+            ValidationConfig.reload()
             assert not ValidationConfig.is_validation_bypassed()
 
         with patch.dict(os.environ, {}, clear=True):
+            ValidationConfig.reload()
             assert not ValidationConfig.is_validation_bypassed()
 
     def test_strict_mode_environment_detection(self):
         """Test strict mode detection from environment variables."""
         # Test strict mode enabled
         with patch.dict(os.environ, {"ST_STYLED_STRICT_VALIDATION": "true"}):
+            ValidationConfig.reload()
             assert ValidationConfig.get_strict_mode()
 
         # Test strict mode disabled
         with patch.dict(os.environ, {"ST_STYLED_STRICT_VALIDATION": "false"}):
+            ValidationConfig.reload()
             assert not ValidationConfig.get_strict_mode()
 
         # Test default behavior
         with patch.dict(os.environ, {}, clear=True):
+            ValidationConfig.reload()
             assert ValidationConfig.get_strict_mode() == ValidationConfig.DEFAULT_STRICT_MODE
 
+        ValidationConfig.reload()
+
+    def test_settings_are_a_snapshot(self):
+        """Test that environment changes only apply after reload()."""
+        with patch.dict(os.environ, {}, clear=True):
+            ValidationConfig.reload()
+            with patch.dict(os.environ, {"ST_STYLED_STRICT_VALIDATION": "true"}):
+                assert not ValidationConfig.get_strict_mode()
+                ValidationConfig.reload()
+                assert ValidationConfig.get_strict_mode()
+
+        ValidationConfig.reload()
+
+    def test_configure_sets_global_settings(self):
+        """Test programmatic configuration."""
+        try:
+            settings = ValidationConfig.configure(strict=True)
+            assert settings.strict
+            assert ValidationConfig.get_strict_mode()
+
+            ValidationConfig.configure(bypass=True)
+            # Unspecified settings are kept
+            assert ValidationConfig.get_strict_mode()
+            assert ValidationConfig.is_validation_bypassed()
+        finally:
+            ValidationConfig.reload()
+
+    def test_settings_are_immutable(self):
+        """Test that the settings snapshot cannot be modified in place."""
+        settings = ValidationConfig.get_settings()
+        with pytest.raises(AttributeError):
+            settings.strict = True
+
+    def test_session_configure_requires_session(self):
+        """Test that per-session settings need a Streamlit session."""
+        with pytest.raises(RuntimeError, match="running Streamlit session"):
+            ValidationConfig.configure(strict=True, session=True)
+
+    def test_session_override(self):
+        """Test that per-session settings override the global settings."""
+        session_a, session_b = {}, {}
+        with patch("st_yled.validation._get_session_state", return_value=session_a):
+            ValidationConfig.configure(strict=True, session=True)
+            assert ValidationConfig.get_strict_mode()
+
+        with patch("st_yled.validation._get_session_state", return_value=session_b):
+            assert not ValidationConfig.get_strict_mode()
+
+        with patch("st_yled.validation._get_session_state", return_value=session_a):
+            ValidationConfig.reset_session()
+            assert not ValidationConfig.get_strict_mode()
+
+    def test_session_override_lives_in_session_state(self):
+        """Test that the override is dropped together with the session."""
+        session_state = {}
+        with patch("st_yled.validation._get_session_state", return_value=session_state):
+            settings = ValidationConfig.configure(bypass=True, session=True)
+
+        assert session_state == {ValidationConfig.SESSION_SETTINGS_KEY: settings}
+
 
 class TestValidationErrorHandling:
     """Test error handling and edge cases."""